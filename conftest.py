@@ -1,14 +1,29 @@
 import pytest
 import os
 import asyncio
+import logging
 import allure
-from playwright.async_api import async_playwright
 from utils.browser_config import Config, ContextManager
+from utils.locust_runner import run_marked_load, skip_performance_tests
+from utils import (
+    dom_cache, engines, http_cache, impact, network_audit, scheduling, shared_cache, throttling,
+    trace_recorder, visual_regression, web_vitals
+)
 from utils.pytest_config import (
     pytest_generate_tests_handler as generate_tests_handler,
     configure_environment,
-    add_pytest_options
+    add_pytest_options,
+    use_session_event_loop
+)
+from utils.device_matrix import DeviceMatrix
+from utils.playwright_driver import (
+    DriverSession,
+    close_contexts,
+    close_leftovers,
+    terminal_line as driver_summary_line,
+    write_run_summary as write_driver_summary
 )
+from utils.shared_page import FreshPage, ResettablePages, SharedPage, page_used, remember_dirty, wants_shared_page
 
 
 def pytest_addoption(parser):
@@ -19,6 +34,12 @@ def pytest_addoption(parser):
 def pytest_configure(config):
     """Configure environment from CLI options."""
     configure_environment(config)
+    scheduling.register(config)
+    engines.requested(config)  # validates --engines
+
+
+def pytest_report_collectionfinish(config, start_path, items):
+    return impact.report_lines(config)
 
 
 def pytest_generate_tests(metafunc):
@@ -26,21 +47,66 @@ def pytest_generate_tests(metafunc):
     generate_tests_handler(metafunc)
 
 
-@pytest.fixture(scope="function")
-async def playwright():
-    """Function-scoped playwright instance for worker safety."""
-    async with async_playwright() as playwright:
-        yield playwright
+def pytest_collection_modifyitems(config, items):
+    """Keep tests impacted by --impacted-by, then this machine's --shard, and skip
+    performance tests unless --performance is given and throttled tests outside Chromium."""
+    use_session_event_loop(items)
+    impact.select_impacted(config, items)
+    scheduling.select_shard(config, items)
+    skip_performance_tests(config, items)
+    throttling.skip_unthrottled_tests(items)
+    engines.warn_unused(config, items)
+
+
+@pytest.fixture(scope="session")
+async def playwright_driver(request):
+    """The worker's Playwright driver, started once in the session event loop."""
+    driver = DriverSession()
+    await driver.start()
+    yield driver
+    await driver.stop()
+    worker = getattr(request.config, "workerinput", {}).get("workerid", "main")
+    request.config._driver_stats.append(driver.stats(worker))
 
 
 @pytest.fixture(scope="function")
-async def runner(playwright):
-    """Function-scoped runner instance for parallel execution safety."""
+async def playwright(playwright_driver):
+    """The worker's shared playwright instance; browsers and contexts stay per test."""
+    playwright_driver.tests += 1
+    yield playwright_driver.playwright
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """The test's engine under --engines, which parametrizes it (see
+    pytest_generate_tests); None runs the test in the BROWSER engine."""
+    return None
+
+
+async def _open_runner(playwright, engine, engine_pool) -> Config:
+    """A runner with a browser of its own, or on the worker's engine pool browser."""
+    if engine:
+        return await engine_pool.runner(engine)
     runner_instance = Config()
     await runner_instance.setup_browser(playwright)
+    return runner_instance
+
+
+async def _close_runner(runner_instance, engine, opened=()) -> None:
+    """Close the runner's browser, or only the contexts it opened in a pool browser."""
+    if engine:
+        await close_contexts(runner_instance.browser, keep=opened)
+    else:
+        await close_leftovers(runner_instance.browser)
+
+
+@pytest.fixture(scope="function")
+async def runner(playwright, engine, engine_pool):
+    """Function-scoped runner instance for parallel execution safety."""
+    runner_instance = await _open_runner(playwright, engine, engine_pool)
+    opened = set(runner_instance.browser.contexts)
     yield runner_instance
-    if runner_instance.browser:
-        await runner_instance.browser.close()
+    await _close_runner(runner_instance, engine, opened)
 
 
 @pytest.fixture(scope="function")
@@ -55,7 +121,11 @@ async def context(runner, request):
     context_manager = ContextManager(runner)
     
     context, _ = await context_manager.create_context(request)
+    network_audit.attach(context)
+    await http_cache.attach(context)
+    recorder = await trace_recorder.start_for(context, request)
     yield context
+    await trace_recorder.finish_for(recorder, request)
     await context_manager.cleanup_context(context)
 
 
@@ -68,6 +138,119 @@ async def page(context, runner):
     await context_manager.cleanup_page(page)
 
 
+@pytest.fixture(scope="class")
+async def shared_pages(playwright_driver, engine, engine_pool, request):
+    """Class-scoped browser and context holding the page shared by readonly tests."""
+    runner_instance = await _open_runner(playwright_driver.playwright, engine, engine_pool)
+    opened = set(runner_instance.browser.contexts)
+    context_manager = ContextManager(runner_instance)
+    shared = SharedPage(context_manager, await _shared_context(context_manager, request))
+    yield shared
+    await shared.close()
+    await _close_runner(runner_instance, engine, opened)
+
+
+async def _shared_context(context_manager, request):
+    """A context outliving one test, with the network audit and HTTP cache of ``context``."""
+    context, _ = await context_manager.create_context(request)
+    network_audit.attach(context)
+    await http_cache.attach(context)
+    return context
+
+
+@pytest.fixture(scope="session")
+async def resettable_pages(playwright_driver):
+    """Worker-wide browser keeping one loaded page object per platform and page class,
+    reset in place between tests (see ``ResettablePages``)."""
+    runner_instance = Config()
+    await runner_instance.setup_browser(playwright_driver.playwright)
+    pages = ResettablePages(ContextManager(runner_instance), _shared_context)
+    yield pages
+    await pages.close()
+    await close_leftovers(runner_instance.browser)
+
+
+@pytest.fixture()
+async def readonly_page(shared_pages, request):
+    """The class's shared page for one readonly test (traced on its own with
+    --trace-on-failure); checked for changes afterwards."""
+    recorder = await trace_recorder.start_for(shared_pages.context, request)
+    yield shared_pages
+    await trace_recorder.finish_for(recorder, request)
+    changes = await shared_pages.check()
+    if changes:
+        logging.warning(f"Readonly test {request.node.nodeid} changed the shared page: {'; '.join(changes)}")
+        remember_dirty(request.config, request.node.nodeid)
+
+
+@pytest.fixture(scope="session")
+async def static_runner():
+    """Worker-wide runner for the static DOM contexts; static_dom launches its browser
+    on the first static_content test instead of once per test."""
+    runner_instance = Config()
+    yield runner_instance
+    await close_leftovers(runner_instance.browser)
+
+
+@pytest.fixture()
+async def static_dom(playwright_driver, static_runner, engine, engine_pool, request):
+    """Page objects on the cached rendered DOM of their live page (see utils/dom_cache.py),
+    in contexts of the worker's static_runner browser (the engine pool's under --engines),
+    closed after the test."""
+    if engine:
+        browser_runner = await engine_pool.runner(engine)
+    else:
+        if static_runner.browser is None:
+            await static_runner.setup_browser(playwright_driver.playwright)
+        browser_runner = static_runner
+    platform = ContextManager(browser_runner)._extract_platform_from_request(request)
+    os.environ["platform"] = platform
+    static = dom_cache.StaticDom(browser_runner, platform)
+    yield static
+    await static.close()
+
+
+@pytest.fixture(scope="session")
+async def engine_pool(playwright_driver, request):
+    """Browsers of every --engines engine, launched concurrently once per worker;
+    empty without --engines."""
+    pool = engines.EnginePool(playwright_driver.playwright, engines.requested(request.config))
+    yield pool
+    await pool.close()
+
+
+@pytest.fixture()
+def device_matrix(request):
+    """Runs a test body on each engine (--engines) and device (devices marker) of the
+    test, concurrently; without --engines, in the test's own browser."""
+    if engines.requested(request.config):
+        pool = request.getfixturevalue("engine_pool")
+        return DeviceMatrix(pool.config, request.node, pool)
+    return DeviceMatrix(request.getfixturevalue("runner"), request.node)
+
+
+@pytest.fixture()
+def shared_page(engine, request):
+    """Page to ``open(PageClass)`` page objects on: with --static-dom, the cached DOM for
+    tests marked static_content; the class's shared page for tests marked readonly; or
+    the test's own page. Readonly tests seen navigating or interacting get their own
+    page from the next run on (pytest cache; reset with --cache-clear)."""
+    if dom_cache.enabled(request.node):
+        return request.getfixturevalue("static_dom")
+    if wants_shared_page(request.node):
+        return request.getfixturevalue("readonly_page")
+    return FreshPage(request.getfixturevalue("page"))
+
+
+@pytest.fixture()
+def visual(request):
+    """Screenshot comparisons against visual_baselines/ (see utils/visual_regression.py);
+    the test is skipped without --visual or --update-baselines."""
+    if not visual_regression.enabled():
+        pytest.skip("visual comparison needs --visual (or --update-baselines)")
+    return visual_regression.VisualCheck(request.node)
+
+
 @pytest.fixture()
 async def user_auth(runner):
     page_instance = await runner.setup_auth_page("user")
@@ -107,17 +290,107 @@ async def api_request(playwright):
             await context.dispose()
 
 
+@pytest.fixture()
+def locust_result(request):
+    """Run the Locust load declared by the test's performance marker."""
+    return run_marked_load(request)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item):
+    """Drop metrics left over from an earlier test, before fixtures open pages."""
+    web_vitals.take_records()
+    network_audit.take_records()
+    return (yield)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Report the web vitals and network audits recorded during the test; fail it on
+    budget breaches in enforce mode."""
+    try:
+        result = yield
+    except BaseException:
+        web_vitals.report_test(item)
+        network_audit.report_test(item)
+        raise
+
+    vitals = web_vitals.report_test(item)
+    audit = network_audit.report_test(item)
+    violations = []
+    if vitals and web_vitals.mode() == "enforce":
+        violations += [f"web vitals: {v}" for v in vitals]
+    if audit and network_audit.mode() == "enforce":
+        violations += [f"network: {v}" for v in audit]
+    if violations:
+        pytest.fail("Over budget:\n" + "\n".join(violations))
+    return result
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Longest-processing-time-first scheduling with --lpt-schedule; xdist's default otherwise."""
+    return scheduling.make_scheduler(config, log)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the web vitals, network audits, tracing overhead, driver timings, HTTP cache
+    and visual comparison stats recorded by an xdist worker into the run summary."""
+    node.config._web_vitals_records.extend(node.workeroutput.get("web_vitals", []))
+    node.config._network_audit_records.extend(node.workeroutput.get("network_audit", []))
+    node.config._trace_overhead.extend(node.workeroutput.get("trace_overhead", []))
+    node.config._driver_stats.extend(node.workeroutput.get("playwright_driver", []))
+    http_cache.merge(node.config._http_cache_stats, node.workeroutput.get("http_cache", {}))
+    visual_regression.merge(node.config._visual_stats, node.workeroutput.get("visual", {}))
+    node.config._impact_empty = node.workeroutput.get("impact_empty", False)
+    node.config._shared_cache_dirs.append(node.workeroutput.get("shared_cache_dir"))
+
+
+def pytest_sessionfinish(session):
+    impact.allow_empty_selection(session)
+    visual_regression.shutdown()
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["web_vitals"] = session.config._web_vitals_records
+        session.config.workeroutput["network_audit"] = session.config._network_audit_records
+        session.config.workeroutput["trace_overhead"] = session.config._trace_overhead
+        session.config.workeroutput["playwright_driver"] = session.config._driver_stats
+        session.config.workeroutput["http_cache"] = http_cache.take_stats()
+        session.config.workeroutput["visual"] = visual_regression.take_stats()
+        session.config.workeroutput["impact_empty"] = getattr(session.config, "_impact_empty", False)
+        session.config.workeroutput["shared_cache_dir"] = shared_cache.release()
+    else:
+        http_cache.merge(session.config._http_cache_stats, http_cache.take_stats())
+        visual_regression.merge(session.config._visual_stats, visual_regression.take_stats())
+        web_vitals.write_run_summary(session.config)
+        network_audit.write_run_summary(session.config)
+        trace_recorder.write_run_summary(session.config)
+        write_driver_summary(session.config)
+        http_cache.write_run_summary(session.config)
+        visual_regression.write_run_summary(session.config)
+        shared_cache.remove_runs([*session.config._shared_cache_dirs, shared_cache.release()])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for line in (driver_summary_line(config), http_cache.terminal_line(config), visual_regression.terminal_line(config)):
+        if line:
+            terminalreporter.write_line(line)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+    if rep.when == "setup":
+        item.rep_call = None  # don't let a rerun see the previous attempt's call report
 
     if rep.when == "call":  # if rep.when == "call" and rep.failed: # config on fail only
         screenshot_path = os.path.join("reports/screenshots", f"{item.name}.png")
         os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
 
         try:
-            page = item.funcargs.get('page') or item.funcargs.get('auth_page')
+            page = page_used(item)
             if page:
                 loop = asyncio.get_event_loop()
                 loop.run_until_complete(page.screenshot(path=screenshot_path, full_page=True))
@@ -7,10 +7,15 @@ from utils.api_config import api_config
 
 
 class BaseService:
-    def __init__(self, request_context: APIRequestContext):
-        """Initialize the API client with a Playwright request context."""
+    def __init__(self, request_context: APIRequestContext, attach_details: bool = True):
+        """Initialize the API client with a Playwright request context.
+
+        Set ``attach_details`` to False for high-volume callers such as load
+        generators, where per-request Allure attachments would dominate the cost.
+        """
         self.request = request_context
         self.base_url = api_config.base_url
+        self.attach_details = attach_details
 
     async def get(
         self,
@@ -74,7 +79,8 @@ class BaseService:
         allure.step(f"{method} {url}")
 
         # Attach request details for better debugging
-        await self._attach_request_details(method, url, kwargs)
+        if self.attach_details:
+            await self._attach_request_details(method, url, kwargs)
 
         # Make the request using Playwright's built-in methods
         if method == "GET":
@@ -91,7 +97,8 @@ class BaseService:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
         # Attach response details for better reporting
-        await self._attach_response_details(response)
+        if self.attach_details:
+            await self._attach_response_details(response)
 
         return response
 
@@ -1,8 +1,19 @@
 import json
 import time
-from typing import Dict, List, Optional, Tuple
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple, Union
 from playwright.async_api import APIResponse
 from sources.api.__base import BaseService
+from utils.api_snapshot import (
+    SnapshotDiff,
+    build_snapshot,
+    diff_snapshots,
+    item_key,
+    load_snapshot,
+    save_snapshot,
+)
+from utils.api_config import api_config
+from utils.shared_cache import CachedResponse, SharedPayload, get_shared_payload
 
 
 class HomeClient:
@@ -13,6 +24,10 @@ class HomeClient:
         self.endpoint = "open_api/boxes"
         self._required_fields = {"name", "status", "location"}
         self._required_location_fields = {"latitude", "longitude"}
+        self._snapshot_key = "id"
+        # Keyed by the full URL, so runs against other API_URL hosts keep their own baseline
+        url_hash = hashlib.sha1(api_config.get_url(self.endpoint).encode("utf-8")).hexdigest()[:12]
+        self._snapshot_name = f"boxes-{url_hash}"
     
     async def get_noovo_list(self) -> APIResponse:
         """Get list of noovo items."""
@@ -42,7 +57,7 @@ class HomeClient:
         response, data, _ = await self.get_parsed_response()
         validation_errors = []
         
-        if not data:
+        if data is None:
             validation_errors.append("Failed to parse response as JSON")
             return response, [], validation_errors
         
@@ -50,8 +65,34 @@ class HomeClient:
             validation_errors.append(f"Expected list response, got {type(data)}")
             return response, [], validation_errors
         
+        if not data:
+            validation_errors.append("Expected a non-empty list, got an empty one")
+        
         return response, data, validation_errors
     
+    async def _fetch_shareable_list(self) -> Optional[Tuple[List[Any], Dict[str, Any]]]:
+        response, data, _ = await self.get_parsed_response()
+        if not response.ok or not isinstance(data, list) or not data:
+            return None  # get_validated_data reports what is wrong with it
+        meta = {"status": response.status, "url": response.url, "headers": dict(response.headers)}
+        return data, meta
+    
+    async def get_shared_data(
+        self,
+    ) -> Tuple[Union[APIResponse, CachedResponse], Union[SharedPayload, List[Dict]], List[str]]:
+        """Get noovo data through the cross-worker cache.
+        
+        The first xdist worker of a run fetches the list and stores it memory-mapped;
+        the others decode items from that file on access instead of requesting it
+        again. Falls back to ``get_validated_data`` when the response can't be shared.
+        """
+        payload = await get_shared_payload(
+            api_config.get_url(self.endpoint), self._fetch_shareable_list
+        )
+        if payload is None:
+            return await self.get_validated_data()
+        return payload.response, payload, []
+    
     async def get_first_item(self) -> Tuple[APIResponse, Optional[Dict]]:
         """Get first noovo item from the list."""
         response, data, _ = await self.get_parsed_response()
@@ -123,6 +164,58 @@ class HomeClient:
         
         return errors
     
+    def validate_item_deep(self, item: Dict) -> List[str]:
+        """Full per-item validation: structure plus coordinate ranges."""
+        errors = self.validate_item_structure(item)
+        latitude, longitude, coord_errors = self.extract_coordinates(item)
+        if not coord_errors:
+            errors.extend(self.validate_coordinates(latitude, longitude))
+        return errors
+    
+    def validate_list_integrity(self, data: List[Dict]) -> List[str]:
+        """Cheap full-list check: every item is an object with a unique id."""
+        errors = []
+        seen_ids = set()
+        for i, item in enumerate(data):
+            if not isinstance(item, dict):
+                errors.append(f"Item {i} should be dict, got {type(item)}")
+                continue
+            item_id = item.get(self._snapshot_key)
+            if item_id is None:
+                errors.append(f"Item {i} has no '{self._snapshot_key}' field")
+            elif item_id in seen_ids:
+                errors.append(f"Duplicate {self._snapshot_key} {item_id!r} at item {i}")
+            seen_ids.add(item_id)
+        return errors
+    
+    async def get_snapshot_diff(
+        self,
+    ) -> Tuple[Union[APIResponse, CachedResponse], List[Dict], List[str], SnapshotDiff, Optional[Dict]]:
+        """Get noovo data and diff it against the snapshot persisted by the previous run.
+        
+        The list comes from ``get_shared_data``, so this sends no request of its own when
+        another worker already fetched it. Returns its validation errors and the new
+        snapshot as well; persist it with ``save_snapshot`` once the delta has been
+        validated, so failing items stay in the delta next run. An invalid body gives no
+        snapshot.
+        """
+        response, shared, validation_errors = await self.get_shared_data()
+        data = list(shared)  # decode each shared item once
+        snapshot = build_snapshot(data, self._snapshot_key)
+        diff = diff_snapshots(load_snapshot(self._snapshot_name), snapshot)
+        return response, data, validation_errors, diff, None if validation_errors else snapshot
+    
+    def select_delta_items(self, data: List[Dict], diff: SnapshotDiff) -> List[Dict]:
+        """Items added or changed since the previous snapshot."""
+        delta_keys = diff.delta_keys
+        return [item for item in data if item_key(item, self._snapshot_key) in delta_keys]
+    
+    def save_snapshot(self, snapshot: Optional[Dict]) -> str:
+        """Persist snapshot as the baseline for the next run."""
+        if snapshot is None:
+            raise ValueError("Refusing to save the snapshot of an invalid response as the baseline")
+        return save_snapshot(self._snapshot_name, snapshot)
+    
     async def execute_workflow(self) -> Tuple[APIResponse, Optional[Dict], APIResponse]:
         """Execute workflow: get list, then get first item details."""
         list_response, data, _ = await self.get_parsed_response()
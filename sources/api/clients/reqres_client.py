@@ -9,6 +9,8 @@ class ReqresClient:
         self.request = request_context
         self.base_url = "https://reqres.in/api"
         self.headers = {"x-api-key": "reqres-free-v1"}
+        self._user_fields = {"id", "email", "first_name", "last_name", "avatar"}
+        self._resource_fields = {"id", "name", "year", "color", "pantone_value"}
 
     async def get_users(self, page: int = 1) -> APIResponse:
         """Get list of users."""
@@ -65,3 +67,23 @@ class ReqresClient:
         return await self.request.post(
             f"{self.base_url}/register", data=data, headers=self.headers
         )
+
+    def validate_user(self, user: Dict) -> List[str]:
+        """Validate user structure and return errors."""
+        missing_fields = self._user_fields - set(user.keys())
+        return [f"Missing user fields: {missing_fields}"] if missing_fields else []
+
+    def validate_resource(self, resource: Dict) -> List[str]:
+        """Validate resource structure and return errors."""
+        missing_fields = self._resource_fields - set(resource.keys())
+        return [f"Missing resource fields: {missing_fields}"] if missing_fields else []
+
+    @property
+    def user_fields(self) -> set:
+        """Get required fields for users."""
+        return self._user_fields
+
+    @property
+    def resource_fields(self) -> set:
+        """Get required fields for resources."""
+        return self._resource_fields
@@ -0,0 +1,36 @@
+from typing import Any, Dict
+from playwright.async_api import Page
+from utils import element_state, network_audit, throttling, web_vitals
+
+
+class BasePage:
+    """Common navigation for page objects.
+
+    ``page_name`` identifies the page in web vitals and network audit records and budgets;
+    ``url`` is where ``open()`` goes by default.
+    """
+
+    page_name = "page"
+    url = ""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def _navigate(self, url: str):
+        """Go to ``url`` and wait for the load event, with web vitals observers installed
+        and a network audit window opened first."""
+        await throttling.ready(self.page)
+        await web_vitals.install(self.page)
+        network_audit.begin(self.page)
+        await self.page.goto(url)
+        await self.page.wait_for_load_state("load")
+
+    async def record_metrics(self):
+        """Collect web vitals and the network audit of the open (no-op when both are off)."""
+        await web_vitals.collect(self.page, self.page_name)
+        await network_audit.collect(self.page, self.page_name)
+
+    async def snapshot(self, *names: str, attributes=()) -> Dict[str, Dict[str, Any]]:
+        """Visibility, enabled state, text and ``attributes`` of the named locators,
+        read in one batch (see ``utils.element_state``)."""
+        return await element_state.snapshot({name: getattr(self, name) for name in names}, attributes)
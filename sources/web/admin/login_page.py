@@ -1,10 +1,24 @@
 from playwright.async_api import Page, expect
 from typing import Optional
+from sources.web.__base import BasePage
+from utils import element_state
 import re
+import time
+import asyncio
+import logging
+
+# A native form reset also clears the validation state of forms that handle "reset".
+RESET_FORM_SCRIPT = """() => {
+    document.activeElement?.blur();
+    document.querySelectorAll("form").forEach(form => form.reset());
+}"""
+
+class LoginPage(BasePage):
+    page_name = "login"
+    url = "https://manage-dev.noovoleum.com/login"
 
-class LoginPage:
     def __init__(self, page: Page):
-        self.page = page
+        super().__init__(page)
         
         # Header elements
         self.logo = page.get_by_role('img', name='logo', exact=True)
@@ -29,9 +43,9 @@ class LoginPage:
         
         self.login_button = page.get_by_role("button", name="Log In")
 
-    async def open(self, base_url: str = "https://manage-dev.noovoleum.com/login"):
-        await self.page.goto(base_url)
-        await self.page.wait_for_load_state("load")
+    async def open(self, base_url: Optional[str] = None):
+        await self._navigate(base_url or self.url)
+        await self.record_metrics()
         return self
 
     async def fill_email(self, email: str):
@@ -58,4 +72,50 @@ class LoginPage:
 
     async def login(self, email: str, password: str, tfa_code: Optional[str] = None):
         await self.fill_credentials(email, password, tfa_code)
-        await self.click_login()
\ No newline at end of file
+        await self.click_login()
+
+    async def is_pristine(self) -> bool:
+        """Still on the login page with empty fields, a masked password and no
+        validation message."""
+        if not self.page.url.startswith(self.url):
+            return False
+        inputs = (self.email_input, self.password_input, self.tfa_input)
+        values = await asyncio.gather(*(field.input_value() for field in inputs))
+        states = await self.snapshot(
+            "password_input", "email_empty_err", "email_invalid_err",
+            "password_empty_err", "password_invalid_err", "tfa_invalid_err",
+            attributes=["type"],
+        )
+        password = states.pop("password_input")
+        return (
+            not any(values)
+            and password["attributes"].get("type") == "password"
+            and not any(state["count"] and state["visible"] for state in states.values())
+        )
+
+    async def reset(self, timeout: float = 1000) -> bool:
+        """Clear all fields and validation messages in place, for the next case on the
+        same loaded page. Reloads the page when the clean state cannot be verified
+        within ``timeout`` ms.
+
+        Returns whether the in-place reset was enough.
+        """
+        if self.page.url.startswith(self.url):
+            try:
+                for field in (self.email_input, self.password_input, self.tfa_input):
+                    await field.fill("", timeout=timeout)
+                if await self.password_input.get_attribute("type") != "password":
+                    await self.toggle_password_visibility()
+                await self.page.evaluate(RESET_FORM_SCRIPT)
+                deadline = time.monotonic() + timeout / 1000
+                intervals = iter(element_state.POLL_INTERVALS_MS)
+                while not await self.is_pristine():
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"form not clean after {timeout} ms")
+                    await asyncio.sleep(next(intervals, element_state.POLL_INTERVALS_MS[-1]) / 1000)
+                return True
+            except Exception as e:
+                logging.debug(f"Login page: in-place reset not verified: {e}")
+        logging.info(f"Login page: reset not verified on {self.page.url}, reloading")
+        await self.open()
+        return False
\ No newline at end of file
@@ -1,9 +1,14 @@
 from playwright.async_api import Page, expect
+from typing import Optional
+from sources.web.__base import BasePage
 import re
 
-class HomePage:
+class HomePage(BasePage):
+    page_name = "home"
+    url = "https://noovoleum.com"
+
     def __init__(self, page: Page):
-        self.page = page
+        super().__init__(page)
         
         # Loader element
         self.preloader = page.locator(".preloader")
@@ -73,10 +78,10 @@ class HomePage:
             except Exception:
                 pass
 
-    async def open(self, base_url: str = "https://noovoleum.com"):
-        await self.page.goto(base_url)
-        await self.page.wait_for_load_state("load")
+    async def open(self, base_url: Optional[str] = None):
+        await self._navigate(base_url or self.url)
         await self._wait_preloader_gone()
+        await self.record_metrics()
         await self._disable_animations_and_reveal()
 
         return self
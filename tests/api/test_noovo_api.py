@@ -1,3 +1,4 @@
+import json
 import pytest
 import allure
 from playwright.async_api import APIRequestContext
@@ -83,34 +84,6 @@ class TestNoovoAPI:
                 not response.ok
             ), "Response should not be successful for non-existent item"
 
-    @allure.title("Noovo coordinate validation")
-    @allure.story("Data Validation")
-    @allure.severity(allure.severity_level.NORMAL)
-    async def test_coordinates_validation(self, noovo_api: HomeClient):
-        with step("Get noovo data for coordinate validation"):
-            response, noovo_data, validation_errors = (
-                await noovo_api.get_validated_data()
-            )
-
-        with step("Validate response and data structure"):
-            self._assert_response_ok(response)
-            assert (
-                not validation_errors
-            ), f"Structure validation errors: {validation_errors}"
-            assert isinstance(noovo_data, list), "Response should be a list"
-
-        with step("Validate coordinates for all items"):
-            for i, item in enumerate(noovo_data):
-                latitude, longitude, coord_errors = noovo_api.extract_coordinates(item)
-
-                if not coord_errors:
-                    coord_validation_errors = noovo_api.validate_coordinates(
-                        latitude, longitude
-                    )
-                    assert (
-                        not coord_validation_errors
-                    ), f"Item {i} coordinate validation errors: {coord_validation_errors}"
-
     @allure.title("API response time validation")
     @allure.story("Performance")
     @allure.severity(allure.severity_level.MINOR)
@@ -175,22 +148,28 @@ class TestNoovoAPI:
                     list_response.status == 200
                 ), "List response should be successful even if empty"
 
-    @allure.title("All noovo structure validation")
+    @allure.title("Differential noovo validation against previous snapshot")
     @allure.story("Structure Validation")
     @allure.severity(allure.severity_level.NORMAL)
-    async def test_all_noovo_structure(self, noovo_api: HomeClient):
-        with step("Get validated data"):
-            response, noovo_data, validation_errors = (
-                await noovo_api.get_validated_data()
+    async def test_noovo_delta_validation(self, noovo_api: HomeClient):
+        with step("Get noovo data and diff against previous snapshot"):
+            response, noovo_data, validation_errors, diff, snapshot = await noovo_api.get_snapshot_diff()
+            allure.attach(
+                json.dumps(diff.to_dict(), indent=2),
+                "Snapshot Diff",
+                allure.attachment_type.JSON,
             )
 
-        with step("Validate response and data structure"):
+        with step("Validate response and full list integrity"):
             self._assert_response_ok(response)
-            assert (
-                not validation_errors
-            ), f"Structure validation errors: {validation_errors}"
-            assert isinstance(noovo_data, list), "Response should be a list"
+            assert not validation_errors, f"Structure validation errors: {validation_errors}"
+            integrity_errors = noovo_api.validate_list_integrity(noovo_data)
+            assert not integrity_errors, f"List integrity errors: {integrity_errors}"
+
+        with step(f"Deep validate structure and coordinates of {len(diff.delta_keys)} added/changed items"):
+            for item in noovo_api.select_delta_items(noovo_data, diff):
+                errors = noovo_api.validate_item_deep(item)
+                assert not errors, f"Item {item.get('id')} validation errors: {errors}"
 
-        with step("Validate all items structure"):
-            for i, item in enumerate(noovo_data):
-                self._validate_item_structure(noovo_api, item, i)
+        with step("Persist snapshot for the next run"):
+            noovo_api.save_snapshot(snapshot)
@@ -34,10 +34,8 @@ class TestReqresAPI:
 
         with step("Validate user data fields"):
             first_user = data["data"][0]
-            assert "id" in first_user
-            assert "email" in first_user
-            assert "first_name" in first_user
-            assert "last_name" in first_user
+            errors = reqres_api.validate_user(first_user)
+            assert not errors, f"User validation errors: {errors}"
 
     @allure.title("Get single user")
     @allure.story("Users")
@@ -57,10 +55,8 @@ class TestReqresAPI:
         with step("Validate user data integrity"):
             user = data["data"]
             assert user["id"] == 2
-            assert "email" in user
-        assert "first_name" in user
-        assert "last_name" in user
-        assert "avatar" in user
+            errors = reqres_api.validate_user(user)
+            assert not errors, f"User validation errors: {errors}"
 
     @allure.title("Create user")
     @allure.story("Users")
@@ -127,10 +123,8 @@ class TestReqresAPI:
 
         with step("Validate resource data fields"):
             first_resource = data["data"][0]
-            assert "id" in first_resource
-            assert "name" in first_resource
-            assert "year" in first_resource
-            assert "color" in first_resource
+            errors = reqres_api.validate_resource(first_resource)
+            assert not errors, f"Resource validation errors: {errors}"
 
     @allure.title("Get single resource")
     @allure.story("Resources")
@@ -150,10 +144,8 @@ class TestReqresAPI:
         with step("Validate resource data integrity"):
             resource = data["data"]
             assert resource["id"] == 2
-            assert "name" in resource
-            assert "year" in resource
-            assert "color" in resource
-            assert "pantone_value" in resource
+            errors = reqres_api.validate_resource(resource)
+            assert not errors, f"Resource validation errors: {errors}"
 
     @allure.title("User login")
     @allure.story("Authentication")
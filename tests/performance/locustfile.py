@@ -1,14 +1,190 @@
-from locust import HttpUser, task, between
+import sys
+import random
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, List
 
+from dotenv import load_dotenv
+from locust import FastHttpUser, between, constant, events, task
 
-class WebApiUser(HttpUser):
-    wait_time = between(1, 3)
+project_root = str(Path(__file__).parent.parent.parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sources.api.clients.noovo_home_client import HomeClient  # noqa: E402
+from sources.api.clients.reqres_client import ReqresClient  # noqa: E402
+from utils.api_config import api_config  # noqa: E402
+from utils import load_shapes, slo_monitor  # noqa: E402, F401 - registers CLI options and the SLO monitor
+from utils.locust_adapter import LocustRequestContext, LocustResponse, LocustService, run_sync  # noqa: E402
+from utils.token_pool import REFRESH_MARGIN, TokenPool  # noqa: E402
+
+load_dotenv()
+TOKEN_POOL = TokenPool()
+
+THINK_TIME_PROFILES = {
+    "none": constant(0),
+    "fast": between(0.2, 1),
+    "default": between(1, 3),
+    "browsing": between(3, 8),
+}
+DEFAULT_VALIDATION_RATE = 0.1
+
+
+@events.init_command_line_parser.add_listener
+def _add_scenario_options(parser):
+    parser.add_argument(
+        "--think-time",
+        choices=sorted(THINK_TIME_PROFILES),
+        default="default",
+        help="Think-time profile between tasks",
+    )
+    parser.add_argument(
+        "--validation-rate",
+        type=float,
+        default=DEFAULT_VALIDATION_RATE,
+        help="Share of responses validated against the API client schemas (0-1)",
+    )
+
+
+class ScenarioUser(FastHttpUser):
+    abstract = True
+
+    def wait_time(self):
+        profile = getattr(self.environment.parsed_options, "think_time", "default")
+        return THINK_TIME_PROFILES[profile](self)
+
+    def sampled(self, check: Callable[[LocustResponse], List[str]]):
+        """Validate the next responses with ``check`` for a sample of task runs."""
+        rate = getattr(self.environment.parsed_options, "validation_rate", DEFAULT_VALIDATION_RATE)
+        return self.rest.validated(check) if random.random() < rate else nullcontext()
+
+    def on_start(self):
+        self.rest = LocustRequestContext(self.client)
+
+
+class NoovoApiUser(ScenarioUser):
+    """Boxes list and box details, through the same ``HomeClient`` as tests/api."""
+
+    host = api_config.base_url
+    weight = 3
+
+    def on_start(self):
+        super().on_start()
+        self.home = HomeClient(LocustService(self.rest))
+        self.box_ids = []
+        with self.rest.validated(self._check_boxes):
+            run_sync(self.home.get_noovo_list())
+
+    def _check_boxes(self, response: LocustResponse) -> List[str]:
+        data = run_sync(response.json())
+        if not isinstance(data, list):
+            return [f"Expected list response, got {type(data)}"]
+
+        self.box_ids = [item["id"] for item in data if isinstance(item, dict) and "id" in item]
+        errors = self.home.validate_list_integrity(data)
+        for item in random.sample(data, min(5, len(data))):
+            errors.extend(self.home.validate_item_structure(item))
+        return errors
+
+    def _check_box_detail(self, response: LocustResponse) -> List[str]:
+        data = run_sync(response.json())
+        if not isinstance(data, dict):
+            return [f"Expected object response, got {type(data)}"]
+        return self.home.validate_item_deep(data)
+
+    @task(5)
+    def boxes_list(self):
+        with self.sampled(self._check_boxes):
+            run_sync(self.home.get_noovo_list())
+
+    @task(3)
+    def box_details(self):
+        if not self.box_ids:
+            return
+        with self.rest.named(f"{self.home.endpoint}/[id]"), self.sampled(self._check_box_detail):
+            run_sync(self.home.get_noovo_by_id(random.choice(self.box_ids)))
+
+
+class ReqresUser(ScenarioUser):
+    """reqres.in user flows, through the same ``ReqresClient`` as tests/api."""
+
+    host = "https://reqres.in"
+    weight = 1
+
+    def on_start(self):
+        super().on_start()
+        self.reqres = ReqresClient(self.rest)
+
+    def _check_users(self, response: LocustResponse) -> List[str]:
+        users = run_sync(response.json()).get("data")
+        if not isinstance(users, list) or not users:
+            return ["Expected non-empty 'data' list"]
+        return [error for user in users for error in self.reqres.validate_user(user)]
+
+    def _check_user(self, response: LocustResponse) -> List[str]:
+        user = run_sync(response.json()).get("data")
+        if not isinstance(user, dict):
+            return ["Expected 'data' object"]
+        return self.reqres.validate_user(user)
+
+    def _check_token(self, response: LocustResponse) -> List[str]:
+        token = run_sync(response.json()).get("token")
+        return [] if isinstance(token, str) and token else ["Missing authentication token"]
+
+    @task(4)
+    def list_users(self):
+        with self.rest.named("/api/users?page=[n]"), self.sampled(self._check_users):
+            run_sync(self.reqres.get_users(page=random.randint(1, 2)))
+
+    @task(3)
+    def single_user(self):
+        with self.rest.named("/api/users/[id]"), self.sampled(self._check_user):
+            run_sync(self.reqres.get_user_by_id(random.randint(1, 6)))
+
+    @task(2)
+    def login(self):
+        with self.sampled(self._check_token):
+            run_sync(self.reqres.login_user("eve.holt@reqres.in", "cityslicka"))
+
+    @task(1)
+    def user_lifecycle(self):
+        created = run_sync(self.reqres.create_user("Load", "Tester"))
+        user_id = run_sync(created.json()).get("id", 2) if created.ok else 2
+        with self.rest.named("/api/users/[id]"):
+            run_sync(self.reqres.update_user(user_id, "Load", "Lead"))
+            run_sync(self.reqres.delete_user(user_id))
+
+
+class AdminPortalUser(ScenarioUser):
+    """Logged-in admin portal traffic using pre-logged-in accounts from the token pool.
+
+    Enabled only when LOAD_TEST_ACCOUNTS (or LOAD_TEST_ACCOUNTS_FILE) is set; log the
+    accounts in first with ``python -m utils.token_pool --watch``.
+    """
+
+    abstract = not len(TOKEN_POOL)
+    host = "https://manage-dev.noovoleum.com"
+    weight = 1
+
+    def on_start(self):
+        super().on_start()
+        self.token = TOKEN_POOL.acquire()
+
+    def _headers(self):
+        if self.token.expires_within(REFRESH_MARGIN):
+            self.token = TOKEN_POOL.acquire()
+        return self.token.headers
 
     @task
-    def health(self):
-        self.client.get("/health")
+    def profile(self):
+        run_sync(self.rest.get(f"{self.host}/profile", headers=self._headers()))
+
+
+class LoadProfileShape(load_shapes.ProfileShape):
+    """Follows --load-profile (constant, ramp, step, spike, soak)."""
 
 
 # Example run:
 # locust -f tests/performance/locustfile.py --headless -u 50 -r 5 -t 5m \
-#        --host https://api.example.com --csv=reports/locust
+#        --load-profile=spike --slo-p95-ms=800 --slo-error-rate=0.01 \
+#        --think-time=default --validation-rate=0.1 --csv=reports/locust
@@ -0,0 +1,29 @@
+import pytest
+import allure
+from allure import severity_level as severity
+from utils.allure_helpers import step
+from utils.locust_runner import LocustResult
+
+
+@allure.epic("Performance")
+@allure.feature("API Load")
+class TestApiLoad:
+    @allure.title("API baseline load")
+    @allure.severity(severity.NORMAL)
+    @pytest.mark.performance(
+        users=20, spawn_rate=5, run_time="1m",
+        min_rps=5, max_p95_ms=2000, max_error_rate=0.01,
+    )
+    def test_api_baseline_load(self, locust_result: LocustResult):
+        with step("Verify throughput, latency and error thresholds"):
+            assert not locust_result.violations, locust_result.summary()
+
+    @allure.title("API spike load")
+    @allure.severity(severity.NORMAL)
+    @pytest.mark.performance(
+        users=50, spawn_rate=5, run_time="2m", shape="spike",
+        max_p95_ms=3000, max_error_rate=0.05,
+    )
+    def test_api_spike_load(self, locust_result: LocustResult):
+        with step("Verify latency and error thresholds under a spike"):
+            assert not locust_result.violations, locust_result.summary()
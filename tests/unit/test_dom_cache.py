@@ -0,0 +1,19 @@
+import allure
+from utils import dom_cache
+
+PAGE = b"""<html><head><meta name="csrf-token" content="%s"><script nonce="%s">boot()</script></head>
+<body><input type="hidden" name="_csrf" value="%s"><p>%s</p></body></html>"""
+
+
+@allure.epic("Framework")
+@allure.feature("Offline Static Content")
+class TestHtmlHash:
+    def test_per_request_tokens_do_not_make_the_dom_stale(self):
+        first = PAGE % (b"a1b2", b"r4nd0m", b"t0k3n", b"Jl. Sudirman 1")
+        second = PAGE % (b"c3d4", b"0th3r", b"n3w", b"Jl. Sudirman 1")
+        assert dom_cache.html_hash(first) == dom_cache.html_hash(second)
+
+    def test_changed_server_content_makes_the_dom_stale(self):
+        first = PAGE % (b"a1b2", b"r4nd0m", b"t0k3n", b"Jl. Sudirman 1")
+        second = PAGE % (b"a1b2", b"r4nd0m", b"t0k3n", b"Jl. Thamrin 2")
+        assert dom_cache.html_hash(first) != dom_cache.html_hash(second)
@@ -0,0 +1,26 @@
+import allure
+from utils import element_state
+
+
+def _state(count=1, visible=True, text="Send Message"):
+    return {"count": count, "visible": visible, "enabled": True, "text": text, "attributes": {}}
+
+
+@allure.epic("Framework")
+@allure.feature("Batched Element Assertions")
+class TestMismatches:
+    def test_single_match_meeting_conditions_passes(self):
+        assert element_state.mismatches({"btn_send": _state()}, {"btn_send": {"visible": True}}) == []
+
+    def test_several_matches_fail_strict_mode(self):
+        problems = element_state.mismatches({"btn_send": _state(count=3)}, {"btn_send": {"visible": True}})
+        assert problems == ["btn_send: strict mode violation, resolved to 3 elements"]
+
+    def test_several_matches_allowed_without_strict(self):
+        expected = {"btn_send": {"visible": True, "strict": False}}
+        assert element_state.mismatches({"btn_send": _state(count=3)}, expected) == []
+
+    def test_all_mismatches_reported(self):
+        states = {"btn_send": _state(visible=False, text="Send"), "logo": _state(count=0)}
+        expected = {"btn_send": {"visible": True, "text": "Send Message"}, "logo": {"visible": True}}
+        assert len(element_state.mismatches(states, expected)) == 3
@@ -0,0 +1,68 @@
+import asyncio
+import allure
+import pytest
+from utils import load_generator
+
+
+class _Response:
+    status = 200
+    ok = True
+
+    async def dispose(self):
+        pass
+
+
+@allure.epic("Framework")
+@allure.feature("Open-Loop Load")
+class TestLatencyHistogram:
+    @pytest.mark.parametrize("percent, exact", [(50, 500), (90, 900), (99, 990), (99.9, 999)])
+    def test_percentiles_within_bucket_precision(self, percent, exact):
+        histogram = load_generator.LatencyHistogram()
+        for latency_ms in range(1, 1001):
+            histogram.record(latency_ms)
+        assert exact <= histogram.percentile(percent) <= exact * load_generator.BUCKET_GROWTH
+
+    def test_percentiles_never_exceed_the_maximum(self):
+        histogram = load_generator.LatencyHistogram()
+        histogram.record(123.4)
+        assert histogram.percentile(99.9) == histogram.max_ms == 123.4
+
+
+@allure.epic("Framework")
+@allure.feature("Open-Loop Load")
+class TestArrivalSchedule:
+    def test_constant_rate(self):
+        schedule = load_generator.ArrivalSchedule(rate=10, duration=5)
+        assert schedule.total == 50
+        assert [schedule.send_time(n) for n in (0, 5, 49)] == [0.0, 0.5, 4.9]
+
+    @pytest.mark.parametrize("rate, ramp_to, total", [(10, 30, 200), (30, 0, 150)], ids=["ramp-up", "ramp-down"])
+    def test_ramp_places_requests_on_the_cumulative_arrivals(self, rate, ramp_to, total):
+        schedule = load_generator.ArrivalSchedule(rate=rate, duration=10, ramp_to=ramp_to)
+        assert schedule.total == total
+        for n in (0, total // 4, total // 2, total):
+            t = schedule.send_time(n)
+            assert rate * t + (ramp_to - rate) * t ** 2 / 20 == pytest.approx(n)
+        assert schedule.send_time(total) == pytest.approx(10)
+
+    def test_negative_rate_rejected(self):
+        with pytest.raises(ValueError):
+            load_generator.ArrivalSchedule(rate=10, duration=10, ramp_to=-1)
+
+
+@allure.epic("Framework")
+@allure.feature("Open-Loop Load")
+class TestOpenLoopGenerator:
+    async def test_dropped_requests_count_at_the_timeout(self):
+        async def slow_send(service):
+            await asyncio.sleep(0.2)
+            return _Response()
+
+        generator = load_generator.OpenLoopGenerator(
+            None, slow_send, rate=100, duration=0.1, max_in_flight=1, timeout=0.5
+        )
+        report = await generator.run()
+        assert (report.offered, report.completed, report.dropped) == (10, 1, 9)
+        assert report.corrected.count == 10
+        assert report.corrected.percentile(50) == pytest.approx(500, rel=0.01)
+        assert report.uncorrected.count == 1
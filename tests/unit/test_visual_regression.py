@@ -0,0 +1,83 @@
+import io
+import allure
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+from utils import visual_regression
+
+
+def _page(button=(200, 30, 30), text="Send Message", size=(640, 480), text_x=30) -> bytes:
+    """A synthetic page: some text and a filled button."""
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for y in range(20, size[1] - 140, 40):
+        draw.text((text_x, y), f"Making everybody a green energy champion {y}", fill="black")
+    draw.rectangle((200, 360, 440, 420), fill=button)
+    draw.text((280, 382), text, fill="white")
+    return visual_regression.encode(np.asarray(image))
+
+
+@pytest.fixture()
+def baseline(tmp_path):
+    path = str(tmp_path / "home" / "full-page-desktop-640x480@1x.png")
+    visual_regression.save_baseline(path, _page())
+    return path
+
+
+@allure.epic("Framework")
+@allure.feature("Visual Regression")
+class TestCompareScreenshot:
+    def test_identical_file_passes_without_diff(self, baseline):
+        result = visual_regression.compare_screenshot(baseline, _page())
+        assert (result["status"], result["stage"]) == ("passed", "identical")
+
+    def test_same_pixels_in_other_encoding_pass_on_pixel_diff(self, baseline):
+        buffer = io.BytesIO()
+        Image.open(io.BytesIO(_page())).save(buffer, format="PNG", compress_level=1)
+        result = visual_regression.compare_screenshot(baseline, buffer.getvalue())
+        assert (result["status"], result["stage"], result["diff_pixels"]) == ("passed", "pixels", 0)
+
+    @pytest.mark.parametrize("button", [(30, 30, 200), (120, 20, 20)], ids=["red-to-blue", "red-to-dark-red"])
+    def test_colour_change_fails_although_hashes_match(self, baseline, button):
+        actual = _page(button=button)
+        stored = visual_regression._baseline_hashes(baseline)[1]
+        assert not visual_regression.replaced_tiles(stored, visual_regression.tile_hashes(
+            visual_regression.decode(actual)), (480, 640)).any()
+
+        result = visual_regression.compare_screenshot(baseline, actual)
+        assert (result["status"], result["stage"]) == ("failed", "pixels")
+        assert result["diff_pixels"] > 5000
+        assert result["diff_png"]
+
+    def test_colour_change_in_ignored_region_passes(self, baseline):
+        result = visual_regression.compare_screenshot(baseline, _page(button=(30, 30, 200)), ignore=[(190, 350, 260, 80)])
+        assert (result["status"], result["diff_pixels"]) == ("passed", 0)
+
+    def test_other_content_fails_fast_on_hashes(self, baseline):
+        other = np.asarray(Image.open(io.BytesIO(_page())))[::-1].copy()  # the page upside down
+        result = visual_regression.compare_screenshot(baseline, visual_regression.encode(other))
+        assert (result["status"], result["stage"]) == ("failed", "phash")
+        assert result["replaced_tiles"] > 0
+        assert result["diff_png"]
+
+    def test_other_content_without_prefilter_fails_on_pixel_diff(self, baseline):
+        other = np.asarray(Image.open(io.BytesIO(_page())))[::-1].copy()
+        result = visual_regression.compare_screenshot(baseline, visual_regression.encode(other), prefilter=False)
+        assert (result["status"], result["stage"]) == ("failed", "pixels")
+
+
+@allure.epic("Framework")
+@allure.feature("Visual Regression")
+class TestPixelDiff:
+    def test_anti_aliased_edge_rendered_differently_passes(self):
+        expected = np.full((40, 40, 3), 255, dtype=np.uint8)
+        expected[10:30, 10:20] = 0
+        actual = expected.copy()
+        expected[10:30, 20], actual[10:30, 20] = 100, 170  # the edge column blends black and white
+        result = visual_regression.pixel_diff(expected, actual)
+        assert (result["diff_pixels"], result["aa_pixels"]) == (0, 20)
+
+    def test_content_moved_by_one_pixel_fails(self):
+        expected = visual_regression.decode(_page())
+        result = visual_regression.pixel_diff(expected, visual_regression.decode(_page(text_x=31)))
+        assert result["diff_pixels"] > 1000
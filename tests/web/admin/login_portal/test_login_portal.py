@@ -61,11 +61,24 @@ class TestLogin:
 
         with step("Verify successful redirect to secure area"):
             await expect(page).to_have_url(re.compile(r"/dashboard"))
-    
+
+
+@allure.epic("Admin Portal")
+@allure.feature("Authentication")
+@pytest.mark.ui
+class TestLoginValidation:
+    """Failed logins and form validation: none of them leaves the login page, so they
+    share the worker's loaded login page and reset its form instead of reloading."""
+
+    @pytest.fixture()
+    async def login_page(self, resettable_pages, request):
+        yield await resettable_pages.open(LoginPage, request)
+        await resettable_pages.release(request)
+
     @allure.title("Login with invalid credentials")
     @allure.description("User attempts login with incorrect email or password")
     @allure.severity(severity_level.NORMAL)
-    async def test_login_with_invalid_credentials(self, login_page, page: Page, credentials):
+    async def test_login_with_invalid_credentials(self, login_page, credentials):
         if not credentials["user_email"]:
             pytest.skip("User email not configured in environment variables")
             
@@ -88,13 +101,13 @@ class TestLogin:
             await expect(login_page.password_invalid_err).to_be_visible()
             
         with step("Verify user stays on login page"):
-            await expect(page).to_have_url(re.compile(r"/login"))
+            await expect(login_page.page).to_have_url(re.compile(r"/login"))
             await expect(login_page.login_button).to_be_visible()
     
     @allure.title("Login with invalid 2FA code")
     @allure.description("User attempts login with correct email/password but incorrect 2FA code")
     @allure.severity(severity_level.NORMAL)
-    async def test_login_with_invalid_2fa(self, login_page, page: Page, credentials):
+    async def test_login_with_invalid_2fa(self, login_page, credentials):
         if not credentials["admin_email"] or not credentials["admin_password"]:
             pytest.skip("Admin credentials not configured in environment variables")
             
@@ -109,7 +122,7 @@ class TestLogin:
             await expect(login_page.tfa_invalid_err).to_be_visible()
         
         with step("Verify user stays on login page"):
-            await expect(page).to_have_url(re.compile(r"/login"))
+            await expect(login_page.page).to_have_url(re.compile(r"/login"))
             await expect(login_page.login_button).to_be_visible()
             
     
@@ -127,7 +140,7 @@ class TestLogin:
     @allure.title("Login form validation - invalid email format")
     @allure.description("Verify form validation when using invalid email format")
     @allure.severity(severity_level.NORMAL)
-    async def test_login_invalid_email_format(self, login_page, page: Page, credentials):
+    async def test_login_invalid_email_format(self, login_page, credentials):
         with step("Enter invalid email format"):
             await login_page.fill_email(credentials["invalid_format_email"])
             await login_page.fill_password("TestPassword123")
@@ -137,19 +150,19 @@ class TestLogin:
             await expect(login_page.email_invalid_err).to_be_visible()
 
         with step("Verify we're still on login page"):
-            await expect(page).to_have_url(re.compile(r"/login"))
+            await expect(login_page.page).to_have_url(re.compile(r"/login"))
 
     @allure.title("Login page refresh clears inputs")
     @allure.description("Verify that refreshing the login page clears all inputs")
     @allure.severity(severity_level.MINOR)
-    async def test_login_page_refresh_clears_inputs(self, login_page, page: Page, credentials):
+    async def test_login_page_refresh_clears_inputs(self, login_page, credentials):
         with step("Fill form fields"):
             await login_page.fill_email(credentials["test_email"])
             await login_page.fill_password("TestPassword123")
             await login_page.fill_2fa_code(credentials["invalid_tfa_code"])
             
         with step("Reload page and verify inputs are cleared"):
-            await page.reload()
+            await login_page.page.reload()
             
             # Check that fields are empty using expect
             await expect(login_page.email_input).to_have_value("")
@@ -5,18 +5,18 @@ from playwright.async_api import expect
 from sources.web.client.home_page import HomePage
 from allure import severity_level as severity
 from utils.allure_helpers import step
+from utils.element_state import expect_state
 
 
 @pytest.fixture(scope='function')
-async def home(page):
-    home = HomePage(page)
-    await home.open()
-    return home
+async def home(shared_page):
+    return await shared_page.open(HomePage)
 
 
 @allure.epic("Marketing Site")
 @allure.feature("Homepage")
 @pytest.mark.ui
+@pytest.mark.readonly
 class TestHomepage:
     @allure.title("Homepage Header validation")
     @allure.feature("Home/ Heading")
@@ -49,17 +49,9 @@ class TestHomepage:
     @allure.severity(severity.CRITICAL)
     async def test_homepage_process_steps(self, home, platform):
         with step("Verify the steps banner"):
-            steps = [
-                (home.step1_image, home.step1_desc, "Step 1"),
-                (home.step2_image, home.step2_desc, "Step 2"),
-                (home.step3_image, home.step3_desc, "Step 3"),
-                (home.step4_image, home.step4_desc, "Step 4")
-            ]
-            
-            for image, desc, step_name in steps:
-                with step(f"Verify {step_name} content"):
-                    await expect(image).to_be_visible()
-                    await expect(desc).to_be_visible()
+            await expect_state(home, {
+                f"step{n}_{part}": {"visible": True} for n in range(1, 5) for part in ("image", "desc")
+            })
 
 
     @allure.title("Homepage Contact Banner validation")
@@ -67,23 +59,32 @@ class TestHomepage:
     @allure.severity(severity.CRITICAL)
     async def test_homepage_contact_section(self, home, platform): 
         with step("Verify submit form elements"):
-            await expect(home.header_submit).to_be_visible()
-            await expect(home.input_name).to_be_visible()
-            await expect(home.input_email).to_be_visible()
-            await expect(home.input_message).to_be_visible()
-            await expect(home.btn_send).to_be_visible()
-        
-        with step("Verify company information"):
+            await expect_state(home, {
+                name: {"visible": True}
+                for name in ("header_submit", "input_name", "input_email", "input_message", "btn_send")
+            })
+
+        with step("Verify company logo"):
             await expect(home.info_logo).to_be_visible()
-            await expect(home.company_sg_address).to_be_visible()
-            await expect(home.company_id_address).to_be_visible()
-            await expect(home.linkedin_link).to_have_attribute("href", re.compile(r"linkedin\.com/company/noovoleum"))
-            await expect(home.instagram_link).to_have_attribute("href", re.compile(r"instagram\.com/noovoleumid"))
-            await expect(home.email_link).to_be_visible()
-        
+
+    @allure.title("Homepage Company Information validation")
+    @allure.feature("Home/ Contact Banner")
+    @allure.severity(severity.NORMAL)
+    @pytest.mark.static_content
+    async def test_homepage_company_info(self, home, platform):
+        with step("Verify company information"):
+            await expect_state(home, {
+                "company_sg_address": {"visible": True},
+                "company_id_address": {"visible": True},
+                "linkedin_link": {"attributes": {"href": re.compile(r"linkedin\.com/company/noovoleum")}},
+                "instagram_link": {"attributes": {"href": re.compile(r"instagram\.com/noovoleumid")}},
+                "email_link": {"visible": True},
+            })
+
     @allure.title("Homepage Footer validation")
     @allure.feature("Home/ Footer")
     @allure.severity(severity.MINOR)
+    @pytest.mark.static_content
     async def test_homepage_footer_section(self, home, platform): 
         with step("Verify footer elements"):
             await expect(home.footer).to_be_visible()
@@ -91,3 +92,13 @@ class TestHomepage:
             await expect(home.self_declaration_link).to_have_attribute("href", re.compile(r"self-declaration"))
             await expect(home.privacy_policy_link).to_have_attribute("href", re.compile(r"privacy-policy"))
             await expect(home.terms_conditions_link).to_have_attribute("href", re.compile(r"terms-and-conditions-2024"))
+
+    @allure.title("Homepage visual regression")
+    @allure.feature("Home/ Visual")
+    @allure.severity(severity.NORMAL)
+    async def test_homepage_visual(self, visual, home, platform):
+        with step("Compare the first screen with its baseline"):
+            await visual.check(home, "first-screen", full_page=False)
+
+        with step("Compare the full page with its baseline"):
+            await visual.check(home, "full-page", ignore=[home.language_toggle])
@@ -5,6 +5,7 @@ from playwright.async_api import expect
 from sources.web.client.home_page import HomePage
 from allure import severity_level as severity
 from utils.allure_helpers import step
+from utils.element_state import expect_state
 
 
 @pytest.fixture(scope="function")
@@ -58,3 +59,29 @@ class TestHomeSmoke:
                 await expect(page).to_have_url(
                     "https://play.google.com/store/apps/details?id=com.noovoleum.ucollect"
                 )
+
+    @allure.title("Homepage Smoke Test - Usable on a slow 4G connection")
+    @allure.feature("Home/ Heading")
+    @allure.severity(severity.NORMAL)
+    @pytest.mark.throttle("slow-4g")
+    async def test_homepage_on_slow_network(self, home, platform):
+        with step("Verify the hero and contact form render under slow-4g throttling"):
+            await expect(home.logo).to_be_visible()
+            await expect(home.hero_text).to_be_visible()
+            await expect(home.input_name).to_be_visible()
+
+    @allure.title("Homepage Smoke Test - Renders on phones and tablets")
+    @allure.feature("Home/ Heading")
+    @allure.severity(severity.NORMAL)
+    @pytest.mark.devices("iPhone 15 Pro", "iPhone 15", "Pixel 7", "Galaxy S9+", "iPad Pro 11", "iPad Pro 11 landscape")
+    async def test_homepage_on_devices(self, device_matrix):
+        async def header_renders(page, device):
+            home = await HomePage(page).open()
+            await expect_state(home, {
+                "logo": {"visible": True},
+                "hero_text": {"visible": True},
+                "language_toggle": {"visible": True},
+            })
+
+        with step("Verify the header on every device"):
+            await device_matrix.run(header_renders)
@@ -0,0 +1,125 @@
+import os
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from filelock import FileLock
+
+SNAPSHOT_DIR = ".cache/snapshots"
+SNAPSHOT_VERSION = 1
+
+
+def content_hash(item: Any) -> str:
+    """Stable short hash of a JSON item, independent of key order."""
+    payload = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def item_key(item: Any, key: str = "id") -> str:
+    """Snapshot key of an item.
+
+    Items without a usable key are keyed by their own hash, so any change to
+    them shows up as a remove/add pair rather than being silently skipped.
+    """
+    value = item.get(key) if isinstance(item, dict) else None
+    return str(value) if value is not None else f"#{content_hash(item)}"
+
+
+def build_snapshot(items: List[Dict], key: str = "id") -> Dict[str, Any]:
+    """Build a compact snapshot: one content hash per item, keyed by ``key``."""
+    hashes = {item_key(item, key): content_hash(item) for item in items}
+    digest = hashlib.sha1("".join(sorted(hashes.values())).encode("utf-8")).hexdigest()
+    return {
+        "version": SNAPSHOT_VERSION,
+        "key": key,
+        "count": len(items),
+        "digest": digest,
+        "items": hashes,
+    }
+
+
+@dataclass
+class SnapshotDiff:
+    """Added, removed and changed keys between two snapshots."""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    has_baseline: bool = False
+
+    @property
+    def delta_keys(self) -> set:
+        """Keys whose items need deep validation in this run."""
+        return set(self.added) | set(self.changed)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "has_baseline": self.has_baseline,
+            "added": self.added,
+            "removed": self.removed,
+            "changed": self.changed,
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_snapshots(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> SnapshotDiff:
+    """Compare two snapshots. Without a usable baseline every item counts as added."""
+    current_items = current["items"]
+    if not previous or previous.get("version") != SNAPSHOT_VERSION or previous.get("key") != current["key"]:
+        return SnapshotDiff(added=sorted(current_items))
+
+    previous_items = previous.get("items", {})
+    diff = SnapshotDiff(has_baseline=True)
+    if previous.get("digest") == current["digest"]:
+        diff.unchanged = len(current_items)
+        return diff
+
+    for entry_key, entry_hash in current_items.items():
+        old_hash = previous_items.get(entry_key)
+        if old_hash is None:
+            diff.added.append(entry_key)
+        elif old_hash != entry_hash:
+            diff.changed.append(entry_key)
+        else:
+            diff.unchanged += 1
+    diff.removed = [entry_key for entry_key in previous_items if entry_key not in current_items]
+
+    diff.added.sort()
+    diff.changed.sort()
+    diff.removed.sort()
+    return diff
+
+
+def _snapshot_path(name: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, f"{name}.json")
+
+
+def load_snapshot(name: str) -> Optional[Dict[str, Any]]:
+    path = _snapshot_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with FileLock(f"{path}.lock"):
+            with open(path, "r") as file:
+                return json.load(file)
+    except (json.JSONDecodeError, IOError) as e:
+        logging.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+
+
+def save_snapshot(name: str, snapshot: Dict[str, Any]) -> str:
+    """Persist a snapshot atomically; safe to call from parallel xdist workers."""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = _snapshot_path(name)
+    with FileLock(f"{path}.lock"):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(snapshot, file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    return path
@@ -4,7 +4,9 @@ import asyncio
 from typing import Optional, Dict, Any
 
 import pytest
+from playwright.async_api import Browser
 from utils.sess_handler import SessionHandler
+from utils.throttling import throttle_context, ready as throttling_ready
 
 # Constants
 DEFAULT_BROWSER = "chromium"
@@ -12,6 +14,7 @@ DEFAULT_DEVICES = "Pixel 9"
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 0.1
 SUPPORTED_MODES = ("pipeline", "local")
+NON_EMULATION_KEYS = ("default_browser_type",)  # picks a browser, not a context option
 
 
 class Config:   
@@ -43,7 +46,15 @@ class Config:
                     raise e
                 await asyncio.sleep(RETRY_DELAY * (attempt + 1))
 
-    async def setup_browser(self, playwright) -> None:
+    async def launch_browser(self, playwright, browser_type: str):
+        """Launch ``browser_type`` (chromium, firefox, webkit) with this configuration's arguments."""
+        launch_args = self._get_browser_launch_args()
+        if browser_type != "chromium":
+            launch_args["args"] = []  # window flags are Chromium's
+        return await self._retry_operation(playwright[browser_type].launch, **launch_args)
+
+    async def setup_browser(self, playwright, browser: Optional[Browser] = None) -> None:
+        """Launch the BROWSER engine, or use ``browser`` (an engine pool's) when given."""
         self._playwright = playwright
         browser_type = os.getenv("BROWSER", DEFAULT_BROWSER)
         mode = os.getenv("mode", "local")
@@ -51,10 +62,7 @@ class Config:
         if mode not in SUPPORTED_MODES:
             raise ValueError(f"Unsupported mode: {mode}. Supported: {SUPPORTED_MODES}")
 
-        launch_args = self._get_browser_launch_args()
-        self.browser = await self._retry_operation(
-            playwright[browser_type].launch, **launch_args
-        )
+        self.browser = browser or await self.launch_browser(playwright, browser_type)
         self.session_handler = SessionHandler(self.browser, self.is_headless())
 
     def _get_device_config(
@@ -74,6 +82,12 @@ class Config:
             "has_touch": False,
         }
 
+    def device_options(self, platform: str, device_name: Optional[str] = None) -> Dict[str, Any]:
+        """``new_context`` options emulating ``device_name``, or the platform's default
+        device: a copy, without the keys of a device profile that are not context options."""
+        device = self._get_device_config(platform, device_name)
+        return {key: value for key, value in device.items() if key not in NON_EMULATION_KEYS}
+
     def _get_mobile_config(self) -> Dict[str, Any]:
         if self._playwright:
             default_device = self._playwright.devices.get(DEFAULT_DEVICES)  # Param to receive selected device
@@ -94,13 +108,18 @@ class Config:
         storage_state: Optional[str | bool] = None,
         user_type: str = "user",
         device_name: Optional[str] = None,
+        throttle: Optional[str] = None,
     ):
-        """Initialize browser context with device emulation."""
+        """Initialize browser context with device emulation.
+
+        ``throttle`` names a profile from ``utils.throttling``; without it, mobile
+        contexts use the run's ``--throttle`` profile, if any.
+        """
         if not self.browser:
             raise RuntimeError("Browser not initialized. Call setup_browser first.")
 
         platform = os.getenv("platform", "desktop")
-        context_options = self._get_device_config(platform, device_name)
+        context_options = self.device_options(platform, device_name)
 
         # If storage_state is True or a string and we have session_handler
         if storage_state and self.session_handler:
@@ -111,6 +130,10 @@ class Config:
         context = await self._retry_operation(
             self.browser.new_context, **context_options
         )
+
+        throttle = throttle or (os.getenv("throttle") if platform == "mobile" else None)
+        if throttle:
+            throttle_context(context, throttle)
         return context
 
     async def setup_page(self, device_name: Optional[str] = None):
@@ -118,6 +141,7 @@ class Config:
         context = await self.context_init(device_name=device_name)
         if context:
             self.page = await context.new_page()
+            await throttling_ready(self.page)
             return self.page
         raise RuntimeError("Failed to create context")
 
@@ -130,6 +154,7 @@ class Config:
         context = await self.context_init(storage_state=True, user_type=auth_mode, device_name=device_name)
         if context:
             self.page = await context.new_page()
+            await throttling_ready(self.page)
             return self.page
         raise RuntimeError("Failed to create authenticated context")
 
@@ -176,11 +201,15 @@ class ContextManager:
         """Create context with platform detection."""
         platform = self._extract_platform_from_request(request)
         os.environ["platform"] = platform
-        context = await self.runner.context_init()
+        marker = request.node.get_closest_marker("throttle")
+        throttle = marker.args[0] if marker and marker.args else None
+        context = await self.runner.context_init(throttle=throttle)
         return context, platform
 
     async def create_page(self, context):
-        return await context.new_page()
+        page = await context.new_page()
+        await throttling_ready(page)
+        return page
 
     async def cleanup_page(self, page) -> None:
         try:
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+import statistics
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from playwright.async_api import Browser, Page, async_playwright
+
+project_root = str(Path(__file__).parent.parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sources.web.admin.login_page import LoginPage  # noqa: E402
+from sources.web.client.home_page import HomePage  # noqa: E402
+from utils.load_generator import LatencyHistogram  # noqa: E402
+from utils.token_pool import load_accounts  # noqa: E402
+
+RESULTS_DIR = "reports/browser_load"
+CONCURRENCY_BUCKET = 10  # contexts per capacity bucket
+MIN_BUCKET_SAMPLES = 5
+DEGRADATION_FACTOR = 1.5  # median journey time vs. the least loaded bucket
+THINK_TIME = (1.0, 3.0)
+CONTEXT_OPTIONS = {"viewport": {"width": 1280, "height": 800}, "ignore_https_errors": True}
+BROWSER_ARGS = ["--disable-dev-shm-usage", "--disable-gpu", "--renderer-process-limit=64"]
+
+
+class JourneyRecorder:
+    """Times the steps of one journey run."""
+
+    def __init__(self):
+        self.steps: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = (time.perf_counter() - started) * 1000
+
+
+async def home_journey(page: Page, recorder: JourneyRecorder) -> None:
+    home_page = HomePage(page)
+    async with recorder.step("open"):
+        await home_page.open()
+    async with recorder.step("language_toggle"):
+        await home_page.click_language_toggle()
+        await home_page.click_language_toggle()
+    async with recorder.step("contact_form"):
+        await home_page.header_submit.scroll_into_view_if_needed()
+        await home_page.fill_contact_form("Load Tester", "load.tester@example.com", "Browser load run")
+
+
+def login_journey(accounts: List[Tuple[str, str]]) -> Callable[[Page, JourneyRecorder], Awaitable[None]]:
+    async def journey(page: Page, recorder: JourneyRecorder) -> None:
+        email, password = random.choice(accounts)
+        login_page = LoginPage(page)
+        async with recorder.step("open"):
+            await login_page.open()
+        async with recorder.step("login"):
+            await login_page.login(email, password)
+            await page.wait_for_url("**/profile", timeout=15000)
+
+    return journey
+
+
+@dataclass
+class JourneyStats:
+    runs: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    steps: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def record(self, recorder: JourneyRecorder, elapsed_ms: float, failed: bool) -> None:
+        self.runs += 1
+        if failed:
+            self.errors += 1
+            return
+        self.latency.record(elapsed_ms)
+        for name, step_ms in recorder.steps.items():
+            self.steps.setdefault(name, LatencyHistogram()).record(step_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "journey": self.latency.to_dict(),
+            "steps": {name: histogram.to_dict() for name, histogram in self.steps.items()},
+        }
+
+
+@dataclass
+class BrowserSlot:
+    """One browser process and the (concurrency, journey ms) samples taken on it."""
+
+    index: int
+    browser: Browser
+    active: int = 0
+    peak: int = 0
+    samples: List[Tuple[int, float]] = field(default_factory=list)
+
+    def capacity(self) -> Dict[str, Any]:
+        """Largest concurrency bucket whose median journey time stays within
+        DEGRADATION_FACTOR of the least loaded bucket."""
+        buckets: Dict[int, List[float]] = {}
+        for concurrency, elapsed_ms in self.samples:
+            bucket = max(1, -(-concurrency // CONCURRENCY_BUCKET) * CONCURRENCY_BUCKET)
+            buckets.setdefault(bucket, []).append(elapsed_ms)
+
+        medians = {
+            bucket: statistics.median(values)
+            for bucket, values in sorted(buckets.items()) if len(values) >= MIN_BUCKET_SAMPLES
+        }
+        if not medians:
+            return {"browser": self.index, "peak_contexts": self.peak, "sustainable_contexts": None}
+
+        baseline = next(iter(medians.values()))
+        sustainable = None
+        for bucket, median in medians.items():
+            if median > baseline * DEGRADATION_FACTOR:
+                break
+            sustainable = bucket
+        return {
+            "browser": self.index,
+            "peak_contexts": self.peak,
+            "sustainable_contexts": sustainable,
+            "baseline_ms": round(baseline, 1),
+            "median_ms_by_contexts": {bucket: round(median, 1) for bucket, median in medians.items()},
+        }
+
+
+class BrowserLoadRunner:
+    """Run HomePage/LoginPage journeys for many virtual users packed into a few browsers.
+
+    Each virtual user is a coroutine that opens a fresh context on the least busy
+    browser, runs a weighted-random journey, closes the context and thinks. Users are
+    ramped up linearly, so every browser is observed across a range of concurrent
+    contexts, which gives its capacity before journey times degrade.
+    """
+
+    def __init__(
+        self,
+        users: int = 100,
+        browsers: int = 2,
+        ramp: float = 60,
+        duration: float = 180,
+        journeys: Optional[Dict[str, Tuple[Callable, int]]] = None,
+        think_time: Tuple[float, float] = THINK_TIME,
+        headless: bool = True,
+    ):
+        self.users = users
+        self.browser_count = browsers
+        self.ramp = ramp
+        self.duration = duration
+        self.journeys = journeys or default_journeys()
+        self.think_time = think_time
+        self.headless = headless
+        self.slots: List[BrowserSlot] = []
+        self.stats: Dict[str, JourneyStats] = {name: JourneyStats() for name in self.journeys}
+        self.active_users = 0
+
+    def _pick_slot(self) -> BrowserSlot:
+        return min(self.slots, key=lambda slot: slot.active)
+
+    async def _run_journey(self) -> None:
+        names = list(self.journeys)
+        name = random.choices(names, weights=[self.journeys[n][1] for n in names])[0]
+        slot = self._pick_slot()
+        slot.active += 1
+        slot.peak = max(slot.peak, slot.active)
+        concurrency = slot.active
+
+        recorder = JourneyRecorder()
+        started = time.perf_counter()
+        failed = False
+        context = None
+        try:
+            context = await slot.browser.new_context(**CONTEXT_OPTIONS)
+            page = await context.new_page()
+            await self.journeys[name][0](page, recorder)
+        except Exception as e:
+            failed = True
+            logging.debug(f"Journey {name} failed: {e}")
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            try:
+                if context:
+                    await context.close()
+            except Exception as e:
+                logging.warning(f"Context cleanup error: {e}")
+            finally:
+                slot.active -= 1
+
+        self.stats[name].record(recorder, elapsed_ms, failed)
+        if not failed:
+            slot.samples.append((concurrency, elapsed_ms))
+
+    async def _virtual_user(self, stop_at: float) -> None:
+        self.active_users += 1
+        try:
+            while time.monotonic() < stop_at:
+                await self._run_journey()
+                await asyncio.sleep(random.uniform(*self.think_time))
+        finally:
+            self.active_users -= 1
+
+    async def run(self) -> Dict[str, Any]:
+        async with async_playwright() as p:
+            for index in range(self.browser_count):
+                browser = await p.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+                self.slots.append(BrowserSlot(index, browser))
+
+            started = time.monotonic()
+            stop_at = started + self.duration
+            users = []
+            try:
+                for n in range(self.users):
+                    delay = started + self.ramp * n / self.users - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    users.append(asyncio.ensure_future(self._virtual_user(stop_at)))
+                for result in await asyncio.gather(*users, return_exceptions=True):
+                    if isinstance(result, BaseException):
+                        logging.error(f"Virtual user stopped early: {result!r}")
+            finally:
+                for slot in self.slots:
+                    await slot.browser.close()
+
+        return self.report(time.monotonic() - started)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "users": self.users,
+            "browsers": self.browser_count,
+            "ramp_s": self.ramp,
+            "elapsed_s": round(elapsed, 1),
+            "journeys": {name: stats.to_dict() for name, stats in self.stats.items()},
+            "capacity": [slot.capacity() for slot in self.slots],
+        }
+
+
+def default_journeys() -> Dict[str, Tuple[Callable, int]]:
+    """``home`` always; ``login`` when load-test accounts are configured."""
+    journeys: Dict[str, Tuple[Callable, int]] = {"home": (home_journey, 4)}
+    accounts = load_accounts()
+    if accounts:
+        journeys["login"] = (login_journey(accounts), 1)
+    else:
+        logging.info("No LOAD_TEST_ACCOUNTS configured, skipping the login journey")
+    return journeys
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent.parent / ".env")
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Browser-level load: concurrent HomePage/LoginPage journeys")
+    parser.add_argument("--users", type=int, default=100, help="Virtual users at the end of the ramp")
+    parser.add_argument("--browsers", type=int, default=2, help="Browser processes shared by all users")
+    parser.add_argument("--ramp", type=float, default=60, help="Seconds to ramp up to --users")
+    parser.add_argument("--duration", type=float, default=180, help="Total run time in seconds")
+    parser.add_argument("--headed", action="store_true", help="Show the browsers")
+    parser.add_argument("--output", help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    runner = BrowserLoadRunner(args.users, args.browsers, args.ramp, args.duration, headless=not args.headed)
+    load_report = asyncio.run(runner.run())
+    output = json.dumps(load_report, indent=2)
+    print(output)
+
+    output_path = args.output or str(Path(RESULTS_DIR) / f"browser_load_{int(time.time())}.json")
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(output_path).write_text(output)
@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import asyncio
+import difflib
+import logging
+import traceback
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import allure
+from playwright.async_api import Browser, Page
+
+from utils.browser_config import Config, ContextManager
+from utils.engines import EnginePool
+from utils.throttling import throttle_context
+
+DEFAULT_CONCURRENCY = 4  # contexts open at once per engine
+UNSUPPORTED_OPTIONS = {"firefox": ("is_mobile",)}
+
+
+def resolve_devices(runner: Config, names: List[str]) -> Dict[str, List[str]]:
+    """Map each distinct emulation to the requested device names that share it.
+
+    Devices with identical context options (e.g. "iPhone 7" and "iPhone 8") would run
+    the same test twice, so only the first name of each group runs.
+    """
+    profiles = runner._playwright.devices
+    groups: Dict[str, List[str]] = {}
+    for name in names:
+        if name not in profiles:
+            close = difflib.get_close_matches(name, profiles, n=3)
+            raise ValueError(f"Unknown device {name!r}" + (f", did you mean {close}?" if close else ""))
+        key = json.dumps(runner.device_options("desktop", name), sort_keys=True)
+        groups.setdefault(key, []).append(name)
+    return {group[0]: group for group in groups.values()}
+
+
+class DeviceMatrix:
+    """Runs one test body on every engine and device of the test's matrix.
+
+    Devices come from the ``devices`` marker (without it, the platform's default
+    emulation); engines from ``--engines`` (without it, the test's browser). Each
+    combination gets its own context and all run concurrently in the test's event
+    loop, at most ``concurrency`` contexts per engine at a time. Every combination is
+    reported like a subtest (an Allure step and a ``user_properties`` entry), and the
+    test fails once, listing every failed combination.
+    """
+
+    def __init__(self, runner: Config, item, engine_pool: Optional[EnginePool] = None):
+        marker = item.get_closest_marker("devices")
+        self.runner = runner
+        self.item = item
+        self.engine_pool = engine_pool
+        self.devices = resolve_devices(runner, list(marker.args)) if marker and marker.args else {}
+        self.concurrency = marker.kwargs.get("concurrency", DEFAULT_CONCURRENCY) if marker else DEFAULT_CONCURRENCY
+        self.engines: List[Optional[str]] = list(engine_pool.engines) if engine_pool else [None]
+
+    def variants(self) -> List[Tuple[Optional[str], Optional[str]]]:
+        return [(engine, device) for engine in self.engines for device in (list(self.devices) or [None])]
+
+    def _options(self, engine: Optional[str], device: Optional[str]) -> Dict[str, Any]:
+        options = self.runner.device_options(os.getenv("platform", "desktop"), device)
+        for option in UNSUPPORTED_OPTIONS.get(engine, ()):
+            options.pop(option, None)
+        return options
+
+    async def _browser(self, engine: Optional[str]) -> Browser:
+        return await self.engine_pool.browser(engine) if engine else self.runner.browser
+
+    async def _run_variant(self, engine, device, body: Callable[[Page, str], Awaitable[None]], slots) -> Dict[str, Any]:
+        label = "/".join(filter(None, (engine, device))) or os.getenv("platform", "desktop")
+        result = {
+            "variant": label,
+            "engine": engine,
+            "device": device,
+            "same_as": self.devices.get(device, [device])[1:] if device else [],
+            "status": "passed",
+            "error": None,
+        }
+        async with slots:
+            started = time.perf_counter()
+            context = None
+            try:
+                options = self._options(engine, device)
+                context = await (await self._browser(engine)).new_context(**options)
+                if options.get("is_mobile") and os.getenv("throttle"):
+                    throttle_context(context, os.getenv("throttle"))
+                page = await ContextManager(self.runner).create_page(context)
+                try:
+                    await body(page, device)
+                except Exception as e:
+                    result["status"] = "failed"
+                    result["error"] = f"{type(e).__name__}: {e}"
+                    result["traceback"] = traceback.format_exc()
+                    try:
+                        result["screenshot"] = await page.screenshot(full_page=True)
+                    except Exception as screenshot_error:
+                        logging.warning(f"Device matrix: no screenshot of {label}: {screenshot_error}")
+            except Exception as e:
+                result["status"] = "broken"
+                result["error"] = f"{type(e).__name__}: {e}"
+                result["traceback"] = traceback.format_exc()
+            finally:
+                if context is not None:
+                    await ContextManager(self.runner).cleanup_context(context)
+            result["duration_s"] = round(time.perf_counter() - started, 2)
+        return result
+
+    def _report(self, result: Dict[str, Any]) -> None:
+        alias = f" (= {', '.join(result['same_as'])})" if result["same_as"] else ""
+        title = f"[{result['variant']}{alias}] {result['status']} in {result['duration_s']}s"
+        self.item.user_properties.append((f"subtest:{result['variant']}", result["status"]))
+        try:
+            with allure.step(title):
+                if result.get("screenshot"):
+                    allure.attach(result["screenshot"], f"{result['variant']} failure", allure.attachment_type.PNG)
+                if result["error"]:
+                    allure.attach(result["traceback"], f"{result['variant']} traceback", allure.attachment_type.TEXT)
+                    raise AssertionError(result["error"])
+        except AssertionError:
+            pass  # marks the step failed; the test fails once, in run()
+
+    async def run(self, body: Callable[[Page, Optional[str]], Awaitable[None]]) -> List[Dict[str, Any]]:
+        """Await ``body(page, device_name)`` on every combination and fail with all failures."""
+        slots = {engine: asyncio.Semaphore(self.concurrency) for engine in self.engines}
+        results = await asyncio.gather(
+            *(self._run_variant(engine, device, body, slots[engine]) for engine, device in self.variants())
+        )
+        for result in results:
+            self._report(result)
+
+        failed = [result for result in results if result["status"] != "passed"]
+        logging.info(f"Device matrix: {len(results) - len(failed)}/{len(results)} combinations passed")
+        if failed:
+            raise AssertionError(
+                f"{len(failed)}/{len(results)} combinations failed:\n- "
+                + "\n- ".join(f"{result['variant']}: {result['error']}" for result in failed)
+            )
+        return results
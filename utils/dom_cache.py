@@ -0,0 +1,174 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import httpx
+from filelock import FileLock
+from playwright.async_api import BrowserContext, Route
+
+from utils.browser_config import Config
+from utils.shared_cache import acquire_lock
+
+DOM_CACHE_DIR = ".cache/dom"
+OFFLINE_RESOURCE_TYPES = ("stylesheet", "font")  # cross-origin CSS that could not be inlined
+
+# Per-request values in the server HTML that do not change what the page shows; they are
+# blanked before hashing so they do not force a re-capture on every run.
+VOLATILE_HTML = (
+    re.compile(rb'(\snonce=["\']?)[^"\'\s>]*'),
+    re.compile(rb'(<meta\s+name=["\']?csrf-token["\']?\s+content=["\']?)[^"\'\s>]*', re.IGNORECASE),
+    re.compile(rb'(<input\s[^>]*name=["\']?_?csrf\w*["\']?\s+value=["\']?)[^"\'\s>]*', re.IGNORECASE),
+)
+
+# Run on a throwaway capture page: inline readable stylesheets, drop scripts and resolve
+# relative URLs against the live URL, so the DOM renders the same without JavaScript.
+CAPTURE_SCRIPT = """url => {
+    for (const sheet of [...document.styleSheets]) {
+        let css;
+        try { css = [...sheet.cssRules].map(rule => rule.cssText).join("\\n"); } catch (e) { continue; }
+        if (sheet.ownerNode && sheet.ownerNode.tagName === "LINK") {
+            const style = document.createElement("style");
+            style.textContent = css;
+            sheet.ownerNode.replaceWith(style);
+        }
+    }
+    document.querySelectorAll("script, noscript, link[rel=preload], link[rel=modulepreload]").forEach(e => e.remove());
+    const base = document.createElement("base");
+    base.href = url;
+    document.head.prepend(base);
+    return "<!DOCTYPE html>\\n" + document.documentElement.outerHTML;
+}"""
+
+# Rendered DOM already checked (or captured) in this process, per (url, platform).
+_run_cache: Dict[Tuple[str, str], str] = {}
+
+
+def cache_key(url: str, platform: str) -> str:
+    return f"{platform}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]}"
+
+
+def enabled(item) -> bool:
+    return item.config.getoption("static_dom") and item.get_closest_marker("static_content") is not None
+
+
+def html_hash(content: bytes) -> str:
+    """Hash of server HTML with nonces and CSRF tokens blanked out."""
+    for pattern in VOLATILE_HTML:
+        content = pattern.sub(rb"\1", content)
+    return hashlib.sha1(content).hexdigest()[:16]
+
+
+async def source_hash(url: str, user_agent: Optional[str] = None) -> str:
+    """Hash of the HTML the server sends for ``url``; a change means the cached DOM is stale."""
+    headers = {"User-Agent": user_agent} if user_agent else {}
+    async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+    return html_hash(response.content)
+
+
+async def _offline(route: Route) -> None:
+    if route.request.resource_type in OFFLINE_RESOURCE_TYPES:
+        await route.continue_()
+    else:
+        await route.abort()
+
+
+class StaticDom:
+    """Page objects opened on the cached rendered DOM of their live page.
+
+    The first ``open`` of a page per platform and run compares the server's HTML with
+    the hash stored next to the cached DOM and re-captures the DOM from a live page
+    only when it changed. The cached DOM is loaded with ``set_content`` into a context
+    without JavaScript or network, so locator assertions on static content need no
+    navigation.
+
+    Only the server HTML counts: nonces and CSRF tokens are ignored, and content that
+    scripts fetch and render in the browser is not checked at all. Pages whose static
+    content comes from client-side requests need their files removed from
+    ``DOM_CACHE_DIR`` to be captured again.
+    """
+
+    def __init__(self, runner: Config, platform: str):
+        self.runner = runner
+        self.platform = platform
+        self.contexts: List[BrowserContext] = []
+
+    def _device_config(self) -> Dict[str, Any]:
+        return self.runner.device_options(self.platform)
+
+    async def _capture(self, page_class: Type) -> str:
+        context = await self.runner.browser.new_context(**self._device_config())
+        try:
+            page = await context.new_page()
+            await page_class(page).open()
+            return await page.evaluate(CAPTURE_SCRIPT, page.url)
+        finally:
+            await context.close()
+
+    async def rendered_dom(self, page_class: Type) -> str:
+        url = page_class.url
+        if (url, self.platform) in _run_cache:
+            return _run_cache[(url, self.platform)]
+
+        os.makedirs(DOM_CACHE_DIR, exist_ok=True)
+        path = os.path.join(DOM_CACHE_DIR, f"{page_class.page_name}-{cache_key(url, self.platform)}")
+        lock = FileLock(f"{path}.lock")
+        await acquire_lock(lock)
+        try:
+            if (url, self.platform) in _run_cache:  # captured by another test while waiting
+                return _run_cache[(url, self.platform)]
+            meta = {}
+            if os.path.exists(f"{path}.json"):
+                with open(f"{path}.json", "r") as file:
+                    meta = json.load(file)
+            try:
+                current = await source_hash(url, self._device_config().get("user_agent"))
+            except httpx.HTTPError as e:
+                if not meta:
+                    raise
+                logging.warning(f"DOM cache: cannot check {url} ({e}), using the DOM captured {meta['captured_at']}")
+                current = meta["source_hash"]
+
+            if meta.get("source_hash") == current and os.path.exists(f"{path}.html"):
+                with open(f"{path}.html", "r", encoding="utf-8") as file:
+                    html = file.read()
+                logging.info(f"DOM cache: {page_class.page_name} [{self.platform}] is current")
+            else:
+                html = await self._capture(page_class)
+                with open(f"{path}.html", "w", encoding="utf-8") as file:
+                    file.write(html)
+                with open(f"{path}.json", "w") as file:
+                    json.dump({
+                        "url": url,
+                        "platform": self.platform,
+                        "source_hash": current,
+                        "dom_hash": hashlib.sha1(html.encode("utf-8")).hexdigest()[:16],
+                        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    }, file, indent=2)
+                logging.info(f"DOM cache: captured {page_class.page_name} [{self.platform}] from {url}")
+            _run_cache[(url, self.platform)] = html
+        finally:
+            lock.release()
+        return html
+
+    async def open(self, page_class: Type):
+        html = await self.rendered_dom(page_class)
+        context = await self.runner.browser.new_context(**self._device_config(), java_script_enabled=False)
+        self.contexts.append(context)
+        await context.route("**/*", _offline)
+        page = await context.new_page()
+        await page.set_content(html, wait_until="load")
+        return page_class(page)
+
+    async def close(self) -> None:
+        for context in self.contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logging.warning(f"Static DOM context cleanup error: {e}")
+        self.contexts.clear()
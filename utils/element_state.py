@@ -0,0 +1,136 @@
+import re
+import json
+import time
+import asyncio
+from typing import Any, Dict, Iterable, List, Pattern, Tuple, Union
+
+import allure
+from playwright.async_api import Locator
+
+DEFAULT_TIMEOUT = 5000  # ms, as Playwright's expect
+POLL_INTERVALS_MS = (100, 250, 500, 1000)  # then 1000 ms, like expect's retries
+
+# State of every element a locator matches; visibility follows Playwright's rule
+# (non-empty box and not visibility:hidden).
+STATE_SCRIPT = """(elements, attributes) => elements.map(element => {
+    const style = window.getComputedStyle(element);
+    const rect = element.getBoundingClientRect();
+    return {
+        visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden",
+        enabled: !element.disabled && !element.closest("[aria-disabled=true]"),
+        text: (element.textContent || "").replace(/\\s+/g, " ").trim(),
+        attributes: Object.fromEntries(attributes.map(name => [name, element.getAttribute(name)])),
+    };
+})"""
+
+MISSING = {"visible": False, "enabled": False, "text": None, "attributes": {}}
+
+Expected = Dict[str, Any]  # visible, enabled, text, contains_text, attributes={name: value}, strict
+Text = Union[str, Pattern]
+
+
+async def snapshot(locators: Dict[str, Locator], attributes: Iterable[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """State of each named locator's first match, plus its match count.
+
+    One ``evaluate_all`` per locator, all sent at once, so a snapshot of many
+    elements costs about one round trip to the browser.
+    """
+    attributes = sorted(set(attributes))
+    names = list(locators)
+    results = await asyncio.gather(*(locators[name].evaluate_all(STATE_SCRIPT, attributes) for name in names))
+    return {name: {"count": len(matches), **(matches[0] if matches else MISSING)} for name, matches in zip(names, results)}
+
+
+def _text_matches(actual: str, expected: Text, contains: bool) -> bool:
+    if actual is None:
+        return False
+    if isinstance(expected, re.Pattern):
+        return expected.search(actual) is not None
+    expected = " ".join(expected.split())
+    return expected in actual if contains else actual == expected
+
+
+def _show(value: Any) -> str:
+    return f"/{value.pattern}/" if isinstance(value, re.Pattern) else repr(value)
+
+
+def mismatches(states: Dict[str, Dict[str, Any]], expected: Dict[str, Expected]) -> List[str]:
+    """Every expectation the snapshot does not meet, one line each.
+
+    Like Playwright's strict mode, a locator must match exactly one element; pass
+    ``strict: False`` in its conditions to check the first of several matches.
+    """
+    problems = []
+    for name, conditions in expected.items():
+        state = states[name]
+        if state["count"] == 0:
+            problems.append(f"{name}: not found")
+            continue
+        if state["count"] > 1 and conditions.get("strict", True):
+            problems.append(f"{name}: strict mode violation, resolved to {state['count']} elements")
+        for flag in ("visible", "enabled"):
+            if flag in conditions and state[flag] != conditions[flag]:
+                problems.append(f"{name}: expected {flag}={conditions[flag]}, got {state[flag]}")
+        for key, contains in (("text", False), ("contains_text", True)):
+            if key in conditions and not _text_matches(state["text"], conditions[key], contains):
+                problems.append(f"{name}: expected {key} {_show(conditions[key])}, got {state['text']!r}")
+        for attribute, value in conditions.get("attributes", {}).items():
+            actual = state["attributes"].get(attribute)
+            if not _text_matches(actual, value, contains=False):
+                problems.append(f"{name}: expected [{attribute}] {_show(value)}, got {actual!r}")
+    return problems
+
+
+def _attributes(expected: Dict[str, Expected]) -> List[str]:
+    return [attribute for conditions in expected.values() for attribute in conditions.get("attributes", {})]
+
+
+async def wait_for_state(
+    locators: Dict[str, Locator], expected: Dict[str, Expected], timeout: float = DEFAULT_TIMEOUT
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Snapshot until every expectation holds or ``timeout`` ms pass; returns the last
+    snapshot and its mismatches."""
+    deadline = time.monotonic() + timeout / 1000
+    attributes = _attributes(expected)
+    attempt = 0
+    while True:
+        states = await snapshot(locators, attributes)
+        problems = mismatches(states, expected)
+        remaining = deadline - time.monotonic()
+        if not problems or remaining <= 0:
+            return states, problems
+        interval = POLL_INTERVALS_MS[min(attempt, len(POLL_INTERVALS_MS) - 1)] / 1000
+        await asyncio.sleep(min(interval, remaining))
+        attempt += 1
+
+
+async def assert_state(
+    locators: Dict[str, Locator], expected: Dict[str, Expected], timeout: float = DEFAULT_TIMEOUT
+) -> Dict[str, Dict[str, Any]]:
+    """Like ``wait_for_state``, but fail with all mismatches at once (the snapshot is
+    attached to Allure)."""
+    states, problems = await wait_for_state(locators, expected, timeout)
+    if problems:
+        allure.attach(json.dumps(states, indent=2), "Element State", allure.attachment_type.JSON)
+        raise AssertionError(
+            f"{len(problems)} element state mismatch(es) after {timeout:.0f} ms:\n- " + "\n- ".join(problems)
+        )
+    return states
+
+
+async def expect_state(
+    page_object: Any, expected: Dict[str, Expected], timeout: float = DEFAULT_TIMEOUT
+) -> Dict[str, Dict[str, Any]]:
+    """``assert_state`` on a page object's locators, named by attribute.
+
+    Called from tests, as page objects hold no assertions:
+
+    ```python
+    await expect_state(home, {
+        "logo": {"visible": True},
+        "apple_btn": {"attributes": {"href": re.compile(r"onelink\\.me")}},
+    })
+    ```
+    """
+    locators = {name: getattr(page_object, name) for name in expected}
+    return await assert_state(locators, expected, timeout)
@@ -0,0 +1,77 @@
+import time
+import asyncio
+import logging
+import warnings
+from typing import Dict, List
+
+import pytest
+from playwright.async_api import Browser
+
+from utils.browser_config import Config
+
+ENGINES = ("chromium", "firefox", "webkit")
+
+
+def parse_engines(value: str) -> List[str]:
+    """``"chromium,webkit"`` -> ``["chromium", "webkit"]``, validated and deduplicated."""
+    engines = list(dict.fromkeys(name.strip().lower() for name in value.split(",") if name.strip()))
+    unknown = [name for name in engines if name not in ENGINES]
+    if unknown or not engines:
+        raise pytest.UsageError(f"Invalid --engines {value!r}, expected a comma-separated subset of {ENGINES}")
+    return engines
+
+
+def requested(config) -> List[str]:
+    value = config.getoption("engines")
+    return parse_engines(value) if value else []
+
+
+def warn_unused(config, items) -> None:
+    """``--engines`` only reaches tests on the runner's browsers (page, context,
+    shared_page) and device_matrix tests; say so when none was collected."""
+    if requested(config) and not any(_runs_per_engine(item) for item in items):
+        warnings.warn(pytest.PytestWarning("--engines is set, but no collected test runs per engine; they all use BROWSER"))
+
+
+def _runs_per_engine(item) -> bool:
+    callspec = getattr(item, "callspec", None)
+    return (callspec is not None and "engine" in callspec.params) or "device_matrix" in getattr(item, "fixturenames", ())
+
+
+class EnginePool:
+    """All requested engines of a worker, launched concurrently and shared by its tests.
+
+    Launches start when the pool is created and are not awaited there: a test waits
+    only for the engine it uses, so the slower launches overlap with test work.
+    """
+
+    def __init__(self, playwright, engines: List[str]):
+        self.config = Config()
+        self.config._playwright = playwright
+        self.engines = engines
+        self.launch_s: Dict[str, float] = {}
+        self._launches = {engine: asyncio.ensure_future(self._launch(playwright, engine)) for engine in engines}
+
+    async def _launch(self, playwright, engine: str) -> Browser:
+        started = time.perf_counter()
+        browser = await self.config.launch_browser(playwright, engine)
+        self.launch_s[engine] = round(time.perf_counter() - started, 2)
+        logging.info(f"Engine pool: {engine} launched in {self.launch_s[engine]}s")
+        return browser
+
+    async def browser(self, engine: str) -> Browser:
+        return await self._launches[engine]
+
+    async def runner(self, engine: str) -> Config:
+        """A runner on the pool's ``engine`` browser, for the fixtures of a test
+        parametrized by --engines. The browser stays open for the worker's next test."""
+        runner = Config()
+        await runner.setup_browser(self.config._playwright, await self.browser(engine))
+        return runner
+
+    async def close(self) -> None:
+        for engine, launch in self._launches.items():
+            try:
+                await (await launch).close()
+            except Exception as e:
+                logging.warning(f"Engine pool: closing {engine} failed: {e}")
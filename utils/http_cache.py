@@ -0,0 +1,290 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import BrowserContext, Route
+
+from utils import network_audit, throttling, web_vitals
+
+HTTP_CACHE_DIR = ".cache/http"
+RESULTS_DIR = "reports/http_cache"
+DEFAULT_TTL = 24 * 3600  # longest heuristic freshness, for responses without max-age or Expires
+HEURISTIC_SHARE = 0.1  # heuristic freshness: a tenth of the time since Last-Modified (RFC 9111 4.2.2)
+CACHED_RESOURCE_TYPES = ("script", "stylesheet", "font", "image")
+# Per-client or per-connection headers are never replayed to another test's context.
+DROPPED_HEADERS = ("set-cookie", "content-encoding", "content-length", "transfer-encoding", "connection")
+
+_stats: Counter = Counter()
+
+
+def enabled() -> bool:
+    return os.getenv("http_cache", "off").lower() == "on"
+
+
+def ttl() -> float:
+    return float(os.getenv("http_cache_ttl", DEFAULT_TTL))
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _vary_path(url: str) -> str:
+    """Names of the request headers the responses for ``url`` vary on."""
+    return os.path.join(HTTP_CACHE_DIR, f"{_digest(url)}.vary")
+
+
+def _path(url: str, request_headers: Dict[str, str], vary: List[str]) -> str:
+    """Entry of ``url`` for the request's values of the ``vary`` headers."""
+    varied = "".join(f"\n{name}: {request_headers.get(name, '')}" for name in vary)
+    return os.path.join(HTTP_CACHE_DIR, _digest(url + varied))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write via a temp file and rename, so parallel workers never read a partial entry."""
+    handle, temp_path = tempfile.mkstemp(dir=HTTP_CACHE_DIR, prefix=".tmp-")
+    with os.fdopen(handle, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+def _directives(headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in headers.get("cache-control", "").lower().split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name] = value.strip('"') or None
+    return directives
+
+
+def _vary(headers: Dict[str, str]) -> List[str]:
+    return sorted({name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip()})
+
+
+def _cacheable(status: int, headers: Dict[str, str]) -> bool:
+    directives = _directives(headers)
+    return (
+        status == 200
+        and "no-store" not in directives
+        and "private" not in directives
+        and "*" not in _vary(headers)
+    )
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness(headers: Dict[str, str]) -> float:
+    """Seconds a response stays fresh: ``s-maxage``/``max-age``, else ``Expires``, else a
+    heuristic from ``Last-Modified`` capped at the TTL. ``no-cache`` is always stale, so
+    it is revalidated on every use."""
+    directives = _directives(headers)
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if directives.get(name, "").isdigit():
+            return float(directives[name])
+    date = _http_date(headers.get("date")) or time.time()
+    expires = _http_date(headers.get("expires"))
+    if "expires" in headers:
+        return max(0.0, expires - date) if expires is not None else 0.0
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is None:
+        return 0.0
+    return min(ttl(), max(0.0, date - last_modified) * HEURISTIC_SHARE)
+
+
+def _validators(meta: Dict[str, Any]) -> Dict[str, str]:
+    headers = meta["headers"]
+    validators = {}
+    if headers.get("etag"):
+        validators["if-none-match"] = headers["etag"]
+    if headers.get("last-modified"):
+        validators["if-modified-since"] = headers["last-modified"]
+    return validators
+
+
+def lookup(url: str, request_headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """The cached response for ``url`` matching the request's ``Vary`` headers, with
+    whether it is still ``fresh``."""
+    try:
+        with open(_vary_path(url), "r") as file:
+            vary = json.load(file)
+    except (OSError, ValueError):
+        vary = []
+    path = _path(url, request_headers, vary)
+    try:
+        with open(f"{path}.json", "r") as file:
+            meta = json.load(file)
+        with open(f"{path}.body", "rb") as file:
+            body = file.read()
+        age = time.time() - meta["stored_at"]
+        return {**meta, "body": body, "fresh": age < freshness(meta["headers"])}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store(url: str, request_headers: Dict[str, str], status: int, headers: Dict[str, str], body: bytes) -> None:
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    vary = _vary(headers)
+    _write_atomic(_vary_path(url), json.dumps(vary).encode("utf-8"))
+    path = _path(url, request_headers, vary)
+    _write_atomic(f"{path}.body", body)  # the body first: an entry exists once its meta does
+    age = headers.get("age", "")
+    meta = {
+        "url": url,
+        "status": status,
+        "headers": {k.lower(): v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+        "stored_at": time.time() - (int(age) if age.isdigit() else 0),
+    }
+    _write_atomic(f"{path}.json", json.dumps(meta).encode("utf-8"))
+
+
+def _serve(kind: str, cached: Dict[str, Any], outcome: str) -> None:
+    _stats[outcome] += 1
+    _stats[f"hits:{kind}"] += 1
+    _stats["bytes_saved"] += len(cached["body"])
+
+
+async def _handle(route: Route) -> None:
+    request = route.request
+    if request.method != "GET" or request.resource_type not in CACHED_RESOURCE_TYPES:
+        await route.fallback()
+        return
+
+    kind = request.resource_type
+    request_headers = {k.lower(): v for k, v in request.headers.items()}
+    cached = lookup(request.url, request_headers)
+    if cached is not None and cached["fresh"]:
+        _serve(kind, cached, "hits")
+        await route.fulfill(status=cached["status"], headers=cached["headers"], body=cached["body"])
+        return
+
+    validators = _validators(cached) if cached is not None else {}
+    try:
+        response = await route.fetch(headers={**request.headers, **validators} if validators else None)
+        body = await response.body()
+    except Exception as e:
+        logging.debug(f"HTTP cache: fetching {request.url} failed, passing through: {e}")
+        await route.fallback()
+        return
+
+    if response.status == 304 and validators:
+        # Still valid: serve the stored body under the refreshed headers.
+        headers = {**cached["headers"], **{k.lower(): v for k, v in response.headers.items()}}
+        try:
+            store(request.url, request_headers, cached["status"], headers, cached["body"])
+        except OSError as e:
+            logging.warning(f"HTTP cache: cannot refresh {request.url}: {e}")
+        _serve(kind, cached, "revalidated")
+        await route.fulfill(
+            status=cached["status"],
+            headers={k: v for k, v in headers.items() if k not in DROPPED_HEADERS},
+            body=cached["body"],
+        )
+        return
+
+    _stats["misses"] += 1
+    _stats[f"misses:{kind}"] += 1
+    _stats["bytes_downloaded"] += len(body)
+    headers = response.headers
+    if _cacheable(response.status, headers):
+        try:
+            store(request.url, request_headers, response.status, headers, body)
+            _stats["stored"] += 1
+        except OSError as e:
+            logging.warning(f"HTTP cache: cannot store {request.url}: {e}")
+    await route.fulfill(response=response, body=body)
+
+
+def bypassed(context: BrowserContext) -> Optional[str]:
+    """Why the context must see real network responses: disk hits would skip its
+    throttling, and web vitals and network audit numbers would measure the cache."""
+    profile = throttling.context_profile(context)
+    if profile:
+        return f"the context is throttled ({profile})"
+    if web_vitals.enabled():
+        return "web vitals are measured"
+    if network_audit.mode() != "off":
+        return "the network is audited"
+    return None
+
+
+async def attach(context: BrowserContext) -> None:
+    """Serve the context's static assets from the shared disk cache when --http-cache is on.
+
+    Only response bodies and headers are shared. Cookies, storage and the browser's
+    own cache stay per context.
+    """
+    if not enabled():
+        return
+    reason = bypassed(context)
+    if reason:
+        _stats["bypassed_contexts"] += 1
+        logging.debug(f"HTTP cache: not used because {reason}")
+        return
+    await context.route("**/*", _handle)
+
+
+def take_stats() -> Dict[str, int]:
+    stats = dict(_stats)
+    _stats.clear()
+    return stats
+
+
+def summarize(stats: Dict[str, int]) -> Dict[str, Any]:
+    hits = stats.get("hits", 0) + stats.get("revalidated", 0)
+    misses = stats.get("misses", 0)
+    by_type = {
+        kind: {"hits": stats.get(f"hits:{kind}", 0), "misses": stats.get(f"misses:{kind}", 0)}
+        for kind in CACHED_RESOURCE_TYPES
+    }
+    return {
+        "requests": hits + misses,
+        "hits": hits,
+        "revalidated": stats.get("revalidated", 0),
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        "stored": stats.get("stored", 0),
+        "bytes_saved": stats.get("bytes_saved", 0),
+        "bytes_downloaded": stats.get("bytes_downloaded", 0),
+        "by_type": by_type,
+        "bypassed_contexts": stats.get("bypassed_contexts", 0),
+    }
+
+
+def merge(into: Dict[str, int], stats: Dict[str, int]) -> None:
+    for key, value in stats.items():
+        into[key] = into.get(key, 0) + value
+
+
+def write_run_summary(config) -> Optional[Dict[str, Any]]:
+    stats = config._http_cache_stats
+    if not stats:
+        return None
+    summary = summarize(stats)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, "summary.json"), "w") as file:
+        json.dump(summary, file, indent=2)
+    return summary
+
+
+def terminal_line(config) -> Optional[str]:
+    stats = config._http_cache_stats
+    if not stats:
+        return None
+    summary = summarize(stats)
+    return (
+        f"HTTP cache: {summary['hits']}/{summary['requests']} static requests served from disk "
+        f"({summary['hit_rate']:.0%}), {summary['bytes_saved'] / 1e6:.1f} MB not downloaded"
+    )
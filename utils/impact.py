@@ -0,0 +1,215 @@
+import os
+import ast
+import inspect
+import logging
+import subprocess
+import textwrap
+from functools import lru_cache
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+# Changes to these run the whole suite: they shape every test without being imported
+# by one. Any conftest.py is treated the same way.
+SAFETY_FILES = (
+    "pytest.ini",
+    "requirements.txt",
+    "utils/browser_config.py",
+    "utils/pytest_config.py",
+)
+# Inputs read through a fixture rather than imported: a change under one of these
+# directories affects the tests that use the fixture.
+FIXTURE_INPUTS = {
+    "visual_baselines/": "visual",
+}
+
+
+def changed_files(ref: str, root: str) -> List[str]:
+    """Files changed since ``ref`` in the working tree, plus untracked files."""
+    def git(*args: str) -> List[str]:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise pytest.UsageError(f"--impacted-by: git {' '.join(args)} failed: {result.stderr.strip()}")
+        return [line for line in result.stdout.splitlines() if line]
+
+    return sorted(set(git("diff", "--name-only", ref)) | set(git("ls-files", "--others", "--exclude-standard")))
+
+
+class ImportGraph:
+    """Project-internal imports, resolved to paths relative to the repository root."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def module_file(self, dotted: str) -> Optional[str]:
+        base = dotted.replace(".", "/")
+        for candidate in (f"{base}.py", f"{base}/__init__.py"):
+            if os.path.isfile(os.path.join(self.root, candidate)):
+                return candidate
+        return None
+
+    @lru_cache(maxsize=None)
+    def bindings(self, path: str) -> Dict[str, str]:
+        """Name bound by each import in ``path`` -> file of the imported project module."""
+        try:
+            with open(os.path.join(self.root, path), "r") as file:
+                tree = ast.parse(file.read(), filename=path)
+        except (OSError, SyntaxError) as e:
+            logging.warning(f"Impact map: cannot parse {path}: {e}")
+            return {}
+
+        package = os.path.dirname(path).replace("/", ".")
+        bound: Dict[str, str] = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    target = self.module_file(alias.name)
+                    if target:
+                        bound[alias.asname or alias.name.split(".")[0]] = target
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if node.level:
+                    parent = package.split(".")[: len(package.split(".")) - node.level + 1]
+                    module = ".".join(filter(None, [*parent, module]))
+                for alias in node.names:
+                    target = self.module_file(f"{module}.{alias.name}") or self.module_file(module)
+                    if target:
+                        bound[alias.asname or alias.name] = target
+        return bound
+
+    @lru_cache(maxsize=None)
+    def strings(self, path: str) -> frozenset:
+        """String literals in ``path`` that look like file names (``name.ext`` or a path)."""
+        try:
+            with open(os.path.join(self.root, path), "r") as file:
+                tree = ast.parse(file.read(), filename=path)
+        except (OSError, SyntaxError):
+            return frozenset()
+        return frozenset(
+            node.value.strip().lstrip("./")
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Constant) and isinstance(node.value, str)
+            and "." in os.path.basename(node.value.strip()) and not any(c.isspace() for c in node.value.strip())
+        )
+
+    @lru_cache(maxsize=None)
+    def closure(self, path: str) -> frozenset:
+        """``path`` and every project file it imports, transitively."""
+        seen: Set[str] = set()
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            pending.extend(self.bindings(current).values())
+        return frozenset(seen)
+
+
+def _relative(path: str, root: str) -> str:
+    return os.path.relpath(path, root).replace(os.sep, "/")
+
+
+def _fixture_dependencies(func, graph: ImportGraph) -> Set[str]:
+    """The fixture's own file (unless it is a conftest) and the project modules its body uses."""
+    func = inspect.unwrap(func)  # pytest-asyncio wraps async fixtures
+    try:
+        path = _relative(inspect.getsourcefile(func), graph.root)
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError, ValueError):
+        return set()
+    if path.startswith(".."):
+        return set()  # fixture from an installed plugin
+
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    bindings = graph.bindings(path)
+    dependencies = {path} if os.path.basename(path) != "conftest.py" else set()
+    for name in names & set(bindings):
+        dependencies |= graph.closure(bindings[name])
+    return dependencies
+
+
+def dependencies_of(item, graph: ImportGraph) -> Set[str]:
+    """Files a test depends on: its module's import closure and the fixtures it uses."""
+    dependencies = set(graph.closure(_relative(str(item.path), graph.root)))
+    for fixturedefs in item._fixtureinfo.name2fixturedefs.values():
+        for fixturedef in fixturedefs:
+            dependencies |= _fixture_dependencies(fixturedef.func, graph)
+    return dependencies
+
+
+def data_readers(changed: List[str], graph: ImportGraph, modules: Set[str]) -> Set[str]:
+    """Modules among ``modules`` that name a changed non-Python file, by its path or file name."""
+    data = [path for path in changed if not path.endswith(".py")]
+    return {
+        module
+        for module in modules
+        for name in graph.strings(module)
+        if any(path == name or path.endswith(f"/{name}") for path in data)
+    }
+
+
+def _uses_changed_input(item, changed: List[str]) -> bool:
+    return any(
+        fixture in item.fixturenames and any(path.startswith(prefix) for path in changed)
+        for prefix, fixture in FIXTURE_INPUTS.items()
+    )
+
+
+def _conftest_modules(root: str, graph: ImportGraph, items) -> Set[str]:
+    conftests = {_relative(str(item.path.parent / "conftest.py"), root) for item in items}
+    conftests.add("conftest.py")
+    modules: Set[str] = set()
+    for conftest in conftests:
+        if os.path.isfile(os.path.join(root, conftest)):
+            modules |= set(graph.bindings(conftest).values())
+    return modules
+
+
+def select_impacted(config, items) -> None:
+    """Deselect tests that no file changed since ``--impacted-by`` can affect."""
+    ref = config.getoption("impacted_by")
+    if not ref:
+        return
+
+    root = str(config.rootpath)
+    changed = changed_files(ref, root)
+    graph = ImportGraph(root)
+
+    fallback = [path for path in changed if path in SAFETY_FILES or os.path.basename(path) == "conftest.py"]
+    dependencies = {item.nodeid: dependencies_of(item, graph) for item in items}
+    used = set().union(*dependencies.values()) if dependencies else set()
+    # Plugins imported by conftest but used by no fixture (hooks, schedulers) affect every test.
+    fallback += [path for path in changed if path in _conftest_modules(root, graph, items) - used]
+
+    if fallback:
+        config._impact_summary = (
+            f"impact selection: full suite, shared infrastructure changed ({', '.join(sorted(set(fallback)))})"
+        )
+        return
+
+    affecting = set(changed) | data_readers(changed, graph, used)
+
+    def impacted(item) -> bool:
+        return bool(dependencies[item.nodeid] & affecting) or _uses_changed_input(item, changed)
+
+    selected = [item for item in items if impacted(item)]
+    deselected = [item for item in items if not impacted(item)]
+    config._impact_summary = (
+        f"impact selection: {len(selected)}/{len(items)} tests affected by {len(changed)} files changed since {ref}"
+    )
+    config._impact_empty = bool(items) and not selected
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def allow_empty_selection(session) -> None:
+    """Nothing impacted is a pass, not pytest's "no tests collected" (exit code 5)."""
+    if getattr(session.config, "_impact_empty", False) and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+        session.exitstatus = pytest.ExitCode.OK
+
+
+def report_lines(config) -> List[str]:
+    summary = getattr(config, "_impact_summary", None)
+    return [summary] if summary else []
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+import sys
+import json
+import math
+import asyncio
+import logging
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from playwright.async_api import APIResponse, async_playwright
+
+project_root = str(Path(__file__).parent.parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sources.api.__base import BaseService  # noqa: E402
+from utils.token_pool import TokenPool  # noqa: E402
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+BUCKET_GROWTH = 1.01  # ~1% relative precision per histogram bucket
+DEFAULT_MAX_IN_FLIGHT = 10000
+DEFAULT_TIMEOUT = 30.0  # seconds, as Playwright's API requests
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with ~1% precision and constant-time inserts."""
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        bucket = int(math.log(max(latency_ms, 0.001) * 1000, BUCKET_GROWTH))
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.count += 1
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, percent: float) -> float:
+        if not self.count:
+            return 0.0
+        target = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self._counts):
+            seen += self._counts[bucket]
+            if seen >= target:
+                return min(BUCKET_GROWTH ** (bucket + 1) / 1000, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, float]:
+        summary = {f"p{p:g}_ms": round(self.percentile(p), 2) for p in PERCENTILES}
+        summary["max_ms"] = round(self.max_ms, 2)
+        return summary
+
+
+class ArrivalSchedule:
+    """Intended send times for a constant or linearly ramping arrival rate."""
+
+    def __init__(self, rate: float, duration: float, ramp_to: Optional[float] = None):
+        end_rate = rate if ramp_to is None else ramp_to
+        if rate < 0 or end_rate < 0:
+            raise ValueError("rate and ramp_to must not be negative")
+        if duration <= 0 or rate + end_rate <= 0:
+            raise ValueError("duration and the rate at start or end must be positive")
+        self.rate = rate
+        self.end_rate = end_rate
+        self.duration = duration
+        # N(t) = r0 * t + (r1 - r0) * t^2 / (2T); solved for t to place request n.
+        self._accel = (self.end_rate - self.rate) / (2 * duration)
+        self.total = int(rate * duration + self._accel * duration ** 2)
+
+    def send_time(self, n: int) -> float:
+        """Seconds after start at which request ``n`` should be sent."""
+        if abs(self._accel) < 1e-12:
+            return n / self.rate
+        # max(): rounding can take the discriminant just below zero at the end of a ramp down.
+        return (-self.rate + math.sqrt(max(0.0, self.rate ** 2 + 4 * self._accel * n))) / (2 * self._accel)
+
+
+@dataclass
+class LoadReport:
+    """Outcome of an open-loop run. ``corrected`` latencies count from intended send time;
+    requests dropped at the in-flight limit are counted in it at the request timeout."""
+
+    offered: int = 0
+    completed: int = 0
+    errors: int = 0
+    dropped: int = 0
+    elapsed: float = 0.0
+    max_send_lag_ms: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    corrected: LatencyHistogram = field(default_factory=LatencyHistogram)
+    uncorrected: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def achieved_rate(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "offered": self.offered,
+            "completed": self.completed,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "elapsed_s": round(self.elapsed, 3),
+            "achieved_rps": round(self.achieved_rate, 1),
+            "max_send_lag_ms": round(self.max_send_lag_ms, 2),
+            "status_counts": self.status_counts,
+            "corrected": self.corrected.to_dict(),
+            "uncorrected": self.uncorrected.to_dict(),
+        }
+
+
+class OpenLoopGenerator:
+    """Send requests at a fixed or ramping arrival rate, regardless of response times.
+
+    Unlike Locust's closed-loop users, a slow backend does not lower the offered
+    load: requests keep being dispatched on schedule. Latency is measured from the
+    *intended* send time, so queueing in the generator or the server is included
+    (coordinated-omission correction); service-time-only latency is kept alongside.
+    """
+
+    def __init__(
+        self,
+        service: BaseService,
+        send: Callable[[BaseService], Awaitable[APIResponse]],
+        rate: float,
+        duration: float,
+        ramp_to: Optional[float] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.service = service
+        self.send = send
+        self.schedule = ArrivalSchedule(rate, duration, ramp_to)
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.report = LoadReport()
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def _issue(self, intended: float) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self.report.max_send_lag_ms = max(self.report.max_send_lag_ms, (started - intended) * 1000)
+        try:
+            response = await asyncio.wait_for(self.send(self.service), self.timeout)
+            status = response.status
+            if not response.ok:
+                self.report.errors += 1
+            await response.dispose()
+        except Exception as e:
+            logging.debug(f"Open-loop request failed: {e}")
+            status = 0
+            self.report.errors += 1
+
+        finished = loop.time()
+        self.report.completed += 1
+        self.report.status_counts[status] = self.report.status_counts.get(status, 0) + 1
+        self.report.corrected.record((finished - intended) * 1000)
+        self.report.uncorrected.record((finished - started) * 1000)
+
+    async def run(self) -> LoadReport:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        n = 0
+
+        while n < self.schedule.total:
+            now = loop.time() - start
+            # Dispatch every request that is due, in one batch, so timer granularity
+            # doesn't cap the rate.
+            while n < self.schedule.total and self.schedule.send_time(n) <= now:
+                intended = start + self.schedule.send_time(n)
+                n += 1
+                self.report.offered += 1
+                if len(self._in_flight) >= self.max_in_flight:
+                    # Never sent: left out, the corrected percentiles would hide the overload.
+                    self.report.dropped += 1
+                    self.report.corrected.record(self.timeout * 1000)
+                    continue
+                task = asyncio.ensure_future(self._issue(intended))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+            if n < self.schedule.total:
+                await asyncio.sleep(max(0.0, start + self.schedule.send_time(n) - loop.time()))
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        self.report.elapsed = loop.time() - start
+        return self.report
+
+
+async def run_open_loop(
+    endpoint: str,
+    rate: float,
+    duration: float,
+    ramp_to: Optional[float] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    token_pool: Optional[TokenPool] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> LoadReport:
+    """GET ``endpoint`` through ``BaseService`` at the given arrival rate.
+
+    With a ``token_pool``, each request carries the cookies of the next pooled account.
+    """
+    async with async_playwright() as playwright:
+        request_context = await playwright.request.new_context(ignore_https_errors=True)
+        try:
+            service = BaseService(request_context, attach_details=False)
+
+            def send(api):
+                if token_pool:
+                    return api.get(endpoint, headers=token_pool.acquire().headers)
+                return api.get(endpoint)
+
+            generator = OpenLoopGenerator(service, send, rate, duration, ramp_to, max_in_flight, timeout)
+            return await generator.run()
+        finally:
+            await request_context.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Open-loop constant-arrival-rate load generator")
+    parser.add_argument("--endpoint", default="open_api/boxes", help="Endpoint relative to API_URL")
+    parser.add_argument("--rate", type=float, required=True, help="Requests per second at start")
+    parser.add_argument("--ramp-to", type=float, help="Requests per second at the end (linear ramp)")
+    parser.add_argument("--duration", type=float, default=30, help="Run time in seconds")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT,
+        help="Seconds before a request counts as failed; dropped requests are recorded at this latency",
+    )
+    parser.add_argument(
+        "--authenticated", action="store_true",
+        help="Send cookies from the token pool (see utils/token_pool.py)",
+    )
+    args = parser.parse_args()
+
+    pool = TokenPool() if args.authenticated else None
+    load_report = asyncio.run(
+        run_open_loop(args.endpoint, args.rate, args.duration, args.ramp_to, args.max_in_flight, pool, args.timeout)
+    )
+    print(json.dumps(load_report.to_dict(), indent=2))
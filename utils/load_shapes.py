@@ -0,0 +1,98 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from locust import LoadTestShape, events
+
+DEFAULT_DURATION = 600  # seconds, used when --run-time is not given
+
+# A stage is (end_time_s, target_users, spawn_rate); stages run in order.
+Stage = Tuple[float, int, float]
+
+
+def constant_stages(users: int, spawn_rate: float, duration: float) -> List[Stage]:
+    """Spawn at the given rate, then hold."""
+    return [(duration, users, spawn_rate)]
+
+
+def ramp_stages(users: int, spawn_rate: float, duration: float) -> List[Stage]:
+    """Linear ramp to peak over 70% of the run, hold for 20%, ramp down in the last 10%."""
+    ramp_up, hold = duration * 0.7, duration * 0.2
+    return [
+        (ramp_up, users, users / ramp_up),
+        (ramp_up + hold, users, users),
+        (duration, 0, users / (duration - ramp_up - hold)),
+    ]
+
+
+def step_stages(users: int, spawn_rate: float, duration: float, steps: int = 5) -> List[Stage]:
+    """Increase load in equal steps of ``users / steps`` and equal time."""
+    step_time = duration / steps
+    return [
+        (step_time * (i + 1), math.ceil(users * (i + 1) / steps), spawn_rate)
+        for i in range(steps)
+    ]
+
+
+def spike_stages(users: int, spawn_rate: float, duration: float) -> List[Stage]:
+    """Hold a 20% baseline, jump to peak at 40% of the run for 15%, then fall back."""
+    baseline = max(1, users // 5)
+    return [
+        (duration * 0.4, baseline, spawn_rate),
+        (duration * 0.55, users, max(spawn_rate, users)),
+        (duration, baseline, max(spawn_rate, users)),
+    ]
+
+
+def soak_stages(users: int, spawn_rate: float, duration: float) -> List[Stage]:
+    """Reach peak within the first 5% of the run and hold it for the rest (use a long --run-time)."""
+    ramp_up = duration * 0.05
+    return [(ramp_up, users, max(spawn_rate, users / ramp_up)), (duration, users, spawn_rate)]
+
+
+PROFILES: Dict[str, Callable[[int, float, float], List[Stage]]] = {
+    "constant": constant_stages,
+    "ramp": ramp_stages,
+    "step": step_stages,
+    "spike": spike_stages,
+    "soak": soak_stages,
+}
+
+
+@events.init_command_line_parser.add_listener
+def _add_profile_options(parser):
+    parser.add_argument(
+        "--load-profile",
+        choices=sorted(PROFILES),
+        default="constant",
+        help="Load shape scaled to --users (peak) and --run-time (total duration)",
+    )
+
+
+class ProfileShape(LoadTestShape):
+    """Shape that follows the profile selected with ``--load-profile``.
+
+    Abstract so it is not picked up by merely importing this module; a locustfile
+    enables it by subclassing it.
+    """
+
+    abstract = True
+    use_common_options = True
+
+    def __init__(self):
+        super().__init__()
+        self._stages: Optional[List[Stage]] = None
+
+    def stages(self) -> List[Stage]:
+        if self._stages is None:
+            options = self.runner.environment.parsed_options
+            profile = PROFILES[getattr(options, "load_profile", "constant")]
+            duration = getattr(options, "run_time", None) or DEFAULT_DURATION
+            self._stages = profile(options.num_users or 1, options.spawn_rate or 1, duration)
+        return self._stages
+
+    def tick(self):
+        run_time = self.get_run_time()
+        for end_time, users, spawn_rate in self.stages():
+            if run_time < end_time:
+                return users, spawn_rate
+        return None
@@ -0,0 +1,147 @@
+import json
+from contextlib import contextmanager
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional, TypeVar
+from urllib.parse import urlencode
+
+from sources.api.__base import BaseService
+
+T = TypeVar("T")
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run an API client coroutine to completion without an event loop.
+
+    Clients backed by the adapters below never really suspend: every awaited call
+    returns synchronously from Locust's (gevent-cooperative) HTTP session. That lets
+    Locust tasks reuse ``HomeClient``/``ReqresClient`` methods unchanged.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("Coroutine suspended: run_sync only supports adapter-backed clients")
+
+
+class LocustResponse:
+    """The subset of Playwright's ``APIResponse`` used by the API clients."""
+
+    def __init__(self, response):
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return self._response.status_code or 0
+
+    @property
+    def status_text(self) -> str:
+        return getattr(self._response, "reason", "") or ""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {k.lower(): v for k, v in (self._response.headers or {}).items()}
+
+    async def body(self) -> bytes:
+        return self._response.content or b""
+
+    async def text(self) -> str:
+        return self._response.text or ""
+
+    async def json(self) -> Any:
+        return json.loads(self._response.text or "")
+
+
+class LocustRequestContext:
+    """Stand-in for Playwright's ``APIRequestContext`` on top of a Locust HTTP session.
+
+    Works with both ``HttpUser`` and ``FastHttpUser`` clients.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self._name: Optional[str] = None
+        self._check: Optional[Callable[[LocustResponse], List[str]]] = None
+
+    @contextmanager
+    def named(self, name: str) -> Iterator[None]:
+        """Group requests under ``name`` in Locust stats, e.g. ``open_api/boxes/[id]``."""
+        previous, self._name = self._name, name
+        try:
+            yield
+        finally:
+            self._name = previous
+
+    @contextmanager
+    def validated(self, check: Callable[[LocustResponse], List[str]]) -> Iterator[None]:
+        """Mark requests as failed in Locust stats when ``check`` returns errors."""
+        previous, self._check = self._check, check
+        try:
+            yield
+        finally:
+            self._check = previous
+
+    def fetch(self, method: str, url: str, **kwargs) -> LocustResponse:
+        params = kwargs.pop("params", None)
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+        # Playwright serialises dict payloads as JSON; mirror that here.
+        data = kwargs.pop("data", None)
+        json_data = kwargs.pop("json_data", None)
+        if isinstance(data, dict):
+            json_data, data = data, None
+
+        request_kwargs = {
+            "name": self._name or url.split("?")[0],
+            "headers": kwargs.pop("headers", None),
+            "data": data,
+            "json": json_data,
+        }
+        if self._check is None:
+            return LocustResponse(self.session.request(method, url, **request_kwargs))
+
+        # Only successful responses are checked; otherwise Locust's own verdict stands.
+        with self.session.request(method, url, catch_response=True, **request_kwargs) as raw:
+            response = LocustResponse(raw)
+            if not response.ok:
+                return response
+            try:
+                errors = self._check(response)
+            except Exception as e:
+                errors = [f"Validation error: {e}"]
+            if errors:
+                raw.failure("; ".join(errors))
+        return response
+
+    async def get(self, url: str, **kwargs) -> LocustResponse:
+        return self.fetch("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> LocustResponse:
+        return self.fetch("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> LocustResponse:
+        return self.fetch("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> LocustResponse:
+        return self.fetch("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> LocustResponse:
+        return self.fetch("DELETE", url, **kwargs)
+
+
+class LocustService(BaseService):
+    """``BaseService`` that sends through Locust and skips per-request Allure attachments."""
+
+    def __init__(self, request_context: LocustRequestContext):
+        super().__init__(request_context)
+
+    async def _make_request(self, method: str, url: str, **kwargs) -> LocustResponse:
+        return self.request.fetch(method, url, **kwargs)
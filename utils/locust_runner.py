@@ -0,0 +1,267 @@
+import os
+import re
+import csv
+import glob
+import sys
+import json
+import socket
+import logging
+import subprocess
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import allure
+import pytest
+import yaml
+
+LOCUSTFILE = "tests/performance/locustfile.py"
+RESULTS_DIR = "reports/locust"
+STARTUP_GRACE = 60  # seconds allowed on top of run_time for spawn, connect and shutdown
+
+# Marker kwargs that describe the load; everything else is a threshold.
+LOAD_OPTIONS = ("users", "spawn_rate", "run_time", "shape", "workers", "locustfile", "extra_args")
+# Marker thresholds and the aggregated SLOs of utils/slo_monitor.py that check them.
+THRESHOLD_SLOS = {"min_rps": "min_rps", "max_p95_ms": "p95_ms", "max_avg_ms": "avg_ms", "max_error_rate": "error_rate"}
+THRESHOLDS = tuple(THRESHOLD_SLOS)
+
+
+def parse_run_time(run_time: str) -> int:
+    """Convert a Locust run time such as ``1h30m``, ``90s`` or ``5m`` to seconds."""
+    parts = re.findall(r"(\d+)\s*([hms]?)", str(run_time))
+    if not parts:
+        raise ValueError(f"Invalid run_time: {run_time}")
+    factors = {"h": 3600, "m": 60, "s": 1, "": 1}
+    return sum(int(value) * factors[unit] for value, unit in parts)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@dataclass
+class LocustResult:
+    """Aggregated and per-endpoint stats of one distributed Locust run."""
+
+    name: str
+    exit_code: int
+    aggregated: Dict[str, float] = field(default_factory=dict)
+    endpoints: List[Dict[str, Any]] = field(default_factory=list)
+    thresholds: Dict[str, float] = field(default_factory=dict)
+    violations: List[str] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        return int(self.aggregated.get("requests", 0))
+
+    @property
+    def error_rate(self) -> float:
+        return self.aggregated.get("failures", 0) / self.requests if self.requests else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "exit_code": self.exit_code,
+            "aggregated": self.aggregated,
+            "error_rate": self.error_rate,
+            "endpoints": self.endpoints,
+            "thresholds": self.thresholds,
+            "violations": self.violations,
+        }
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.name}: {self.requests} requests, "
+            f"{self.aggregated.get('rps', 0):.1f} req/s, "
+            f"p95 {self.aggregated.get('p95_ms', 0):.0f} ms, "
+            f"errors {self.error_rate:.2%}"
+        ]
+        lines += [f"  FAILED {violation}" for violation in self.violations]
+        return "\n".join(lines)
+
+
+def _stats_row(row: Dict[str, str]) -> Dict[str, Any]:
+    def number(column: str) -> float:
+        value = row.get(column) or "0"
+        return float(value) if value != "N/A" else 0.0
+
+    return {
+        "type": row.get("Type", ""),
+        "name": row.get("Name", ""),
+        "requests": number("Request Count"),
+        "failures": number("Failure Count"),
+        "rps": number("Requests/s"),
+        "avg_ms": number("Average Response Time"),
+        "p50_ms": number("50%"),
+        "p95_ms": number("95%"),
+        "p99_ms": number("99%"),
+        "max_ms": number("Max Response Time"),
+    }
+
+
+def write_slo_file(path: str, thresholds: Dict[str, float]) -> None:
+    """Marker thresholds as aggregated SLOs, for the run's SLO monitor (``--slo-file``)."""
+    with open(path, "w") as file:
+        yaml.safe_dump({"aggregated": {THRESHOLD_SLOS[name]: limit for name, limit in thresholds.items()}}, file)
+
+
+def run_violations(result: "LocustResult", slo_report: Optional[str]) -> List[str]:
+    """One message per threshold the SLO monitor's report failed, plus a failed run it does not explain."""
+    threshold_names = {slo: name for name, slo in THRESHOLD_SLOS.items()}
+    violations = []
+    report = None
+    if slo_report:
+        if os.path.exists(slo_report):
+            with open(slo_report, "r") as file:
+                report = json.load(file)
+        else:
+            violations.append("no SLO report was written")
+    if report:
+        if report.get("aborted"):
+            violations.append(f"run aborted: {report['aborted']}")
+        for check in report.get("results", []):
+            if not check["passed"]:
+                violations.append(
+                    f"{threshold_names.get(check['slo'], check['slo'])}: {check['actual']:.3f} "
+                    f"({check['endpoint']}, limit {check['target']})"
+                )
+    # The master exits 1 on an SLO breach; any other non-zero exit is a crash or a timeout.
+    if result.exit_code != 0 and not (report and not report.get("passed", True)):
+        violations.append(f"Locust master exited with code {result.exit_code}")
+    if not result.requests:
+        violations.append("no requests were recorded")
+    return violations
+
+
+class LocustRunner:
+    """Run a headless Locust master plus local worker processes and collect its stats."""
+
+    def __init__(
+        self,
+        name: str,
+        users: int = 10,
+        spawn_rate: float = 2,
+        run_time: str = "1m",
+        shape: str = "constant",
+        workers: Optional[int] = None,
+        locustfile: str = LOCUSTFILE,
+        extra_args: Optional[List[str]] = None,
+        results_dir: str = RESULTS_DIR,
+    ):
+        self.name = re.sub(r"[^\w.-]+", "_", name)
+        self.users = users
+        self.spawn_rate = spawn_rate
+        self.run_time = run_time
+        self.shape = shape
+        self.workers = workers or os.cpu_count() or 1
+        self.locustfile = locustfile
+        self.extra_args = list(extra_args or [])
+        self.results_dir = results_dir
+
+    @property
+    def csv_prefix(self) -> str:
+        return os.path.join(self.results_dir, self.name)
+
+    def _locust_cmd(self, *args: str) -> List[str]:
+        return [sys.executable, "-m", "locust", "-f", self.locustfile, *args, *self.extra_args]
+
+    def run(self) -> LocustResult:
+        os.makedirs(self.results_dir, exist_ok=True)
+        # A master that dies before writing its CSVs must not be judged on the previous run's.
+        for stale in glob.glob(f"{glob.escape(self.csv_prefix)}_*.csv"):
+            os.remove(stale)
+        port = _free_port()
+        timeout = parse_run_time(self.run_time) + STARTUP_GRACE
+
+        master = subprocess.Popen(self._locust_cmd(
+            "--master", "--headless", "--only-summary",
+            "--master-bind-host", "127.0.0.1", "--master-bind-port", str(port),
+            "--expect-workers", str(self.workers),
+            "--users", str(self.users), "--spawn-rate", str(self.spawn_rate),
+            "--run-time", self.run_time, "--load-profile", self.shape,
+            "--csv", self.csv_prefix,
+            # Failed requests are judged by the error-rate threshold, not by the exit code.
+            "--exit-code-on-error", "0",
+        ))
+        workers = [
+            subprocess.Popen(
+                self._locust_cmd("--worker", "--master-host", "127.0.0.1", "--master-port", str(port)),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for _ in range(self.workers)
+        ]
+
+        try:
+            exit_code = master.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logging.error(f"Locust master for {self.name} exceeded {timeout}s, terminating")
+            master.kill()
+            exit_code = master.wait()
+        finally:
+            for worker in workers:
+                try:
+                    worker.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    worker.kill()
+
+        return self._collect(exit_code)
+
+    def _collect(self, exit_code: int) -> LocustResult:
+        result = LocustResult(name=self.name, exit_code=exit_code)
+        stats_file = f"{self.csv_prefix}_stats.csv"
+        if not os.path.exists(stats_file):
+            logging.error(f"Locust produced no stats at {stats_file}")
+            return result
+
+        with open(stats_file, newline="") as file:
+            for row in csv.DictReader(file):
+                stats = _stats_row(row)
+                if stats["name"] == "Aggregated":
+                    result.aggregated = {k: v for k, v in stats.items() if k not in ("type", "name")}
+                else:
+                    result.endpoints.append(stats)
+        return result
+
+
+def run_marked_load(request) -> LocustResult:
+    """Run the load declared by the test's ``performance`` marker and report it."""
+    marker = request.node.get_closest_marker("performance")
+    options = dict(marker.kwargs) if marker else {}
+    unknown = set(options) - set(LOAD_OPTIONS) - set(THRESHOLDS)
+    if unknown:
+        raise pytest.UsageError(f"Unknown performance marker options: {sorted(unknown)}")
+
+    runner = LocustRunner(
+        request.node.name, **{k: v for k, v in options.items() if k in LOAD_OPTIONS}
+    )
+    # Thresholds are checked by the run's SLO monitor, live and on the final stats.
+    thresholds = {k: v for k, v in options.items() if k in THRESHOLDS}
+    slo_file, slo_report = f"{runner.csv_prefix}_slo.yaml", f"{runner.csv_prefix}_slo.json"
+    if thresholds:
+        os.makedirs(runner.results_dir, exist_ok=True)
+        write_slo_file(slo_file, thresholds)
+        if os.path.exists(slo_report):
+            os.remove(slo_report)
+        runner.extra_args += ["--slo-file", slo_file, "--slo-report", slo_report]
+    result = runner.run()
+    result.thresholds = thresholds
+    result.violations = run_violations(result, slo_report if thresholds else None)
+
+    report = json.dumps(result.to_dict(), indent=2)
+    with open(f"{runner.csv_prefix}.json", "w") as file:
+        file.write(report)
+    allure.attach(report, "Locust Results", allure.attachment_type.JSON)
+    allure.attach(result.summary(), "Locust Summary", allure.attachment_type.TEXT)
+    return result
+
+
+def skip_performance_tests(config, items) -> None:
+    """Performance tests start real load, so they only run with ``--performance``."""
+    if config.getoption("performance"):
+        return
+    skip = pytest.mark.skip(reason="Performance tests need --performance")
+    for item in items:
+        if item.get_closest_marker("performance"):
+            item.add_marker(skip)
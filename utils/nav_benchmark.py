@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+project_root = str(Path(__file__).parent.parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from sources.web.admin.login_page import LoginPage  # noqa: E402
+from sources.web.client.home_page import HomePage  # noqa: E402
+from utils.browser_config import Config  # noqa: E402
+from utils.network_audit import NetworkAuditor  # noqa: E402
+from utils.throttling import THROTTLING_PROFILES, ready as throttling_ready, throttle_context  # noqa: E402
+from utils.web_vitals import COLLECT_SCRIPT, LONG_TASK_MS, VITALS_SCRIPT  # noqa: E402
+
+RESULTS_DIR = "reports/nav_benchmark"
+HISTORY_FILE = f"{RESULTS_DIR}/history.jsonl"
+PAGES = {"home": HomePage, "login": LoginPage}
+TIMING_METRICS = ("open_ms", "ttfb", "fcp", "lcp", "load")
+
+
+def distribution(values: List[float]) -> Dict[str, float]:
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return {}
+    return {
+        "min": round(values[0], 1),
+        "p50": round(statistics.median(values), 1),
+        "p95": round(values[max(0, -(-len(values) * 95 // 100) - 1)], 1),
+        "max": round(values[-1], 1),
+        "mean": round(statistics.fmean(values), 1),
+    }
+
+
+class NavigationBenchmark:
+    """Open a page object N times in fresh contexts (cold) and N times in one context (warm).
+
+    The warm context is primed with one extra, unmeasured visit, so every measured warm
+    visit can hit the HTTP cache and an installed service worker.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        runner: Config,
+        page_name: str,
+        iterations: int = 10,
+        platform: str = "desktop",
+        throttle: Optional[str] = None,
+    ):
+        self.browser = browser
+        self.runner = runner
+        self.page_class = PAGES[page_name]
+        self.page_name = page_name
+        self.iterations = iterations
+        self.platform = platform
+        self.throttle = throttle
+
+    async def _new_context(self) -> BrowserContext:
+        context = await self.browser.new_context(**self.runner.device_options(self.platform))
+        if self.throttle:
+            throttle_context(context, self.throttle)
+        await context.add_init_script(VITALS_SCRIPT)
+        return context
+
+    async def _visit(self, context: BrowserContext, auditor: NetworkAuditor) -> Dict[str, Any]:
+        page = await context.new_page()
+        await throttling_ready(page)
+        auditor.begin()
+        started = time.perf_counter()
+        await self.page_class(page).open()
+        open_ms = (time.perf_counter() - started) * 1000
+        metrics = await page.evaluate(COLLECT_SCRIPT, LONG_TASK_MS)
+        responses = await auditor.flush()
+        await page.close()
+        return {
+            "open_ms": open_ms,
+            "ttfb": metrics["ttfb"],
+            "fcp": metrics["fcp"],
+            "lcp": metrics["lcp"],
+            "load": metrics["load"],
+            "requests": len(responses),
+            "transfer_bytes": sum(r["transfer_bytes"] for r in responses),
+            "cached_responses": sum(
+                1 for r in responses if r["status"] == 304 or (r["status"] == 200 and r["body_bytes"] == 0)
+            ),
+            "service_worker_responses": sum(1 for r in responses if r["from_service_worker"]),
+        }
+
+    async def cold(self) -> List[Dict[str, Any]]:
+        visits = []
+        for _ in range(self.iterations):
+            context = await self._new_context()
+            try:
+                visits.append(await self._visit(context, NetworkAuditor(context)))
+            finally:
+                await context.close()
+        return visits
+
+    async def warm(self) -> List[Dict[str, Any]]:
+        context = await self._new_context()
+        auditor = NetworkAuditor(context)
+        try:
+            await self._visit(context, auditor)  # priming visit, not measured
+            return [await self._visit(context, auditor) for _ in range(self.iterations)]
+        finally:
+            await context.close()
+
+    @staticmethod
+    def summarize(visits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        summary = {metric: distribution([v[metric] for v in visits]) for metric in TIMING_METRICS}
+        for metric in ("requests", "transfer_bytes", "cached_responses", "service_worker_responses"):
+            summary[metric] = distribution([v[metric] for v in visits])
+        return summary
+
+    async def run(self) -> Dict[str, Any]:
+        cold = self.summarize(await self.cold())
+        warm = self.summarize(await self.warm())
+
+        def ratio(metric: str) -> Optional[float]:
+            cold_p50 = cold[metric].get("p50")
+            warm_p50 = warm[metric].get("p50")
+            return round(warm_p50 / cold_p50, 3) if cold_p50 and warm_p50 is not None else None
+
+        return {
+            "page": self.page_name,
+            "platform": self.platform,
+            "throttle": self.throttle,
+            "iterations": self.iterations,
+            "cold": cold,
+            "warm": warm,
+            "caching": {
+                "open_ms_warm_to_cold": ratio("open_ms"),
+                "load_warm_to_cold": ratio("load"),
+                "transfer_bytes_warm_to_cold": ratio("transfer_bytes"),
+            },
+        }
+
+
+async def run_benchmark(
+    page_names: List[str], iterations: int, platform: str, throttle: Optional[str]
+) -> List[Dict[str, Any]]:
+    async with async_playwright() as playwright:
+        runner = Config()
+        await runner.setup_browser(playwright)
+        try:
+            return [
+                await NavigationBenchmark(runner.browser, runner, name, iterations, platform, throttle).run()
+                for name in page_names
+            ]
+        finally:
+            await runner.browser.close()
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent.parent / ".env")
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Cold vs warm navigation benchmark for page objects")
+    parser.add_argument("--pages", nargs="+", choices=sorted(PAGES), default=["home"])
+    parser.add_argument("--iterations", type=int, default=10, help="Measured visits per mode")
+    parser.add_argument("--platform", choices=("desktop", "mobile"), default="desktop")
+    parser.add_argument("--throttle", choices=sorted(THROTTLING_PROFILES), help="Throttling profile (Chromium only)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--label", help="Release or build label stored with the results in the history file")
+    args = parser.parse_args()
+    os.environ["headless"] = str(not args.headed)
+
+    results = asyncio.run(run_benchmark(args.pages, args.iterations, args.platform, args.throttle))
+    print(json.dumps(results, indent=2))
+
+    Path(RESULTS_DIR).mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_FILE, "a") as history:
+        for result in results:
+            history.write(json.dumps({"label": args.label, "timestamp": int(time.time()), **result}) + "\n")
@@ -0,0 +1,262 @@
+import os
+import re
+import json
+import asyncio
+import logging
+import weakref
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import allure
+import yaml
+from playwright.async_api import BrowserContext, Page, Request
+
+RESULTS_DIR = "reports/network_audit"
+TEXT_TYPES = re.compile(r"text/|javascript|json|xml|svg|css")
+COMPRESSED_ENCODINGS = ("gzip", "br", "deflate", "zstd")
+STATIC_RESOURCE_TYPES = ("script", "stylesheet", "image", "font", "media")
+MIN_COMPRESSIBLE_BYTES = 1024
+MIN_STATIC_MAX_AGE = 30 * 24 * 3600  # seconds; shorter caching of static files is flagged
+MAX_IMAGE_BYTES = 200_000
+
+# Per page; override or extend with a YAML file of the same shape via --network-budgets.
+# Request count and total weight are budgeted once, in web_vitals.DEFAULT_BUDGETS
+# (resource_count, transfer_bytes); these only cover the weight per resource type.
+DEFAULT_BUDGETS: Dict[str, Dict[str, float]] = {
+    "default": {"script_bytes": 1_500_000, "image_bytes": 3_000_000},
+    "login": {"script_bytes": 1_000_000, "image_bytes": 500_000},
+}
+
+_auditors: "weakref.WeakKeyDictionary[BrowserContext, NetworkAuditor]" = weakref.WeakKeyDictionary()
+_records: List[Dict[str, Any]] = []
+
+
+def mode() -> str:
+    return os.getenv("network_audit", "off").lower()
+
+
+def _max_age(cache_control: str) -> Optional[int]:
+    match = re.search(r"(?:s-)?max-age=(\d+)", cache_control)
+    return int(match.group(1)) if match else None
+
+
+class NetworkAuditor:
+    """Records every finished response of a context: size, encoding, caching, timing."""
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.entries: List[Dict[str, Any]] = []
+        self.window = 0
+        self._pending: List[asyncio.Future] = []
+        context.on("requestfinished", self._on_request_finished)
+
+    def _on_request_finished(self, request: Request) -> None:
+        self._pending.append(asyncio.ensure_future(self._record(request, self.window)))
+
+    async def _record(self, request: Request, window: int) -> None:
+        try:
+            response = await request.response()
+            if response is None:
+                return
+            sizes = await request.sizes()
+            headers = await response.all_headers()
+        except Exception as e:
+            logging.debug(f"Network audit skipped {request.url}: {e}")
+            return
+        if window != self.window:
+            return  # finished in an earlier window, resolved after begin()
+
+        timing = request.timing
+        self.entries.append({
+            "url": request.url,
+            "resource_type": request.resource_type,
+            "status": response.status,
+            "body_bytes": sizes.get("responseBodySize", 0),
+            "transfer_bytes": sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0),
+            "content_type": headers.get("content-type", ""),
+            "content_encoding": headers.get("content-encoding", ""),
+            "cache_control": headers.get("cache-control", ""),
+            "from_service_worker": response.from_service_worker,
+            "duration_ms": round(timing["responseEnd"], 1) if timing.get("responseEnd", -1) >= 0 else None,
+        })
+
+    def begin(self) -> None:
+        """Start a new audit window (one page object ``open()``). Responses of requests
+        that finished before it are left out, even when they resolve later."""
+        self.window += 1
+        self.entries.clear()
+        self._pending = []
+
+    async def flush(self) -> List[Dict[str, Any]]:
+        pending, self._pending = self._pending, []
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return list(self.entries)
+
+
+def flag_entries(entries: List[Dict[str, Any]], page_url: str) -> List[Dict[str, str]]:
+    """Uncompressed text, short-cached static files, oversized images, duplicate downloads."""
+    flags = []
+    first_party = (urlparse(page_url).hostname or "").removeprefix("www.")
+
+    def flag(kind: str, entry: Dict[str, Any], detail: str) -> None:
+        host = urlparse(entry["url"]).hostname or ""
+        flags.append({
+            "flag": kind,
+            "url": entry["url"],
+            "detail": detail,
+            # The site or its subdomains; not lookalikes such as "evilnoovoleum.com".
+            "third_party": not (host == first_party or host.endswith(f".{first_party}")),
+        })
+
+    for entry in entries:
+        if entry["status"] != 200 or entry["from_service_worker"]:
+            continue
+        encoding = entry["content_encoding"].lower()
+        if (
+            TEXT_TYPES.search(entry["content_type"])
+            and entry["body_bytes"] >= MIN_COMPRESSIBLE_BYTES
+            and not any(e in encoding for e in COMPRESSED_ENCODINGS)
+        ):
+            flag("uncompressed", entry, f"{entry['body_bytes']} bytes of {entry['content_type']}")
+
+        if entry["resource_type"] in STATIC_RESOURCE_TYPES:
+            cache_control = entry["cache_control"].lower()
+            max_age = _max_age(cache_control)
+            # no-cache is revalidated (a 304 when unchanged), so it is not a short lifetime.
+            revalidated = "no-cache" in cache_control
+            if "no-store" in cache_control or (not revalidated and (max_age or 0) < MIN_STATIC_MAX_AGE):
+                flag("short_cache", entry, f"cache-control: {entry['cache_control'] or '(none)'}")
+
+        if entry["resource_type"] == "image" and entry["body_bytes"] > MAX_IMAGE_BYTES:
+            flag("oversized_image", entry, f"{entry['body_bytes']} bytes")
+
+    downloads = Counter(
+        entry["url"] for entry in entries
+        if entry["status"] == 200 and entry["body_bytes"] > 0 and not entry["from_service_worker"]
+    )
+    for url, count in downloads.items():
+        if count > 1:
+            flag("duplicate_download", next(e for e in entries if e["url"] == url), f"downloaded {count} times")
+    return flags
+
+
+def totals(entries: List[Dict[str, Any]]) -> Dict[str, float]:
+    by_type = Counter()
+    for entry in entries:
+        by_type[entry["resource_type"]] += entry["transfer_bytes"]
+    return {
+        "requests": len(entries),
+        "total_bytes": sum(by_type.values()),
+        "script_bytes": by_type["script"],
+        "image_bytes": by_type["image"],
+        "stylesheet_bytes": by_type["stylesheet"],
+        "font_bytes": by_type["font"],
+    }
+
+
+def load_budgets(budgets_file: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    budgets = {page: dict(limits) for page, limits in DEFAULT_BUDGETS.items()}
+    if budgets_file:
+        with open(budgets_file, "r") as file:
+            for page, limits in (yaml.safe_load(file) or {}).items():
+                budgets.setdefault(page, {}).update(limits or {})
+    return budgets
+
+
+def check_budgets(record: Dict[str, Any], budgets) -> List[str]:
+    limits = dict(budgets.get("default", {}))
+    limits.update(budgets.get(record["page"], {}))
+    return [
+        f"{record['page']} [{record['platform']}] {metric}: {record['totals'][metric]} > {limit}"
+        for metric, limit in limits.items()
+        if record["totals"].get(metric, 0) > limit
+    ]
+
+
+def attach(context: BrowserContext) -> Optional[NetworkAuditor]:
+    """Audit ``context`` when --network-audit is on."""
+    if mode() == "off":
+        return None
+    auditor = NetworkAuditor(context)
+    _auditors[context] = auditor
+    return auditor
+
+
+def begin(page: Page) -> None:
+    auditor = _auditors.get(page.context)
+    if auditor:
+        auditor.begin()
+
+
+async def collect(page: Page, page_name: str) -> Optional[Dict[str, Any]]:
+    """Close the audit window started by ``begin`` and queue its report for the running test."""
+    auditor = _auditors.get(page.context)
+    if auditor is None:
+        return None
+    entries = await auditor.flush()
+    record = {
+        "page": page_name,
+        "platform": os.getenv("platform", "desktop"),
+        "url": page.url,
+        "totals": totals(entries),
+        "flags": flag_entries(entries, page.url),
+        "responses": entries,
+    }
+    _records.append(record)
+    return record
+
+
+def take_records() -> List[Dict[str, Any]]:
+    records = list(_records)
+    _records.clear()
+    return records
+
+
+def report_test(item) -> List[str]:
+    """Attach the test's audit reports to Allure, keep a compact copy for the run
+    summary and return the budget violations."""
+    records = take_records()
+    if not records:
+        return []
+
+    budgets = load_budgets(item.config.getoption("network_budgets"))
+    violations = []
+    for record in records:
+        record["test"] = item.nodeid
+        record["violations"] = check_budgets(record, budgets)
+        violations.extend(record["violations"])
+        item.config._network_audit_records.append({k: v for k, v in record.items() if k != "responses"})
+
+    allure.attach(json.dumps(records, indent=2), "Network Audit", allure.attachment_type.JSON)
+    return violations
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Worst totals and distinct flagged URLs per page and platform."""
+    summary: Dict[str, Any] = {}
+    for record in records:
+        page = summary.setdefault(f"{record['page']}/{record['platform']}", {
+            "samples": 0, "over_budget": 0, "max_totals": {}, "flags": {},
+        })
+        page["samples"] += 1
+        page["over_budget"] += bool(record["violations"])
+        for metric, value in record["totals"].items():
+            page["max_totals"][metric] = max(page["max_totals"].get(metric, 0), value)
+        for flag in record["flags"]:
+            urls = page["flags"].setdefault(flag["flag"], [])
+            if flag["url"] not in urls:
+                urls.append(flag["url"])
+    return summary
+
+
+def write_run_summary(config) -> Optional[str]:
+    records = config._network_audit_records
+    if not records:
+        return None
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, "summary.json")
+    with open(path, "w") as file:
+        json.dump({"summary": summarize(records), "records": records}, file, indent=2)
+    return path
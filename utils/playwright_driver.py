@@ -0,0 +1,101 @@
+import os
+import json
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Playwright, async_playwright
+
+RESULTS_DIR = "reports"
+
+
+class DriverSession:
+    """The worker's Playwright driver (a Node subprocess), started once and shared.
+
+    Starting and stopping the driver is timed, so the run can report what a driver per
+    test would have cost.
+    """
+
+    def __init__(self):
+        self.playwright: Optional[Playwright] = None
+        self.start_s = 0.0
+        self.stop_s = 0.0
+        self.tests = 0
+
+    async def start(self) -> Playwright:
+        started = time.perf_counter()
+        self.playwright = await async_playwright().start()
+        self.start_s = time.perf_counter() - started
+        return self.playwright
+
+    async def stop(self) -> None:
+        started = time.perf_counter()
+        await self.playwright.stop()
+        self.stop_s = time.perf_counter() - started
+
+    def stats(self, worker: str) -> Dict[str, Any]:
+        return {
+            "worker": worker,
+            "tests": self.tests,
+            "driver_start_s": round(self.start_s, 3),
+            "driver_stop_s": round(self.stop_s, 3),
+            # every test but the first would have started and stopped its own driver
+            "saved_s": round(max(0, self.tests - 1) * (self.start_s + self.stop_s), 3),
+        }
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not records:
+        return {}
+    tests = sum(record["tests"] for record in records)
+    return {
+        "workers": len(records),
+        "tests": tests,
+        "driver_starts": len(records),
+        "driver_starts_avoided": tests - len(records),
+        "driver_start_s_mean": round(sum(record["driver_start_s"] for record in records) / len(records), 3),
+        "saved_s": round(sum(record["saved_s"] for record in records), 3),
+    }
+
+
+def write_run_summary(config) -> Optional[Dict[str, Any]]:
+    records = config._driver_stats
+    summary = summarize(records)
+    if not summary:
+        return None
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, "playwright_driver.json"), "w") as file:
+        json.dump({"summary": summary, "workers": records}, file, indent=2)
+    return summary
+
+
+def terminal_line(config) -> Optional[str]:
+    summary = summarize(config._driver_stats)
+    if not summary or not summary["tests"]:
+        return None
+    return (
+        f"Playwright driver: {summary['driver_starts']} start(s) for {summary['tests']} tests "
+        f"({summary['driver_start_s_mean']}s each), about {summary['saved_s']}s of driver startup saved"
+    )
+
+
+async def close_contexts(browser, keep=()) -> None:
+    """Close contexts a test left open, except those in ``keep`` (opened before it)."""
+    if browser is None or not browser.is_connected():
+        return
+    leftovers = [context for context in browser.contexts if context not in keep]
+    if leftovers:
+        logging.warning(f"Closing {len(leftovers)} browser context(s) left open by the test")
+    for context in leftovers:
+        try:
+            await context.close()
+        except Exception as e:
+            logging.warning(f"Context cleanup error: {e}")
+
+
+async def close_leftovers(browser) -> None:
+    """Close contexts a test left open, then the browser."""
+    if browser is None or not browser.is_connected():
+        return
+    await close_contexts(browser)
+    await browser.close()
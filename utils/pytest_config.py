@@ -1,10 +1,17 @@
 import pytest
 import os
 from dotenv import load_dotenv
+from pytest_asyncio import is_async_test
+from utils.engines import requested as requested_engines
+from utils.throttling import THROTTLING_PROFILES
 
 
 def pytest_generate_tests_handler(metafunc):
-    """Generate tests with platform parameters based on CLI options."""
+    """Generate tests with platform parameters based on CLI options, and one test per
+    --engines engine for tests whose browser comes from the runner."""
+    # Classes sharing a page (readonly tests) run all tests of one platform together
+    scope = "class" if metafunc.cls is not None and "shared_page" in metafunc.fixturenames else "function"
+
     # Check if the test function has a platform parameter
     if "platform" in metafunc.fixturenames:
         platform_option = metafunc.config.getoption('platform')
@@ -22,7 +29,20 @@ def pytest_generate_tests_handler(metafunc):
             # Default behavior: run only desktop tests when no platform specified
             platforms = ['desktop']
         
-        metafunc.parametrize("platform", platforms, scope="function")
+        metafunc.parametrize("platform", platforms, scope=scope)
+
+    engines = requested_engines(metafunc.config)
+    if engines and "engine" in metafunc.fixturenames:
+        metafunc.parametrize("engine", engines, scope=scope)
+
+
+def use_session_event_loop(items):
+    """Run async tests in the session event loop, the loop all async fixtures use
+    (asyncio_default_fixture_loop_scope), so class-scoped fixtures can be shared."""
+    marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(marker, append=False)
 
 
 def configure_environment(config):
@@ -34,6 +54,19 @@ def configure_environment(config):
     os.environ["env"] = config.getoption('env')
     os.environ["mode"] = config.getoption('mode') or 'local'
     os.environ["headless"] = str(config.getoption('headless'))
+    os.environ["web_vitals"] = config.getoption('web_vitals')
+    os.environ["throttle"] = config.getoption('throttle') or ''
+    os.environ["network_audit"] = config.getoption('network_audit')
+    os.environ["http_cache"] = "on" if config.getoption('http_cache') else "off"
+    os.environ["http_cache_ttl"] = str(config.getoption('http_cache_ttl'))
+    os.environ["visual"] = "update" if config.getoption('update_baselines') else "on" if config.getoption('visual') else "off"
+    config._web_vitals_records = []
+    config._trace_overhead = []
+    config._network_audit_records = []
+    config._driver_stats = []
+    config._http_cache_stats = {}
+    config._visual_stats = {}
+    config._shared_cache_dirs = []
     
     # Store the platform option for global access
     platform_option = config.getoption('platform')
@@ -46,3 +79,41 @@ def add_pytest_options(parser):
     parser.addoption('--mode', help='Specify the execution mode: local, grid, pipeline', default='local')
     parser.addoption('--platform', help='Specify the platform: desktop, mobile, or all', default='desktop')
     parser.addoption('--headless', action='store_true', default=False, help='Run tests in headless mode')
+    parser.addoption('--performance', action='store_true', default=False, help='Run Locust performance tests (marked performance)')
+    parser.addoption('--web-vitals', choices=('off', 'collect', 'enforce'), default='off',
+                     help='Record web vitals on page open; enforce also fails tests over budget')
+    parser.addoption('--throttle', choices=sorted(THROTTLING_PROFILES), default=None,
+                     help='Network/CPU throttling profile for mobile contexts (Chromium only)')
+    parser.addoption('--lpt-schedule', action='store_true', default=False,
+                     help='With -n: schedule the longest tests first using durations from .test_durations')
+    parser.addoption('--store-durations', action='store_true', default=False,
+                     help='Merge this run\'s test durations into .test_durations')
+    parser.addoption('--shard', default=None,
+                     help='Run shard i of N (e.g. 2/4), balanced on the durations in .test_durations')
+    parser.addoption('--shard-plan', default=None, help='Write the shard plan of the collection as JSON to this path')
+    parser.addoption('--shards', type=int, default=None,
+                     help='Number of shards for --shard-plan without --shard, to preview an N-way plan (default 1)')
+    parser.addoption('--engines', default=None,
+                     help='Comma-separated engines (chromium,firefox,webkit) launched together per worker; '
+                          'tests on page, context or shared_page run once per engine, device_matrix tests '
+                          'on all of them concurrently')
+    parser.addoption('--http-cache', action='store_true', default=False,
+                     help='Serve static JS, CSS, fonts and images of test contexts from a disk cache shared by all tests')
+    parser.addoption('--http-cache-ttl', type=float, default=24 * 3600,
+                     help='Longest heuristic freshness in seconds, for cached assets without max-age or Expires (with --http-cache)')
+    parser.addoption('--visual', action='store_true', default=False,
+                     help='Compare screenshots of tests using the visual fixture with their baselines in visual_baselines/')
+    parser.addoption('--update-baselines', action='store_true', default=False,
+                     help='Record the screenshots of tests using the visual fixture as their new baselines')
+    parser.addoption('--static-dom', action='store_true', default=False,
+                     help='Run tests marked static_content against a cached DOM of the page instead of a live page')
+    parser.addoption('--impacted-by', default=None, metavar='GIT_REF',
+                     help='Run only tests whose page objects, clients or fixtures changed since this git ref')
+    parser.addoption('--network-audit', choices=('off', 'report', 'enforce'), default='off',
+                     help='Audit response sizes, compression and caching of page opens; enforce fails tests over budget')
+    parser.addoption('--network-budgets', default=None, help='YAML file overriding the per-page network budgets')
+    parser.addoption('--trace-on-failure', action='store_true', default=False,
+                     help='Record a ring-buffered Playwright trace and keep it only for failed tests')
+    parser.addoption('--trace-window', type=float, default=30,
+                     help='Seconds of trace kept before a failure (with --trace-on-failure)')
+    parser.addoption('--web-vitals-budgets', default=None, help='YAML file overriding the per-page web vitals budgets')
@@ -0,0 +1,301 @@
+import os
+import json
+import time
+import heapq
+import logging
+import argparse
+import statistics
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pytest
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:  # xdist not installed: duration store and sharding still work
+    LoadScopeScheduling = object
+
+DURATIONS_FILE = ".test_durations"
+RESULTS_DIR = "reports"
+MEASURED_FILE = os.path.join(RESULTS_DIR, "durations.json")  # this run's durations, for CI to merge
+DEFAULT_DURATION = 5.0  # seconds assumed for a test with no history and nothing to compare
+SMOOTHING = 0.5  # weight of the latest run in the stored moving average
+
+
+def load_durations(path: str = DURATIONS_FILE) -> Dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (json.JSONDecodeError, IOError) as e:
+        logging.warning(f"Ignoring unreadable durations file {path}: {e}")
+        return {}
+
+
+def save_durations(measured: Dict[str, float], path: str = DURATIONS_FILE) -> None:
+    """Merge this run's durations into the store as a moving average, sorted for stable diffs."""
+    durations = load_durations(path)
+    for nodeid, seconds in measured.items():
+        previous = durations.get(nodeid)
+        durations[nodeid] = seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+    with open(path, "w") as file:
+        json.dump({k: round(v, 3) for k, v in sorted(durations.items())}, file, indent=1)
+        file.write("\n")
+
+
+def merge_measured(paths: Iterable[str], path: str = DURATIONS_FILE) -> int:
+    """Fold the measured durations of several runs (e.g. CI shards) into the store;
+    returns the number of tests merged."""
+    merged = 0
+    for measured_path in paths:
+        measured = load_durations(measured_path)
+        save_durations(measured, path)
+        merged += len(measured)
+    return merged
+
+
+def predict(nodeids: Iterable[str], durations: Dict[str, float]) -> Dict[str, float]:
+    """Historical duration per test; new tests get the median of the known ones."""
+    nodeids = list(nodeids)
+    known = [durations[n] for n in nodeids if n in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {nodeid: durations.get(nodeid, fallback) for nodeid in nodeids}
+
+
+def lpt_assign(units: Dict[str, float], bins: int) -> Tuple[List[List[str]], List[float]]:
+    """Longest-processing-time-first: each unit, longest first, goes to the least loaded bin.
+
+    Ties break on the unit name and bin index, so the result is deterministic.
+    """
+    assigned: List[List[str]] = [[] for _ in range(bins)]
+    loads = [(0.0, index) for index in range(bins)]
+    for unit, seconds in sorted(units.items(), key=lambda item: (-item[1], item[0])):
+        load, index = heapq.heappop(loads)
+        assigned[index].append(unit)
+        heapq.heappush(loads, (load + seconds, index))
+    totals = [0.0] * bins
+    for load, index in loads:
+        totals[index] = load
+    return assigned, totals
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """``"2/4"`` -> ``(2, 4)``; shards are numbered from 1."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"Invalid --shard {value!r}, expected i/N such as 2/4")
+    if not 1 <= index <= total:
+        raise pytest.UsageError(f"Invalid --shard {value!r}, i must be between 1 and N")
+    return index, total
+
+
+def plan_shards(nodeids: List[str], durations: Dict[str, float], shards: int) -> List[Dict]:
+    """Split tests into ``shards`` groups of about equal predicted time.
+
+    Classes stay together (see ``shared_setup_scope``) and the LPT assignment is
+    deterministic, so every machine computes the same plan from the same collection
+    and durations file. Each shard keeps the collection order of its tests.
+    """
+    predicted = predict(nodeids, durations)
+    units: Dict[str, List[str]] = {}
+    for nodeid in nodeids:
+        units.setdefault(shared_setup_scope(nodeid), []).append(nodeid)
+
+    unit_seconds = {unit: sum(predicted[n] for n in members) for unit, members in units.items()}
+    assigned, loads = lpt_assign(unit_seconds, shards)
+    order = {nodeid: position for position, nodeid in enumerate(nodeids)}
+    return [
+        {
+            "shard": index + 1,
+            "predicted_s": round(loads[index], 1),
+            "tests": sorted((n for unit in assigned[index] for n in units[unit]), key=order.get),
+        }
+        for index in range(shards)
+    ]
+
+
+def select_shard(config, items) -> None:
+    """Keep only this machine's shard of the collection (``--shard=i/N``). ``--shard-plan``
+    writes the plan; without ``--shard`` it splits into ``--shards`` and keeps every test."""
+    shard_option = config.getoption("shard")
+    plan_path = config.getoption("shard_plan")
+    shards = config.getoption("shards")
+    if not shard_option and not plan_path:
+        return
+
+    if shard_option:
+        index, total = parse_shard(shard_option)
+        if shards is not None and shards != total:
+            raise pytest.UsageError(f"--shards={shards} contradicts --shard={shard_option}")
+    else:
+        index, total = None, 1 if shards is None else shards
+    if total < 1:
+        raise pytest.UsageError(f"Invalid --shards={total}, expected at least 1")
+    plan = plan_shards([item.nodeid for item in items], load_durations(), total)
+    # Every xdist worker computes the same plan; one of them writes it.
+    if plan_path and getattr(config, "workerinput", {}).get("workerid", "gw0") == "gw0":
+        with open(plan_path, "w") as file:
+            json.dump({"shards": plan, "durations_file": DURATIONS_FILE}, file, indent=2)
+    if index is None:
+        return  # a preview of the plan; this machine runs the whole collection
+
+    selected = set(plan[index - 1]["tests"])
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+
+def shared_setup_scope(nodeid: str) -> str:
+    """Tests in one class share class-scoped fixtures, so they stay together; module-level
+    test functions only share function-scoped setup and are scheduled one by one."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else nodeid
+
+
+class DurationRecorder:
+    """Plugin on the controller: sums setup, call and teardown time per test and busy time
+    per xdist worker, stores durations with --store-durations and reports the makespan.
+
+    Under --reruns a test's duration is its last attempt's, so flaky tests are not
+    predicted as long as all their attempts together; worker busy time counts them all.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.durations: Dict[str, float] = {}
+        self.worker_busy: Dict[str, float] = {}
+        self.started = time.monotonic()
+        self.finished = self.started
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when == "setup":
+            self.durations[report.nodeid] = 0.0  # a new attempt
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+        worker = getattr(getattr(report, "node", None), "gateway", None)
+        worker_id = worker.id if worker else "main"
+        self.worker_busy[worker_id] = self.worker_busy.get(worker_id, 0.0) + report.duration
+        self.finished = time.monotonic()
+
+    def pytest_sessionfinish(self, session) -> None:
+        if self.config.getoption("store_durations") and self.durations:
+            save_durations(self.durations)
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            with open(MEASURED_FILE, "w") as file:
+                json.dump({k: round(v, 3) for k, v in sorted(self.durations.items())}, file, indent=1)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        report = makespan_report(self.config, self)
+        if report:
+            terminalreporter.write_line(
+                f"LPT schedule: predicted makespan {report['predicted_makespan_s']}s, "
+                f"actual {report['actual_makespan_s']}s on {report['workers']} workers "
+                f"(wall {report['wall_time_s']}s)"
+            )
+
+
+def register(config) -> None:
+    """Validate --shard and record durations on the controller (or the only process
+    without xdist)."""
+    if config.getoption("shard"):
+        try:
+            parse_shard(config.getoption("shard"))
+        except ValueError as e:
+            raise pytest.UsageError(str(e))
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config), "duration_recorder")
+
+
+class LPTScheduling(LoadScopeScheduling):
+    """xdist scheduler that hands out the longest predicted work units first.
+
+    A work unit is a test class (shared class fixtures run once per worker) or a single
+    module-level test. A unit longer than the ideal per-worker share is split, because it
+    would otherwise set the makespan on its own.
+    """
+
+    def __init__(self, config, log=None):
+        super().__init__(config, log)
+        self.durations = load_durations()
+        self.unit_seconds: Dict[str, float] = {}
+        self._unit_of: Dict[str, str] = {}
+        self.predicted_makespan = 0.0
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self._unit_of.get(nodeid) or shared_setup_scope(nodeid)
+
+    def schedule(self) -> None:
+        if self.collection is None and self.collection_is_completed and self.registered_collections:
+            self._plan(list(next(iter(self.registered_collections.values()))))
+        super().schedule()
+
+    def _plan(self, collection: List[str]) -> None:
+        predicted = predict(collection, self.durations)
+        workers = max(1, len(self.nodes))
+        share = sum(predicted.values()) / workers
+
+        units: Dict[str, List[str]] = {}
+        for nodeid in collection:
+            units.setdefault(shared_setup_scope(nodeid), []).append(nodeid)
+
+        for scope, nodeids in units.items():
+            chunk, chunk_index, chunk_seconds = [], 0, 0.0
+            for nodeid in nodeids:
+                if chunk and chunk_seconds + predicted[nodeid] > share:
+                    chunk_index += 1
+                    chunk, chunk_seconds = [], 0.0
+                unit = scope if chunk_index == 0 else f"{scope}#{chunk_index}"
+                self._unit_of[nodeid] = unit
+                chunk.append(nodeid)
+                chunk_seconds += predicted[nodeid]
+                self.unit_seconds[unit] = self.unit_seconds.get(unit, 0.0) + predicted[nodeid]
+
+        _, loads = lpt_assign(self.unit_seconds, workers)
+        self.predicted_makespan = max(loads)
+        self.log(f"LPT plan: {len(self.unit_seconds)} units, predicted makespan {self.predicted_makespan:.1f}s")
+
+    def _assign_work_unit(self, node) -> None:
+        # Longest remaining unit first instead of LoadScope's largest-count order.
+        longest = max(self.workqueue, key=lambda scope: self.unit_seconds.get(scope, 0.0))
+        self.workqueue.move_to_end(longest, last=False)
+        super()._assign_work_unit(node)
+
+
+def make_scheduler(config, log) -> Optional[LPTScheduling]:
+    if not config.getoption("lpt_schedule") or LoadScopeScheduling is object:
+        return None
+    scheduler = LPTScheduling(config, log)
+    config._lpt_scheduler = scheduler
+    return scheduler
+
+
+def makespan_report(config, recorder: DurationRecorder) -> Optional[Dict[str, float]]:
+    """Predicted (LPT plan) versus actual makespan of the run, when --lpt-schedule was used.
+
+    The actual makespan is the busiest worker's summed test time, comparable to the plan;
+    wall time additionally includes worker startup and collection.
+    """
+    scheduler = getattr(config, "_lpt_scheduler", None)
+    if scheduler is None or not recorder.worker_busy:
+        return None
+    report = {
+        "workers": len(recorder.worker_busy),
+        "predicted_makespan_s": round(scheduler.predicted_makespan, 1),
+        "actual_makespan_s": round(max(recorder.worker_busy.values()), 1),
+        "wall_time_s": round(recorder.finished - recorder.started, 1),
+        "worker_busy_s": {k: round(v, 1) for k, v in sorted(recorder.worker_busy.items())},
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, "schedule.json"), "w") as file:
+        json.dump(report, file, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge measured test durations into the durations file")
+    parser.add_argument("measured", nargs="+", help=f"Files written by --store-durations ({MEASURED_FILE})")
+    parser.add_argument("--durations-file", default=DURATIONS_FILE)
+    args = parser.parse_args()
+    count = merge_measured(args.measured, args.durations_file)
+    print(f"Merged {count} test durations from {len(args.measured)} files into {args.durations_file}")
@@ -9,6 +9,7 @@ from sources.web.admin.login_page import LoginPage
 SESSION_FILE = ".auth/session.json"
 SESSION_DIR = os.path.dirname(SESSION_FILE)
 SESSION_LOCK_FILE = f"{SESSION_FILE}.lock"
+AUTH_COOKIE_NAMES = ("auth", "session", "token", "jwt")
 
 
 class SessionHandler:
@@ -29,7 +30,7 @@ class SessionHandler:
                 return True
 
             current_time = time.time()
-            auth_cookies = [c for c in session_data.get("cookies", []) if c.get("name", "").lower() in ("auth", "session", "token", "jwt")]
+            auth_cookies = [c for c in session_data.get("cookies", []) if c.get("name", "").lower() in AUTH_COOKIE_NAMES]
             
             # If no auth cookies found, consider it expired
             if not auth_cookies:
@@ -65,36 +66,42 @@ class SessionHandler:
         else:
             raise ValueError(f"Credentials for {user_type} not found. Set {env_vars[0]} and {env_vars[1]} in your .env file.")
 
+    async def login(self, email: str, password: str, session_file: str, label: str = "user"):
+        """Log in through the login page and save the storage state to session_file."""
+        context_options = {
+            "viewport": {"width": 1920, "height": 1080} if self.is_headless else None,
+            "no_viewport": not self.is_headless}
+
+        context = await self.browser.new_context(**context_options)
+        page = await context.new_page()
+
+        try:
+            sess = LoginPage(page)
+            await sess.open()
+            await sess.login(email, password)
+
+            # Wait for navigation to confirm login success
+            await page.wait_for_url(re.compile(r"/profile"), timeout=5000)
+            await context.storage_state(path=session_file)
+        except Exception as e:
+            logging.error(f"Login failed for {label}: {str(e)}")
+            # Take a screenshot for debugging
+            os.makedirs(SESSION_DIR, exist_ok=True)
+            await page.screenshot(path=f"{SESSION_DIR}/{label}_login_failed.png")
+            raise Exception(f"Failed to login as {label}. Check credentials and login page. Screenshot saved to {SESSION_DIR}/{label}_login_failed.png")
+        finally:
+            await context.close()
+
+        return session_file
+
     async def create_session(self, user_type: str):
         if not os.path.exists(SESSION_DIR):
             os.makedirs(SESSION_DIR)
 
         with FileLock(SESSION_LOCK_FILE):
             if not os.path.exists(SESSION_FILE) or self.is_session_expired(SESSION_FILE):
-                context_options = {
-                    "viewport": {"width": 1920, "height": 1080} if self.is_headless else None,
-                    "no_viewport": not self.is_headless}
-
-                context = await self.browser.new_context(**context_options)
-                page = await context.new_page()
-
                 if user_type:
                     email, password = self.load_credentials(user_type)
-                    sess = LoginPage(page)
-                    await sess.open()
-                    await sess.login(email, password)
-                    
-                    # Wait for navigation to confirm login success
-                    try:
-                        await page.wait_for_url(re.compile(r"/profile"), timeout=5000)
-                        await context.storage_state(path=SESSION_FILE)
-                    except Exception as e:
-                        logging.error(f"Login failed for {user_type}: {str(e)}")
-                        # Take a screenshot for debugging
-                        os.makedirs(SESSION_DIR, exist_ok=True)
-                        await page.screenshot(path=f"{SESSION_DIR}/{user_type}_login_failed.png")
-                        raise Exception(f"Failed to login as {user_type}. Check credentials and login page. Screenshot saved to {SESSION_DIR}/{user_type}_login_failed.png")
-                    finally:
-                        await context.close()
+                    await self.login(email, password, SESSION_FILE, user_type)
 
         return SESSION_FILE
@@ -0,0 +1,188 @@
+import os
+import mmap
+import json
+import time
+import shutil
+import struct
+import asyncio
+import hashlib
+import logging
+from collections.abc import Sequence
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from filelock import FileLock, Timeout
+
+SHARED_CACHE_DIR = ".cache/shared"
+STALE_RUN_AGE = 24 * 60 * 60  # seconds before a crashed run's cache directory is pruned
+LOCK_POLL_INTERVAL = 0.05  # seconds between attempts on a lock held by another worker
+
+# File layout: MAGIC | meta_len:u32 | count:u32 | meta JSON | count * (offset:u64, length:u32) | item JSON...
+MAGIC = b"NOOVC1\0\0"
+_HEADER = struct.Struct("<8sII")
+_INDEX_ENTRY = struct.Struct("<QI")
+
+
+class CachedResponse:
+    """Status and headers of the response a shared payload was built from."""
+
+    def __init__(self, meta: Dict[str, Any]):
+        self.status = meta.get("status", 0)
+        self.url = meta.get("url", "")
+        self.headers = meta.get("headers", {})
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+class SharedPayload(Sequence):
+    """Read-only, memory-mapped list of JSON items. Items are decoded on access."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, meta_len, self._count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a shared cache file: {path}")
+
+        meta_start = _HEADER.size
+        self.meta = json.loads(self._mmap[meta_start:meta_start + meta_len])
+        self._index_start = meta_start + meta_len
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("shared payload index out of range")
+        offset, length = _INDEX_ENTRY.unpack_from(
+            self._mmap, self._index_start + index * _INDEX_ENTRY.size
+        )
+        return json.loads(self._mmap[offset:offset + length])
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._count):
+            yield self[index]
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    @property
+    def response(self) -> CachedResponse:
+        return CachedResponse(self.meta)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def write_payload(path: str, items: List[Any], meta: Dict[str, Any]) -> None:
+    """Write items to ``path`` in the indexed binary layout, atomically."""
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    encoded = [json.dumps(item, separators=(",", ":")).encode("utf-8") for item in items]
+
+    offset = _HEADER.size + len(meta_bytes) + len(encoded) * _INDEX_ENTRY.size
+    index = bytearray()
+    for blob in encoded:
+        index += _INDEX_ENTRY.pack(offset, len(blob))
+        offset += len(blob)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, len(meta_bytes), len(encoded)))
+        file.write(meta_bytes)
+        file.write(index)
+        for blob in encoded:
+            file.write(blob)
+    os.replace(tmp_path, path)
+
+
+def _run_dir() -> str:
+    """Cache directory shared by every xdist worker of the current run."""
+    run_id = os.getenv("PYTEST_XDIST_TESTRUNUID") or f"local-{os.getpid()}"
+    return os.path.join(SHARED_CACHE_DIR, run_id)
+
+
+def _prune_stale_runs(current_dir: str) -> None:
+    if not os.path.isdir(SHARED_CACHE_DIR):
+        return
+    cutoff = time.time() - STALE_RUN_AGE
+    for entry in os.scandir(SHARED_CACHE_DIR):
+        if entry.is_dir() and entry.path != current_dir and entry.stat().st_mtime < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+# One mapping per file and process; workers share the pages through the OS cache.
+_open_payloads: Dict[str, SharedPayload] = {}
+
+
+async def acquire_lock(lock: FileLock) -> None:
+    """Take ``lock`` without blocking the event loop while another worker fetches."""
+    while True:
+        try:
+            lock.acquire(timeout=0)
+            return
+        except Timeout:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+
+async def get_shared_payload(
+    key: str, fetch: Callable[[], Awaitable[Optional[Tuple[List[Any], Dict[str, Any]]]]]
+) -> Optional[SharedPayload]:
+    """Return the run-wide payload for ``key``, fetching it only in the first worker.
+
+    ``fetch`` returns ``(items, meta)`` or ``None`` when the response must not be
+    shared (e.g. an error status or an empty list); in that case nothing is cached
+    and ``None`` is returned so the caller can fall back to a direct request.
+    """
+    run_dir = _run_dir()
+    name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    path = os.path.join(run_dir, f"{name}.bin")
+
+    if path in _open_payloads:
+        return _open_payloads[path]
+
+    os.makedirs(run_dir, exist_ok=True)
+    lock = FileLock(f"{path}.lock")
+    await acquire_lock(lock)
+    try:
+        if not os.path.exists(path):
+            _prune_stale_runs(run_dir)
+            fetched = await fetch()
+            if fetched is None:
+                return None
+            items, meta = fetched
+            write_payload(path, items, meta)
+            logging.info(f"Shared cache stored {len(items)} items for {key}")
+    finally:
+        lock.release()
+
+    if path in _open_payloads:  # mapped by a coroutine that waited on the same lock
+        return _open_payloads[path]
+    try:
+        payload = SharedPayload(path)
+    except (ValueError, OSError) as e:
+        logging.warning(f"Shared cache unreadable for {key}: {e}")
+        return None
+    _open_payloads[path] = payload
+    return payload
+
+
+def release() -> Optional[str]:
+    """Unmap this process's payloads at the end of its session; returns the run's
+    cache directory if this process created or used it."""
+    for payload in _open_payloads.values():
+        payload.close()
+    _open_payloads.clear()
+    run_dir = _run_dir()
+    return run_dir if os.path.isdir(run_dir) else None
+
+
+def remove_runs(run_dirs: Iterable[Optional[str]]) -> None:
+    """Delete the cache directories of a finished run (the controller's, once every
+    worker has released them)."""
+    for run_dir in set(filter(None, run_dirs)):
+        shutil.rmtree(run_dir, ignore_errors=True)
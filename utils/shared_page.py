@@ -0,0 +1,177 @@
+import os
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from playwright.async_api import BrowserContext, Frame, Page
+
+from utils import trace_recorder
+from utils.browser_config import ContextManager
+
+DIRTY_CACHE_KEY = "shared_page/dirty"
+
+# Trusted events only come from real (Playwright) input, not from the site's own scripts.
+INTERACTION_SCRIPT = """() => {
+    window.__sharedPageInteractions = [];
+    for (const type of ["pointerdown", "mousedown", "click", "keydown", "input", "change", "submit"]) {
+        window.addEventListener(type, event => {
+            if (event.isTrusted) window.__sharedPageInteractions.push(type);
+        }, true);
+    }
+}"""
+INTERACTIONS = "() => window.__sharedPageInteractions || ['page replaced']"
+
+
+class FreshPage:
+    """A test's own page: every ``open`` navigates."""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open(self, page_class: Type):
+        return await page_class(self.page).open()
+
+
+class SharedPage:
+    """One opened page object shared by the read-only tests of a class.
+
+    After each test it checks whether the page navigated, opened a popup or received
+    trusted user input. If so, the next ``open`` starts over on a new page.
+    """
+
+    def __init__(self, context_manager: ContextManager, context: BrowserContext):
+        self.context_manager = context_manager
+        self.context = context
+        self.page: Optional[Page] = None
+        self.page_object = None
+        self.opened_url = ""
+        self.changes: List[str] = []
+        self.opens = 0
+        self.reuses = 0
+
+    async def open(self, page_class: Type):
+        if self.page_object is not None and type(self.page_object) is page_class and not self.changes:
+            self.reuses += 1
+            return self.page_object
+
+        await self._close_page()
+        self.page = await self.context_manager.create_page(self.context)
+        self.page_object = await page_class(self.page).open()
+        self.opens += 1
+        self.opened_url = self.page.url
+        self.changes = []
+        await self.page.evaluate(INTERACTION_SCRIPT)
+        self.page.on("framenavigated", self._on_navigated)
+        self.page.on("popup", lambda popup: self.changes.append(f"popup {popup.url}"))
+        return self.page_object
+
+    def _on_navigated(self, frame: Frame) -> None:
+        if frame == frame.page.main_frame:
+            self.changes.append(f"navigated to {frame.url}")
+
+    async def check(self) -> List[str]:
+        """What the last test changed on the page; a changed page is reopened next time."""
+        if self.page is None:
+            return []
+        if self.page.is_closed():
+            self.changes.append("page closed")
+            return self.changes
+        try:
+            interactions = await self.page.evaluate(INTERACTIONS)
+        except Exception as e:
+            interactions = [f"evaluate failed: {e}"]
+        if interactions:
+            self.changes.append(f"user input ({', '.join(sorted(set(interactions)))})")
+        if self.page.url != self.opened_url and not any(c.startswith("navigated") for c in self.changes):
+            self.changes.append(f"url changed to {self.page.url}")
+        for extra in self.context.pages:
+            if extra is not self.page:
+                await extra.close()
+        return self.changes
+
+    async def _close_page(self) -> None:
+        if self.page is not None and not self.page.is_closed():
+            await self.context_manager.cleanup_page(self.page)
+        self.page = None
+        self.page_object = None
+
+    async def close(self) -> None:
+        await self._close_page()
+        logging.info(f"Shared page: opened {self.opens}x, reused {self.reuses}x")
+
+
+class ResettablePages:
+    """One loaded page object per platform and page class, kept for the whole worker.
+
+    Between tests the page object's ``reset()`` clears it in place instead of the page
+    being loaded again; ``reset()`` reloads by itself when it cannot verify the clean
+    state. Meant for tests that only fill and submit a form without leaving the page.
+    With --trace-on-failure each test is traced from ``open`` to ``release``.
+    """
+
+    def __init__(self, context_manager: ContextManager, new_context: Callable[..., Awaitable[BrowserContext]]):
+        self.context_manager = context_manager
+        self.new_context = new_context
+        self.contexts: Dict[str, BrowserContext] = {}
+        self.page_objects: Dict[Tuple[str, Type], object] = {}
+        self.recorder: Optional[trace_recorder.TraceRecorder] = None
+        self.opens = 0
+        self.resets = 0
+        self.reloads = 0
+
+    async def open(self, page_class: Type, request):
+        """The loaded ``page_class`` of the test's platform, reset for the test."""
+        platform = self.context_manager._extract_platform_from_request(request)
+        os.environ["platform"] = platform
+        if platform not in self.contexts:
+            self.contexts[platform] = await self.new_context(self.context_manager, request)
+        self.recorder = await trace_recorder.start_for(self.contexts[platform], request)
+
+        page_object = self.page_objects.get((platform, page_class))
+        if page_object is not None and not page_object.page.is_closed():
+            if await page_object.reset():
+                self.resets += 1
+            else:
+                self.reloads += 1
+            return page_object
+
+        page = await self.context_manager.create_page(self.contexts[platform])
+        page_object = await page_class(page).open()
+        self.page_objects[(platform, page_class)] = page_object
+        self.opens += 1
+        return page_object
+
+    async def release(self, request) -> None:
+        """End the test's trace, kept if the test failed."""
+        recorder, self.recorder = self.recorder, None
+        await trace_recorder.finish_for(recorder, request)
+
+    async def close(self) -> None:
+        for context in self.contexts.values():
+            await self.context_manager.cleanup_context(context)
+        logging.info(f"Resettable pages: opened {self.opens}x, reset in place {self.resets}x, reloaded {self.reloads}x")
+
+
+def page_used(item) -> Optional[Page]:
+    """The open page a test ran on: a page fixture, or the page of a shared, fresh or
+    resettable page (or page object) among its arguments."""
+    values = list(item.funcargs.values())
+    pages = [value for value in values if isinstance(value, Page)]
+    pages += [getattr(value, "page", None) for value in values]
+    return next((page for page in pages if isinstance(page, Page) and not page.is_closed()), None)
+
+
+def known_dirty(config) -> List[str]:
+    """Readonly tests that changed the shared page in an earlier run (pytest cache)."""
+    cache = getattr(config, "cache", None)
+    return cache.get(DIRTY_CACHE_KEY, []) if cache else []
+
+
+def remember_dirty(config, nodeid: str) -> None:
+    cache = getattr(config, "cache", None)
+    if cache and nodeid not in known_dirty(config):
+        cache.set(DIRTY_CACHE_KEY, sorted({*known_dirty(config), nodeid}))
+
+
+def wants_shared_page(item) -> bool:
+    """Marked readonly and not seen changing the page before."""
+    return item.get_closest_marker("readonly") is not None and item.nodeid not in known_dirty(item.config)
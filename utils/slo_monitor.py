@@ -0,0 +1,195 @@
+import json
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+import gevent
+import yaml
+from locust import events
+from locust.runners import WorkerRunner
+
+SLO_KEYS = ("p95_ms", "avg_ms", "error_rate", "min_rps")
+AGGREGATED = "Aggregated"
+
+
+def _add_slo_options(parser) -> None:
+    group = parser.add_argument_group("SLOs")
+    group.add_argument("--slo-p95-ms", type=float, help="Max p95 latency per endpoint (ms)")
+    group.add_argument("--slo-avg-ms", type=float, help="Max average latency per endpoint (ms)")
+    group.add_argument("--slo-error-rate", type=float, help="Max error rate per endpoint (0-1)")
+    group.add_argument("--slo-min-rps", type=float, help="Min throughput per endpoint (req/s)")
+    group.add_argument(
+        "--slo-file",
+        help="YAML file with 'defaults' and per-endpoint 'endpoints' SLOs, and 'aggregated' SLOs for all requests",
+    )
+    group.add_argument("--slo-interval", type=float, default=5, help="Seconds between live SLO checks")
+    group.add_argument("--slo-warmup", type=float, default=30, help="Seconds before live checks start")
+    group.add_argument(
+        "--slo-breach-window", type=float, default=30,
+        help="Abort when an SLO stays breached for this many seconds (0 disables aborting)",
+    )
+    group.add_argument("--slo-report", help="Write the per-SLO summary as JSON to this path")
+
+
+events.init_command_line_parser.add_listener(_add_slo_options)
+
+
+def load_slos(options) -> Dict[str, Any]:
+    """Merge CLI defaults with an optional YAML file into ``{defaults, endpoints, aggregated}``."""
+    slos: Dict[str, Any] = {"defaults": {}, "endpoints": {}, "aggregated": {}}
+    if getattr(options, "slo_file", None):
+        with open(options.slo_file, "r") as file:
+            content = yaml.safe_load(file) or {}
+        slos["defaults"].update(content.get("defaults") or {})
+        slos["endpoints"].update(content.get("endpoints") or {})
+        slos["aggregated"].update(content.get("aggregated") or {})
+
+    cli = {
+        "p95_ms": getattr(options, "slo_p95_ms", None),
+        "avg_ms": getattr(options, "slo_avg_ms", None),
+        "error_rate": getattr(options, "slo_error_rate", None),
+        "min_rps": getattr(options, "slo_min_rps", None),
+    }
+    slos["defaults"].update({k: v for k, v in cli.items() if v is not None})
+    return slos
+
+
+class SloMonitor:
+    """Evaluate SLOs per endpoint (and on all requests, ``aggregated``) during the run
+    and once more on the final stats.
+
+    ``min_rps`` is only checked live while the load is at its peak: throughput is
+    expected to be lower while users spawn, during a shape's ramps and at a spike
+    profile's baseline.
+    """
+
+    def __init__(self, environment, slos: Dict[str, Any], breach_window: float):
+        self.environment = environment
+        self.slos = slos
+        self.breach_window = breach_window
+        self.breach_started: Dict[str, float] = {}
+        self.aborted: Optional[str] = None
+
+    def _targets(self, name: str) -> Dict[str, float]:
+        targets = dict(self.slos["defaults"])
+        targets.update(self.slos["endpoints"].get(name, {}))
+        return {k: v for k, v in targets.items() if k in SLO_KEYS}
+
+    @staticmethod
+    def _measure(entry, live: bool) -> Dict[str, float]:
+        if live:
+            try:
+                p95 = entry.get_current_response_time_percentile(0.95) or 0
+            except ValueError:
+                p95 = entry.get_response_time_percentile(0.95)
+            rps = entry.current_rps
+            error_rate = entry.current_fail_per_sec / rps if rps else 0.0
+        else:
+            p95 = entry.get_response_time_percentile(0.95)
+            rps = entry.total_rps
+            error_rate = entry.fail_ratio
+        return {"p95_ms": p95, "avg_ms": entry.avg_response_time, "error_rate": error_rate, "min_rps": rps}
+
+    def _at_peak(self) -> bool:
+        """Whether the shape (or --users) asks for its peak user count and all are running."""
+        shape = getattr(self.environment, "shape_class", None)
+        if shape is not None and hasattr(shape, "stages"):
+            peak = max(users for _, users, _ in shape.stages())
+            target = shape.tick()
+            if target is None or target[0] < peak:
+                return False
+        else:
+            peak = getattr(self.environment.parsed_options, "num_users", None) or 0
+        return self.environment.runner.user_count >= peak
+
+    def evaluate(self, live: bool) -> List[Dict[str, Any]]:
+        results = []
+        stats = self.environment.stats
+        checked = [(f"{method} {name}", entry, self._targets(name)) for (name, method), entry in stats.entries.items()]
+        if self.slos["aggregated"]:
+            checked.append((AGGREGATED, stats.total, {k: v for k, v in self.slos["aggregated"].items() if k in SLO_KEYS}))
+        skip_rps = live and not self._at_peak()
+        for endpoint, entry, targets in checked:
+            if not entry.num_requests:
+                continue
+            measured = self._measure(entry, live)
+            for slo, target in targets.items():
+                if slo == "min_rps" and skip_rps:
+                    continue
+                actual = measured[slo]
+                passed = actual >= target if slo == "min_rps" else actual <= target
+                results.append({
+                    "endpoint": endpoint,
+                    "slo": slo,
+                    "target": target,
+                    "actual": round(actual, 4),
+                    "passed": passed,
+                })
+        return results
+
+    def check_live(self) -> None:
+        now = time.monotonic()
+        breached = set()
+        for result in self.evaluate(live=True):
+            key = f"{result['endpoint']} {result['slo']}"
+            if result["passed"]:
+                continue
+            breached.add(key)
+            started = self.breach_started.setdefault(key, now)
+            if self.breach_window and now - started >= self.breach_window:
+                self.aborted = (
+                    f"{key} breached for {now - started:.0f}s "
+                    f"(actual {result['actual']}, target {result['target']})"
+                )
+                logging.error(f"SLO breach, aborting run: {self.aborted}")
+                self.environment.runner.quit()
+                return
+        for key in set(self.breach_started) - breached:
+            del self.breach_started[key]
+
+    def run(self, interval: float, warmup: float) -> None:
+        gevent.sleep(warmup)
+        while self.aborted is None:
+            self.check_live()
+            gevent.sleep(interval)
+
+    def finalize(self, report_path: Optional[str]) -> bool:
+        """Print the per-SLO summary, optionally write it as JSON; True when all passed."""
+        results = self.evaluate(live=False)
+        passed = self.aborted is None and all(result["passed"] for result in results)
+
+        lines = ["SLO summary:"]
+        for result in results:
+            status = "PASS" if result["passed"] else "FAIL"
+            lines.append(
+                f"  [{status}] {result['endpoint']} {result['slo']}: "
+                f"{result['actual']} (target {result['target']})"
+            )
+        if self.aborted:
+            lines.append(f"  [ABORTED] {self.aborted}")
+        lines.append(f"  verdict: {'PASS' if passed else 'FAIL'}")
+        print("\n".join(lines))
+
+        if report_path:
+            with open(report_path, "w") as file:
+                json.dump({"passed": passed, "aborted": self.aborted, "results": results}, file, indent=2)
+        return passed
+
+
+@events.init.add_listener
+def _start_slo_monitor(environment, **kwargs):
+    options = environment.parsed_options
+    if options is None or isinstance(environment.runner, WorkerRunner):
+        return
+    slos = load_slos(options)
+    if not any(slos.values()):
+        return
+
+    monitor = SloMonitor(environment, slos, options.slo_breach_window)
+    environment.slo_monitor = monitor
+    gevent.spawn(monitor.run, options.slo_interval, options.slo_warmup)
+
+    @environment.events.quitting.add_listener
+    def _slo_verdict(environment, **kwargs):
+        if not monitor.finalize(options.slo_report):
+            environment.process_exit_code = 1
@@ -0,0 +1,109 @@
+import os
+import asyncio
+import logging
+import weakref
+from typing import Any, Dict, Optional
+
+import pytest
+from playwright.async_api import BrowserContext, Page
+
+# Network values follow the Chrome DevTools presets (bytes/s, ms of added latency);
+# "cpu" is the CPU slowdown factor applied with Emulation.setCPUThrottlingRate.
+# DevTools renamed its "Fast 3G" preset to "Slow 4G", so both names share its values.
+THROTTLING_PROFILES: Dict[str, Dict[str, Any]] = {
+    "slow-3g": {"latency": 2000, "download": 50_000, "upload": 50_000, "cpu": 6},
+    "fast-3g": {"latency": 562.5, "download": 180_000, "upload": 84_375, "cpu": 4},
+    "slow-4g": {"latency": 562.5, "download": 180_000, "upload": 84_375, "cpu": 4},
+    "fast-4g": {"latency": 165, "download": 1_012_500, "upload": 168_750, "cpu": 2},
+    "4x-cpu": {"cpu": 4},
+    "6x-cpu": {"cpu": 6},
+}
+
+_context_profiles: "weakref.WeakKeyDictionary[BrowserContext, str]" = weakref.WeakKeyDictionary()
+_pending: "weakref.WeakKeyDictionary[Page, asyncio.Future]" = weakref.WeakKeyDictionary()
+
+
+def get_profile(name: str) -> Dict[str, Any]:
+    if name not in THROTTLING_PROFILES:
+        raise ValueError(f"Unknown throttling profile: {name}. Available: {sorted(THROTTLING_PROFILES)}")
+    return THROTTLING_PROFILES[name]
+
+
+def supported(context: BrowserContext) -> bool:
+    """Throttling goes through CDP, which only Chromium contexts have."""
+    browser = context.browser
+    return browser is not None and browser.browser_type.name == "chromium"
+
+
+def context_profile(context: BrowserContext) -> Optional[str]:
+    """Name of the throttling profile active on ``context``, if any."""
+    return _context_profiles.get(context)
+
+
+def profile_for(page: Page) -> Optional[str]:
+    """Name of the throttling profile active on the page's context, if any."""
+    return context_profile(page.context)
+
+
+async def throttle_page(page: Page, name: str) -> bool:
+    """Apply a throttling profile to one page through a CDP session (Chromium only).
+
+    Returns whether the profile is in effect; on failure the context no longer
+    reports it, so its measurements are not labelled as throttled.
+    """
+    profile = get_profile(name)
+    try:
+        session = await page.context.new_cdp_session(page)
+        if "latency" in profile:
+            await session.send("Network.enable")
+            await session.send("Network.emulateNetworkConditions", {
+                "offline": False,
+                "latency": profile["latency"],
+                "downloadThroughput": profile["download"],
+                "uploadThroughput": profile["upload"],
+            })
+        if profile.get("cpu", 1) > 1:
+            await session.send("Emulation.setCPUThrottlingRate", {"rate": profile["cpu"]})
+    except Exception as e:
+        logging.warning(f"Could not apply throttling '{name}', running unthrottled: {e}")
+        _context_profiles.pop(page.context, None)
+        return False
+    return True
+
+
+def throttle_context(context: BrowserContext, name: str) -> bool:
+    """Throttle every page opened in ``context`` from now on, popups included.
+
+    The CDP calls run in the background as soon as a page appears; ``ready`` waits
+    for them, so await it before the first navigation. Outside Chromium, the context
+    stays unthrottled and this returns False.
+    """
+    get_profile(name)
+    if not supported(context):
+        logging.warning(f"Throttling '{name}' needs Chromium, running unthrottled")
+        return False
+    _context_profiles[context] = name
+
+    def on_page(page: Page) -> None:
+        _pending[page] = asyncio.ensure_future(throttle_page(page, name))
+
+    context.on("page", on_page)
+    return True
+
+
+async def ready(page: Page) -> None:
+    """Wait until the page's throttling is in effect (no-op for unthrottled pages)."""
+    pending = _pending.pop(page, None)
+    if pending:
+        await pending
+
+
+def skip_unthrottled_tests(items) -> None:
+    """Tests marked ``throttle`` would pass unthrottled outside Chromium, so skip them."""
+    for item in items:
+        if not item.get_closest_marker("throttle"):
+            continue
+        callspec = getattr(item, "callspec", None)
+        browser_type = (callspec.params.get("engine") if callspec else None) or os.getenv("BROWSER", "chromium")
+        if browser_type != "chromium":
+            item.add_marker(pytest.mark.skip(reason=f"Throttling needs Chromium, the test runs in {browser_type}"))
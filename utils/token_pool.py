@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import argparse
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+from dotenv import load_dotenv
+from filelock import FileLock
+from playwright.async_api import async_playwright
+
+project_root = str(Path(__file__).parent.parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from utils.sess_handler import AUTH_COOKIE_NAMES, SESSION_DIR, SessionHandler  # noqa: E402
+
+POOL_DIR = os.path.join(SESSION_DIR, "pool")
+REFRESH_MARGIN = 5 * 60  # seconds before expiry at which a token is refreshed
+RELOAD_INTERVAL = 10  # seconds between storage-state freshness checks in consumers
+# Lifetime assumed for logins whose auth cookies are session-only (no expiry), counted
+# from the login that wrote the storage state.
+SESSION_COOKIE_TTL = float(os.getenv("LOAD_SESSION_TTL", 30 * 60))
+LOGIN_CONCURRENCY = 4
+
+
+def load_accounts(accounts_file: Optional[str] = None) -> List[Tuple[str, str]]:
+    """Test accounts for load runs.
+
+    Read from a YAML list of ``{email, password}`` entries, or from
+    ``LOAD_TEST_ACCOUNTS=email:password,email:password`` in the environment.
+    """
+    accounts_file = accounts_file or os.getenv("LOAD_TEST_ACCOUNTS_FILE")
+    if accounts_file:
+        with open(accounts_file, "r") as file:
+            entries = yaml.safe_load(file) or []
+        return [(entry["email"], entry["password"]) for entry in entries]
+
+    accounts = []
+    for entry in filter(None, os.getenv("LOAD_TEST_ACCOUNTS", "").split(",")):
+        email, _, password = entry.strip().partition(":")
+        if email and password:
+            accounts.append((email, password))
+    return accounts
+
+
+def _state_file(email: str) -> str:
+    return os.path.join(POOL_DIR, f"{hashlib.sha1(email.encode('utf-8')).hexdigest()[:12]}.json")
+
+
+@dataclass
+class Token:
+    """Cookies of one logged-in account, ready to attach to requests."""
+
+    email: str
+    cookies: List[Dict] = field(default_factory=list)
+    expires: float = 0.0
+
+    @property
+    def cookie_header(self) -> str:
+        return "; ".join(f"{c['name']}={c['value']}" for c in self.cookies)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Cookie": self.cookie_header}
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires - time.time() <= seconds
+
+
+def read_token(email: str) -> Optional[Token]:
+    """Token from the account's storage state, or None if it was never logged in.
+
+    Storage states are replaced atomically (see ``TokenPool.login_all``), so a reader
+    sees either the previous or the new login, never a partial file.
+    """
+    path = _state_file(email)
+    if not os.path.exists(path):
+        return None
+    try:
+        logged_in_at = os.path.getmtime(path)
+        with open(path, "r") as file:
+            cookies = json.load(file).get("cookies", [])
+    except (json.JSONDecodeError, IOError) as e:
+        logging.warning(f"Unreadable storage state for {email}: {e}")
+        return None
+
+    auth_cookies = [c for c in cookies if c.get("name", "").lower() in AUTH_COOKIE_NAMES]
+    auth_expiries = [c["expires"] for c in auth_cookies if c.get("expires", -1) > 0]
+    if auth_expiries:
+        expires = min(auth_expiries)
+    else:
+        # Session-only cookies (expires -1) carry no expiry of their own.
+        expires = logged_in_at + SESSION_COOKIE_TTL
+    return Token(email=email, cookies=cookies, expires=expires)
+
+
+class TokenPool:
+    """Round-robin pool of pre-logged-in accounts.
+
+    Logins happen ahead of time (``login_all``) or in a separate refresher process
+    (``python -m utils.token_pool --watch``), never inside the measured traffic.
+    Consumers such as Locust users and the open-loop generator only call
+    ``acquire()``, which picks up refreshed storage states from disk.
+    """
+
+    def __init__(self, accounts: Optional[List[Tuple[str, str]]] = None):
+        self.accounts = accounts if accounts is not None else load_accounts()
+        self._tokens: List[Token] = []
+        self._next = 0
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    async def login_all(self, browser, only_expiring: bool = False) -> int:
+        """Log in every account (or those close to expiry) into the pool; returns the count."""
+        os.makedirs(POOL_DIR, exist_ok=True)
+        handler = SessionHandler(browser, is_headless=True)
+        semaphore = asyncio.Semaphore(LOGIN_CONCURRENCY)
+
+        async def login(email: str, password: str) -> bool:
+            if only_expiring:
+                token = read_token(email)
+                if token and not token.expires_within(REFRESH_MARGIN):
+                    return False
+            async with semaphore:
+                state_file = _state_file(email)
+                # storage_state(path=) is not atomic: write aside, then swap it in
+                temp_file = f"{state_file}.tmp"
+                with FileLock(f"{state_file}.lock"):
+                    try:
+                        await handler.login(email, password, temp_file, Path(state_file).stem)
+                        os.replace(temp_file, state_file)
+                    finally:
+                        if os.path.exists(temp_file):
+                            os.remove(temp_file)
+                return True
+
+        results = await asyncio.gather(
+            *(login(email, password) for email, password in self.accounts), return_exceptions=True
+        )
+        for (email, _), result in zip(self.accounts, results):
+            if isinstance(result, Exception):
+                logging.error(f"Token pool login failed for {email}: {result}")
+        return sum(result is True for result in results)
+
+    def reload(self) -> None:
+        """Re-read all storage states; an account whose state cannot be read keeps its
+        previous token."""
+        previous = {token.email: token for token in self._tokens}
+        tokens = [read_token(email) or previous.get(email) for email, _ in self.accounts]
+        self._tokens = [token for token in tokens if token]
+        self._loaded_at = time.monotonic()
+        if not self._tokens:
+            raise RuntimeError("Token pool is empty. Run `python -m utils.token_pool` first.")
+
+    def acquire(self) -> Token:
+        """Next token in round-robin order. Safe to call from threads and greenlets."""
+        with self._lock:
+            if not self._tokens or time.monotonic() - self._loaded_at > RELOAD_INTERVAL:
+                self.reload()
+            token = self._tokens[self._next % len(self._tokens)]
+            self._next += 1
+        if token.expires_within(0):
+            logging.warning(f"Token for {token.email} has expired; is the refresher running?")
+        return token
+
+
+async def refresh_pool(pool: TokenPool, watch: bool = False, interval: float = 60) -> None:
+    """Log in all accounts once; with ``watch``, keep refreshing them before expiry."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            logged_in = await pool.login_all(browser)
+            logging.info(f"Token pool ready: {logged_in}/{len(pool)} accounts logged in")
+            while watch:
+                await asyncio.sleep(interval)
+                refreshed = await pool.login_all(browser, only_expiring=True)
+                if refreshed:
+                    logging.info(f"Token pool refreshed {refreshed} accounts")
+        finally:
+            await browser.close()
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent.parent / ".env")
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Log in load-test accounts ahead of a load run")
+    parser.add_argument("--accounts", help="YAML file with a list of {email, password}")
+    parser.add_argument("--watch", action="store_true", help="Keep refreshing tokens before they expire")
+    parser.add_argument("--interval", type=float, default=60, help="Seconds between refresh checks")
+    args = parser.parse_args()
+
+    token_pool = TokenPool(load_accounts(args.accounts))
+    if not len(token_pool):
+        sys.exit("No accounts configured. Set LOAD_TEST_ACCOUNTS or pass --accounts.")
+    asyncio.run(refresh_pool(token_pool, args.watch, args.interval))
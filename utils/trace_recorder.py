@@ -0,0 +1,189 @@
+import os
+import re
+import json
+import math
+import time
+import shutil
+import asyncio
+import hashlib
+import logging
+import tempfile
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import allure
+from playwright.async_api import BrowserContext
+
+RESULTS_DIR = "reports/traces"
+DEFAULT_WINDOW = 30  # seconds of trace kept before a failure
+CHUNKS_PER_WINDOW = 3
+MAX_NAME_LENGTH = 150  # trace directory names stay well below filesystem limits
+
+
+class TraceRecorder:
+    """Playwright tracing as a ring buffer of chunks, kept only when the test fails.
+
+    Tracing runs for the whole context, but every ``window / CHUNKS_PER_WINDOW``
+    seconds the current chunk is written to a temp directory and the oldest chunk
+    beyond the window is deleted. Memory and disk are bounded by the window, and
+    passing tests discard their last chunk without ever serializing it.
+    """
+
+    def __init__(self, context: BrowserContext, window: float = DEFAULT_WINDOW):
+        self.context = context
+        self.chunk_seconds = max(1.0, window / CHUNKS_PER_WINDOW)
+        self.chunks: Deque[str] = deque()
+        self.temp_dir = tempfile.mkdtemp(prefix="trace-")
+        self.overhead = 0.0
+        self.bytes_written = 0
+        self.rotations = 0
+        self.started_at = time.perf_counter()
+        self._lock = asyncio.Lock()
+        self._rotator: Optional[asyncio.Task] = None
+
+    async def _timed(self, operation, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await operation(*args, **kwargs)
+        finally:
+            self.overhead += time.perf_counter() - started
+
+    async def start(self) -> "TraceRecorder":
+        await self._timed(self.context.tracing.start, screenshots=True, snapshots=True)
+        await self._timed(self.context.tracing.start_chunk)
+        self._rotator = asyncio.ensure_future(self._rotate_forever())
+        return self
+
+    async def _rotate_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.chunk_seconds)
+            try:
+                await self.rotate()
+            except Exception as e:
+                logging.warning(f"Trace chunk rotation failed, stopping rotation: {e}")
+                return
+
+    async def rotate(self) -> None:
+        async with self._lock:
+            path = os.path.join(self.temp_dir, f"chunk-{self.rotations:04d}.zip")
+            await self._timed(self.context.tracing.stop_chunk, path=path)
+            await self._timed(self.context.tracing.start_chunk)
+            self.rotations += 1
+            self.bytes_written += os.path.getsize(path)
+            self.chunks.append(path)
+            while len(self.chunks) >= CHUNKS_PER_WINDOW:
+                os.remove(self.chunks.popleft())
+
+    async def finish(self, failed: bool, name: str) -> List[str]:
+        """Stop tracing; on failure persist the kept chunks under RESULTS_DIR and
+        attach them to Allure. Returns the persisted trace paths."""
+        if self._rotator:
+            self._rotator.cancel()
+        saved: List[str] = []
+        try:
+            async with self._lock:
+                if failed:
+                    last = os.path.join(self.temp_dir, f"chunk-{self.rotations:04d}.zip")
+                    await self._timed(self.context.tracing.stop_chunk, path=last)
+                    self.chunks.append(last)
+                else:
+                    await self._timed(self.context.tracing.stop_chunk)
+                await self._timed(self.context.tracing.stop)
+
+            if failed:
+                target_dir = os.path.join(RESULTS_DIR, name)
+                shutil.rmtree(target_dir, ignore_errors=True)  # chunks of an earlier run
+                os.makedirs(target_dir, exist_ok=True)
+                for index, chunk in enumerate(self.chunks):
+                    target = os.path.join(target_dir, f"trace-{index}.zip")
+                    shutil.move(chunk, target)
+                    allure.attach.file(target, name=f"trace-{index}.zip", extension="zip")
+                    saved.append(target)
+        except Exception as e:
+            logging.warning(f"Could not save trace for {name}: {e}")
+        finally:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        return saved
+
+    def stats(self, test: str, failed: bool, duration: float) -> Dict[str, Any]:
+        return {
+            "test": test,
+            "failed": failed,
+            "duration_s": round(duration, 3),
+            "tracing_s": round(self.overhead, 3),
+            "rotations": self.rotations,
+            "bytes_written": self.bytes_written,
+        }
+
+
+def enabled(config) -> bool:
+    return bool(config.getoption("trace_on_failure"))
+
+
+async def start_for(context: BrowserContext, request) -> Optional[TraceRecorder]:
+    """Start a trace ring buffer for the test's context when --trace-on-failure is set."""
+    if not enabled(request.config):
+        return None
+    recorder = TraceRecorder(context, request.config.getoption("trace_window"))
+    try:
+        return await recorder.start()
+    except Exception as e:
+        logging.warning(f"Could not start tracing: {e}")
+        shutil.rmtree(recorder.temp_dir, ignore_errors=True)
+        return None
+
+
+def item_failed(item) -> bool:
+    """Whether setup or call of the current attempt failed (reports set in makereport)."""
+    reports = (getattr(item, f"rep_{when}", None) for when in ("setup", "call"))
+    return any(report is not None and report.failed for report in reports)
+
+
+def trace_name(item) -> str:
+    """Directory name for the test's traces: a slug of its node id, so tests with the
+    same name in other modules or classes, and each parametrization, get their own."""
+    attempt = getattr(item, "execution_count", 1)
+    name = re.sub(r"[^\w.-]+", "_", item.nodeid.replace("::", "__")).strip("_")
+    if len(name) > MAX_NAME_LENGTH:
+        name = f"{name[:MAX_NAME_LENGTH - 9]}-{hashlib.sha1(item.nodeid.encode('utf-8')).hexdigest()[:8]}"
+    return name if attempt <= 1 else f"{name}-attempt{attempt}"
+
+
+async def finish_for(recorder: Optional[TraceRecorder], request) -> None:
+    """Keep the trace if the test failed (every failed attempt under --reruns) and
+    record the tracing overhead for the run summary."""
+    if recorder is None:
+        return
+    item = request.node
+    failed = item_failed(item)
+    await recorder.finish(failed, trace_name(item))
+    request.config._trace_overhead.append(
+        recorder.stats(item.nodeid, failed, time.perf_counter() - recorder.started_at)
+    )
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not records:
+        return {}
+    overheads = sorted(record["tracing_s"] for record in records)
+    total_duration = sum(record["duration_s"] for record in records)
+    return {
+        "tests": len(records),
+        "failed_with_trace": sum(record["failed"] for record in records),
+        "tracing_s_total": round(sum(overheads), 3),
+        "tracing_s_p95": overheads[max(0, math.ceil(len(overheads) * 0.95) - 1)],
+        "tracing_s_max": overheads[-1],
+        "overhead_share": round(sum(overheads) / total_duration, 4) if total_duration else 0.0,
+        "bytes_written_total": sum(record["bytes_written"] for record in records),
+    }
+
+
+def write_run_summary(config) -> Optional[str]:
+    records = config._trace_overhead
+    if not records:
+        return None
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, "overhead.json")
+    with open(path, "w") as file:
+        json.dump({"summary": summarize(records), "tests": records}, file, indent=2)
+    return path
@@ -0,0 +1,525 @@
+import io
+import os
+import re
+import json
+import math
+import time
+import asyncio
+import logging
+import argparse
+import functools
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import allure
+import numpy as np
+from PIL import Image
+
+BASELINE_DIR = "visual_baselines"
+RESULTS_DIR = "reports/visual"
+TILE = 64  # px; screenshots are hashed per tile, so a local change moves a hash
+HASH_SIZE = 8  # low-frequency DCT coefficients per side: a 64-bit hash per tile
+DEFAULT_THRESHOLD = 0.1  # YIQ colour distance (0-1) under which two pixels count as equal, as in pixelmatch
+DEFAULT_MAX_DIFF_RATIO = 0.0  # share of changed pixels a screenshot may have
+REPLACED_DISTANCE = 16  # hash bits (of 64) from which a tile's content counts as replaced
+FAIL_FAST_SHARE = 0.25  # share of replaced tiles that fails a screenshot without a pixel diff
+MAX_YIQ_DELTA = 35215.0
+
+# Scroll offset (bounding boxes are relative to the viewport) and the pixels per CSS px.
+VIEWPORT_SCRIPT = "() => [window.scrollX, window.scrollY, window.devicePixelRatio]"
+
+Region = Tuple[int, int, int, int]  # x, y, width, height in screenshot pixels
+
+_stats: Counter = Counter()
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def mode() -> str:
+    return os.getenv("visual", "off").lower()
+
+
+def enabled() -> bool:
+    return mode() in ("on", "update")
+
+
+def updating() -> bool:
+    return mode() == "update"
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.@-]+", "-", value).strip("-")
+
+
+def baseline_path(engine: str, page_name: str, name: str, platform: str, device: str) -> str:
+    return os.path.join(BASELINE_DIR, engine, page_name, f"{_slug(name)}-{platform}-{_slug(device)}.png")
+
+
+def _hash_path(baseline: str) -> str:
+    return f"{os.path.splitext(baseline)[0]}.phash.npz"
+
+
+def decode(png: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGB"))
+
+
+def encode(rgb: np.ndarray, compress_level: int = 6) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(rgb).save(buffer, format="PNG", compress_level=compress_level)
+    return buffer.getvalue()
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    k, i = np.arange(size)[:, None], np.arange(size)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * size)) * np.sqrt(2 / size)
+    matrix[0] /= np.sqrt(2)
+    return matrix.astype(np.float32)
+
+
+DCT = _dct_matrix(TILE // 2)
+
+
+def tile_hashes(rgb: np.ndarray) -> np.ndarray:
+    """Perceptual hash (pHash) of every TILE x TILE tile, as a (rows, cols, 8) array of
+    packed 64-bit hashes.
+
+    Each tile is averaged down to 32 x 32 grey pixels and hashed on the signs of its
+    8 x 8 lowest DCT frequencies against their median; all tiles in one pass.
+    """
+    grey = rgb.astype(np.float32) @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    height, width = grey.shape
+    rows, cols = -(-height // TILE), -(-width // TILE)
+    grey = np.pad(grey, ((0, rows * TILE - height), (0, cols * TILE - width)), mode="edge")
+    half = TILE // 2
+    tiles = grey.reshape(rows, half, 2, cols, half, 2).mean(axis=(2, 5)).transpose(0, 2, 1, 3)
+    low = (DCT @ tiles @ DCT.T)[..., :HASH_SIZE, :HASH_SIZE].reshape(rows, cols, HASH_SIZE * HASH_SIZE)
+    return np.packbits(low > np.median(low[..., 1:], axis=-1, keepdims=True), axis=-1)
+
+
+def _baseline_hashes(baseline: str) -> Optional[Tuple[Tuple[int, int], np.ndarray]]:
+    """Size and tile hashes stored next to ``baseline``, unless older than the image."""
+    path = _hash_path(baseline)
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(baseline):
+            return None
+        with np.load(path) as stored:
+            return tuple(stored["size"]), stored["hashes"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_baseline(path: str, png: bytes) -> None:
+    """Write a baseline screenshot with its tile hashes."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(png)
+    rgb = decode(png)
+    np.savez(_hash_path(path), size=np.array(rgb.shape[:2]), hashes=tile_hashes(rgb))
+
+
+# RGB -> YIQ; linear, so the YIQ difference of two pixels is YIQ of their RGB difference.
+YIQ = np.array([
+    [0.29889531, 0.58662247, 0.11448223],
+    [0.59597799, -0.27417610, -0.32180189],
+    [0.21147017, -0.52261711, 0.31114694],
+], dtype=np.float32)
+
+
+def _delta(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Perceived colour difference of RGB pixels (0 to MAX_YIQ_DELTA)."""
+    d = (a.astype(np.float32) - b) @ YIQ.T
+    return 0.5053 * d[..., 0] ** 2 + 0.299 * d[..., 1] ** 2 + 0.1957 * d[..., 2] ** 2
+
+
+NEIGHBOURS = np.array([(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx])
+
+
+def _neighbours(image: np.ndarray, ys: np.ndarray, xs: np.ndarray):
+    """The 8 neighbours of each pixel (ys, xs): values (n, 8, ...), whether they lie
+    inside the image (n, 8), and whether the pixel is on the image border (n,)."""
+    height, width = image.shape[:2]
+    ny, nx = ys[:, None] + NEIGHBOURS[:, 0], xs[:, None] + NEIGHBOURS[:, 1]
+    inside = (ny >= 0) & (ny < height) & (nx >= 0) & (nx < width)
+    values = image[np.clip(ny, 0, height - 1), np.clip(nx, 0, width - 1)]
+    on_border = (ys == 0) | (xs == 0) | (ys == height - 1) | (xs == width - 1)
+    return values, inside, on_border
+
+
+def _has_many_siblings(image: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Whether each pixel has 3 or more identical neighbours (the border counts as one)."""
+    values, inside, on_border = _neighbours(image, ys, xs)
+    same = inside & np.all(values == image[ys, xs][:, None], axis=-1)
+    return same.sum(axis=1) + on_border > 2
+
+
+def _anti_aliased(image: np.ndarray, other: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Whether each pixel (ys, xs) of ``image`` looks like anti-aliasing, as in pixelmatch.
+
+    Its neighbours must include both darker and brighter pixels, and at most 2 of the
+    same brightness. The darkest or the brightest of them must sit in a flat area
+    (see ``_has_many_siblings``) in both images: the solid colours the edge blends.
+    """
+    values, inside, on_border = _neighbours(image, ys, xs)
+    brightness = values.astype(np.float32) @ YIQ[0] - (image[ys, xs].astype(np.float32) @ YIQ[0])[:, None]
+    brightness[~inside] = 0.0
+    flat = (inside & (brightness == 0)).sum(axis=1) + on_border > 2
+    darkest, brightest = brightness.argmin(axis=1), brightness.argmax(axis=1)
+    rows = np.arange(len(ys))
+    candidate = ~flat & (brightness[rows, darkest] < 0) & (brightness[rows, brightest] > 0)
+
+    result = np.zeros(len(ys), dtype=bool)
+    if not candidate.any():
+        return result
+    ys, xs, rows = ys[candidate], xs[candidate], rows[candidate]
+    solid = np.zeros(len(ys), dtype=bool)
+    for nearest in (darkest[rows], brightest[rows]):
+        ny, nx = ys + NEIGHBOURS[nearest, 0], xs + NEIGHBOURS[nearest, 1]
+        solid |= _has_many_siblings(image, ny, nx) & _has_many_siblings(other, ny, nx)
+    result[candidate] = solid
+    return result
+
+
+def pixel_diff(
+    baseline: np.ndarray, actual: np.ndarray, ignore: Sequence[Region] = (), threshold: float = DEFAULT_THRESHOLD
+) -> Dict[str, Any]:
+    """Changed pixels of ``actual`` against ``baseline``.
+
+    A pixel whose colour differs by more than ``threshold`` still counts as equal when
+    it is anti-aliasing in either image (see ``_anti_aliased``); content that moved
+    still counts. Pixels in ``ignore`` regions never count, and pixels outside
+    the other image (a size change) always do. Colours are only compared for pixels
+    whose bytes differ. Returns the counts and the masks.
+    """
+    height, width = max(baseline.shape[0], actual.shape[0]), max(baseline.shape[1], actual.shape[1])
+    common_h, common_w = min(baseline.shape[0], actual.shape[0]), min(baseline.shape[1], actual.shape[1])
+    ignored = np.zeros((height, width), dtype=bool)
+    for x, y, region_w, region_h in ignore:
+        ignored[max(y, 0):max(y + region_h, 0), max(x, 0):max(x + region_w, 0)] = True
+
+    limit = MAX_YIQ_DELTA * threshold ** 2
+    expected, shown = baseline[:common_h, :common_w], actual[:common_h, :common_w]
+    ys, xs = np.nonzero(np.any(expected != shown, axis=-1) & ~ignored[:common_h, :common_w])
+    over = _delta(expected[ys, xs], shown[ys, xs]) > limit
+    ys, xs = ys[over], xs[over]
+    shifted = _anti_aliased(expected, shown, ys, xs) | _anti_aliased(shown, expected, ys, xs)
+
+    changed = ~ignored
+    changed[:common_h, :common_w] = False
+    changed[ys[~shifted], xs[~shifted]] = True
+    anti_aliased = np.zeros_like(changed)
+    anti_aliased[ys[shifted], xs[shifted]] = True
+
+    diff_pixels = int(changed.sum())
+    return {
+        "diff_pixels": diff_pixels,
+        "aa_pixels": int(shifted.sum()),
+        "diff_ratio": diff_pixels / (height * width),
+        "changed": changed,
+        "anti_aliased": anti_aliased,
+        "ignored": ignored,
+    }
+
+
+def diff_image(actual: np.ndarray, diff: Dict[str, Any]) -> bytes:
+    """``actual`` faded to grey, changed pixels red, tolerated anti-aliasing yellow,
+    ignored regions blue and replaced tiles (see ``replaced_tiles``) tinted red."""
+    height, width = diff["changed"].shape
+    canvas = np.full((height, width, 3), 255, dtype=np.float32)
+    canvas[:actual.shape[0], :actual.shape[1]] = actual
+    grey = canvas @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    image = np.repeat((255 - (255 - grey) * 0.1)[..., None], 3, axis=-1)
+    image[diff["ignored"]] = image[diff["ignored"]] * [0.6, 0.6, 1.0]
+    if "replaced" in diff:
+        image[diff["replaced"]] = image[diff["replaced"]] * [1.0, 0.5, 0.5]
+    image[diff["anti_aliased"]] = (255, 255, 0)
+    image[diff["changed"]] = (255, 0, 0)
+    return encode(image.astype(np.uint8), compress_level=1)  # a report image, written once
+
+
+def replaced_tiles(expected: np.ndarray, actual: np.ndarray, shape: Tuple[int, int], ignore: Sequence[Region] = ()) -> np.ndarray:
+    """Tiles whose perceptual hashes differ by REPLACED_DISTANCE bits or more, leaving
+    out tiles that touch an ``ignore`` region; a (rows, cols) mask.
+
+    pHash ignores colour and contrast and misses small changes, so an unchanged hash
+    proves nothing. A hash far from the baseline's does mean other content.
+    """
+    distance = np.unpackbits(expected ^ actual, axis=-1).sum(axis=-1)
+    replaced = distance >= REPLACED_DISTANCE
+    rows, cols = replaced.shape
+    for x, y, width, height in ignore:
+        top, left = max(y, 0) // TILE, max(x, 0) // TILE
+        bottom, right = min(y + height - 1, shape[0] - 1) // TILE, min(x + width - 1, shape[1] - 1) // TILE
+        replaced[top:min(bottom + 1, rows), left:min(right + 1, cols)] = False
+    return replaced
+
+
+def compare_screenshot(
+    baseline: str,
+    actual_png: bytes,
+    ignore: Sequence[Region] = (),
+    threshold: float = DEFAULT_THRESHOLD,
+    max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO,
+    prefilter: bool = True,
+) -> Dict[str, Any]:
+    """Compare a PNG screenshot with the baseline file; runs in the process pool.
+
+    Only identical files pass without a pixel diff. With ``prefilter``, a screenshot of
+    the baseline's size fails at once, without decoding the baseline, when more than
+    FAIL_FAST_SHARE (and ``max_diff_ratio``) of its tiles show other content than the
+    baseline by their perceptual hashes. ``stage`` says which check decided.
+    """
+    started = time.perf_counter()
+    result = {"baseline": baseline, "status": "passed", "stage": "identical", "diff_pixels": 0,
+              "aa_pixels": 0, "diff_ratio": 0.0, "replaced_tiles": 0, "size": None, "baseline_size": None,
+              "diff_png": None}
+    with open(baseline, "rb") as file:
+        baseline_png = file.read()
+    if baseline_png != actual_png:
+        actual = decode(actual_png)
+        result["size"] = [actual.shape[1], actual.shape[0]]
+        stored = _baseline_hashes(baseline) if prefilter else None
+        if stored and stored[0] == actual.shape[:2]:
+            replaced = replaced_tiles(stored[1], tile_hashes(actual), actual.shape[:2], ignore)
+            result["replaced_tiles"] = int(replaced.sum())
+            if replaced.mean() > max(FAIL_FAST_SHARE, max_diff_ratio):
+                result.update(stage="phash", status="failed", baseline_size=result["size"])
+                result["diff_png"] = diff_image(actual, _tile_masks(replaced, actual.shape[:2]))
+                result["duration_s"] = round(time.perf_counter() - started, 3)
+                return result
+        expected = decode(baseline_png)
+        result["baseline_size"] = [expected.shape[1], expected.shape[0]]
+        diff = pixel_diff(expected, actual, ignore, threshold)
+        result.update(stage="pixels", diff_pixels=diff["diff_pixels"], aa_pixels=diff["aa_pixels"],
+                      diff_ratio=round(diff["diff_ratio"], 6))
+        if diff["diff_ratio"] > max_diff_ratio:
+            result["status"] = "failed"
+            result["diff_png"] = diff_image(actual, diff)
+    result["duration_s"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def _tile_masks(replaced: np.ndarray, shape: Tuple[int, int]) -> Dict[str, np.ndarray]:
+    """``diff_image`` masks showing the replaced tiles."""
+    tiles = np.repeat(np.repeat(replaced, TILE, axis=0), TILE, axis=1)[:shape[0], :shape[1]]
+    empty = np.zeros(shape, dtype=bool)
+    return {"changed": empty, "anti_aliased": empty, "ignored": empty, "replaced": tiles}
+
+
+def _executor() -> ProcessPoolExecutor:
+    """The worker's comparison processes, sharing the CPUs with the other xdist workers.
+
+    Spawned rather than forked: the test process runs the Playwright driver's threads.
+    """
+    global _pool
+    if _pool is None:
+        workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+        _pool = ProcessPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 1) // workers), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+async def compare(baseline: str, actual_png: bytes, ignore: Sequence[Region] = (), **options) -> Dict[str, Any]:
+    """``compare_screenshot`` in the process pool, so concurrent checks diff in parallel."""
+    job = functools.partial(compare_screenshot, baseline, actual_png, list(ignore), **options)
+    return await asyncio.get_running_loop().run_in_executor(_executor(), job)
+
+
+def shutdown() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def _css_to_pixels(x: float, y: float, width: float, height: float, ratio: float) -> Region:
+    left, top = math.floor(x * ratio), math.floor(y * ratio)
+    return left, top, math.ceil((x + width) * ratio) - left, math.ceil((y + height) * ratio) - top
+
+
+class VisualCheck:
+    """Compares a test's screenshots with their baselines under ``visual_baselines/``.
+
+    Baselines are kept per engine, page object, check name, platform and device (the
+    device name, or the viewport and pixel ratio). ``--update-baselines`` records the
+    screenshots as the new baselines instead of comparing.
+    """
+
+    def __init__(self, item):
+        self.item = item
+
+    def _device(self, page, ratio: float) -> str:
+        viewport = page.viewport_size or {"width": 0, "height": 0}
+        return f"{viewport['width']}x{viewport['height']}@{ratio:g}x"
+
+    async def _regions(self, page, ignore: Sequence, full_page: bool) -> Tuple[List[Region], float]:
+        scroll_x, scroll_y, ratio = await page.evaluate(VIEWPORT_SCRIPT)
+        regions = []
+        for target in ignore:
+            if isinstance(target, tuple):
+                regions.append(_css_to_pixels(*target, ratio))
+                continue
+            box = await target.bounding_box()
+            if box is None:
+                continue  # not rendered, nothing to ignore
+            offset_x, offset_y = (scroll_x, scroll_y) if full_page else (0, 0)
+            regions.append(_css_to_pixels(box["x"] + offset_x, box["y"] + offset_y, box["width"], box["height"], ratio))
+        return regions, ratio
+
+    def _attach(self, label: str, **images: Optional[bytes]) -> None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        for kind, png in images.items():
+            if png is None:
+                continue
+            path = os.path.join(RESULTS_DIR, f"{_slug(label)}-{kind}.png")
+            with open(path, "wb") as file:
+                file.write(png)
+            allure.attach(png, f"{label} {kind}", allure.attachment_type.PNG)
+
+    async def check(
+        self,
+        target,
+        name: str,
+        ignore: Sequence = (),
+        full_page: bool = True,
+        device: Optional[str] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_diff_ratio: float = DEFAULT_MAX_DIFF_RATIO,
+        prefilter: bool = True,
+    ) -> Dict[str, Any]:
+        """Screenshot ``target`` (a page object or a page) and compare it with its baseline.
+
+        ``ignore`` takes locators and ``(x, y, width, height)`` boxes in CSS px of the
+        screenshot. Fails with the changed pixel count, and attaches the expected,
+        actual and diff images, when more than ``max_diff_ratio`` of the pixels changed.
+        """
+        page = getattr(target, "page", target)
+        screenshot = await page.screenshot(full_page=full_page, animations="disabled", caret="hide")
+        regions, ratio = await self._regions(page, ignore, full_page)
+        browser = page.context.browser
+        path = baseline_path(
+            browser.browser_type.name if browser else os.getenv("BROWSER", "chromium"),
+            getattr(target, "page_name", "page"),
+            name,
+            os.getenv("platform", "desktop"),
+            device or self._device(page, ratio),
+        )
+        label = os.path.splitext(os.path.relpath(path, BASELINE_DIR))[0]
+
+        if updating():
+            save_baseline(path, screenshot)
+            _stats["updated"] += 1
+            self.item.user_properties.append((f"visual:{label}", "updated"))
+            return {"baseline": path, "status": "updated"}
+        if not os.path.exists(path):
+            _stats["missing"] += 1
+            self._attach(label, actual=screenshot)
+            raise AssertionError(f"No visual baseline {path}, record it with --update-baselines")
+
+        result = await compare(path, screenshot, regions, threshold=threshold,
+                               max_diff_ratio=max_diff_ratio, prefilter=prefilter)
+        _stats["comparisons"] += 1
+        _stats[f"stage:{result['stage']}"] += 1
+        _stats["compare_ms"] += round(result["duration_s"] * 1000)
+        self.item.user_properties.append((f"visual:{label}", result["status"]))
+        if result["status"] == "failed":
+            _stats["failed"] += 1
+            with open(path, "rb") as file:
+                self._attach(label, expected=file.read(), actual=screenshot, diff=result["diff_png"])
+            if result["stage"] == "phash":
+                raise AssertionError(
+                    f"Screenshot {label} differs from its baseline: {result['replaced_tiles']} {TILE} px tiles "
+                    f"show other content"
+                )
+            sizes = f", size {result['size']} vs baseline {result['baseline_size']}" if result["size"] != result["baseline_size"] else ""
+            raise AssertionError(
+                f"Screenshot {label} differs from its baseline: {result['diff_pixels']} pixels "
+                f"({result['diff_ratio']:.3%}) changed{sizes}"
+            )
+        return result
+
+
+def take_stats() -> Dict[str, int]:
+    stats = dict(_stats)
+    _stats.clear()
+    return stats
+
+
+def merge(into: Dict[str, int], stats: Dict[str, int]) -> None:
+    for key, value in stats.items():
+        into[key] = into.get(key, 0) + value
+
+
+def summarize(stats: Dict[str, int]) -> Dict[str, Any]:
+    comparisons = stats.get("comparisons", 0)
+    return {
+        "comparisons": comparisons,
+        "failed": stats.get("failed", 0),
+        "missing_baselines": stats.get("missing", 0),
+        "updated_baselines": stats.get("updated", 0),
+        "decided_by": {stage: stats.get(f"stage:{stage}", 0) for stage in ("identical", "phash", "pixels")},
+        "compare_ms_mean": round(stats.get("compare_ms", 0) / comparisons) if comparisons else 0,
+    }
+
+
+def write_run_summary(config) -> Optional[Dict[str, Any]]:
+    stats = config._visual_stats
+    if not stats:
+        return None
+    summary = summarize(stats)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(os.path.join(RESULTS_DIR, "summary.json"), "w") as file:
+        json.dump(summary, file, indent=2)
+    return summary
+
+
+def terminal_line(config) -> Optional[str]:
+    stats = config._visual_stats
+    if not stats:
+        return None
+    summary = summarize(stats)
+    if summary["updated_baselines"]:
+        return f"Visual regression: {summary['updated_baselines']} baseline(s) updated"
+    decided = summary["decided_by"]
+    return (
+        f"Visual regression: {summary['failed']}/{summary['comparisons']} screenshots differ "
+        f"({decided['identical']} identical, {decided['phash']} failed fast on perceptual hash, "
+        f"{decided['pixels']} pixel-diffed; {summary['compare_ms_mean']} ms each)"
+    )
+
+
+def compare_directory(actual_dir: str, **options) -> List[Dict[str, Any]]:
+    """Compare every PNG under ``actual_dir`` with the baseline at the same relative path."""
+    actual_files = sorted(Path(actual_dir).rglob("*.png"))
+    jobs = [(str(Path(BASELINE_DIR) / file.relative_to(actual_dir)), file.read_bytes()) for file in actual_files]
+    jobs = [(baseline, png) for baseline, png in jobs if os.path.exists(baseline)]
+    with ProcessPoolExecutor() as pool:
+        futures = [pool.submit(compare_screenshot, baseline, png, **options) for baseline, png in jobs]
+        return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Compare a directory of screenshots with the visual baselines")
+    parser.add_argument("actual_dir", help="Screenshots laid out like visual_baselines/")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--max-diff-ratio", type=float, default=DEFAULT_MAX_DIFF_RATIO)
+    parser.add_argument("--no-prefilter", action="store_true", help="Always run the pixel diff")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    results = compare_directory(args.actual_dir, threshold=args.threshold,
+                                max_diff_ratio=args.max_diff_ratio, prefilter=not args.no_prefilter)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    for result in results:
+        if result["diff_png"]:
+            label = os.path.splitext(os.path.relpath(result["baseline"], BASELINE_DIR))[0]
+            with open(os.path.join(RESULTS_DIR, f"{_slug(label)}-diff.png"), "wb") as file:
+                file.write(result.pop("diff_png"))
+        result.pop("diff_png", None)
+    print(json.dumps(results, indent=2))
+    failed = sum(result["status"] == "failed" for result in results)
+    logging.info(f"{len(results)} screenshots compared in {time.perf_counter() - started:.1f}s, {failed} differ")
@@ -0,0 +1,230 @@
+import os
+import json
+import math
+import logging
+import statistics
+import weakref
+from typing import Any, Dict, List, Optional
+
+import allure
+import yaml
+from playwright.async_api import Page
+
+from utils import throttling
+
+MODES = ("off", "collect", "enforce")
+RESULTS_DIR = "reports/web_vitals"
+METRICS = ("ttfb", "fcp", "lcp", "cls", "tbt", "resource_count", "transfer_bytes")
+LONG_TASK_MS = 50
+
+# Installed before navigation so buffered paint, LCP, layout-shift and long-task entries
+# are all observed. LCP and long tasks are Chromium-only; other engines report null.
+VITALS_SCRIPT = """
+(() => {
+  if (window.__noovoVitals) return;
+  const vitals = window.__noovoVitals = { lcp: null, cls: 0, longTasks: [] };
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(callback))
+        .observe({ type, buffered: true });
+    } catch (e) { /* entry type not supported by this engine */ }
+  };
+  let window_value = 0, window_start = 0, last_shift = 0;
+  observe('largest-contentful-paint', e => { vitals.lcp = e.renderTime || e.loadTime || e.startTime; });
+  observe('layout-shift', e => {
+    if (e.hadRecentInput) return;
+    if (window_value && e.startTime - last_shift < 1000 && e.startTime - window_start < 5000) {
+      window_value += e.value;
+    } else {
+      window_value = e.value;
+      window_start = e.startTime;
+    }
+    last_shift = e.startTime;
+    vitals.cls = Math.max(vitals.cls, window_value);
+  });
+  observe('longtask', e => vitals.longTasks.push([e.startTime, e.duration]));
+})();
+"""
+
+COLLECT_SCRIPT = """
+(longTaskMs) => {
+  const vitals = window.__noovoVitals || { lcp: null, cls: null, longTasks: null };
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paint = performance.getEntriesByName('first-contentful-paint')[0];
+  const resources = performance.getEntriesByType('resource');
+  const fcp = paint ? paint.startTime : null;
+  const tbt = vitals.longTasks === null ? null : vitals.longTasks
+    .filter(([start]) => fcp === null || start >= fcp)
+    .reduce((total, [, duration]) => total + Math.max(0, duration - longTaskMs), 0);
+  return {
+    ttfb: nav ? nav.responseStart : null,
+    fcp,
+    lcp: vitals.lcp,
+    cls: vitals.cls,
+    tbt,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav ? nav.loadEventEnd : null,
+    resource_count: resources.length,
+    transfer_bytes: resources.reduce((total, r) => total + (r.transferSize || 0), nav ? nav.transferSize : 0),
+  };
+}
+"""
+
+# Per page and platform; a budget applies to every metric it names. Override or extend
+# with a YAML file of the same shape passed via --web-vitals-budgets.
+DEFAULT_BUDGETS: Dict[str, Dict[str, Dict[str, float]]] = {
+    "default": {
+        "desktop": {"ttfb": 800, "fcp": 1800, "lcp": 2500, "cls": 0.1, "tbt": 200},
+        "mobile": {"ttfb": 1800, "fcp": 3000, "lcp": 4000, "cls": 0.1, "tbt": 600},
+    },
+    "home": {
+        "desktop": {"resource_count": 150, "transfer_bytes": 5_000_000},
+        "mobile": {"resource_count": 150, "transfer_bytes": 5_000_000},
+    },
+    "login": {
+        "desktop": {"resource_count": 80, "transfer_bytes": 2_000_000},
+        "mobile": {"resource_count": 80, "transfer_bytes": 2_000_000},
+    },
+}
+
+_instrumented: "weakref.WeakSet[Page]" = weakref.WeakSet()
+_records: List[Dict[str, Any]] = []
+
+
+def mode() -> str:
+    return os.getenv("web_vitals", "off").lower()
+
+
+def enabled() -> bool:
+    return mode() != "off"
+
+
+def platform() -> str:
+    return os.getenv("platform", "desktop")
+
+
+async def install(page: Page) -> None:
+    """Register the observers on ``page``; must run before the navigation to measure."""
+    if not enabled() or page in _instrumented:
+        return
+    await page.add_init_script(VITALS_SCRIPT)
+    _instrumented.add(page)
+
+
+async def collect(page: Page, page_name: str) -> Optional[Dict[str, Any]]:
+    """Read the vitals of the current document and queue them for the running test."""
+    if not enabled():
+        return None
+    try:
+        metrics = await page.evaluate(COLLECT_SCRIPT, LONG_TASK_MS)
+    except Exception as e:
+        logging.warning(f"Could not collect web vitals for {page_name}: {e}")
+        return None
+
+    record = {
+        "page": page_name,
+        "platform": platform(),
+        "throttle": throttling.profile_for(page),
+        "url": page.url,
+        "metrics": {k: round(v, 4) if isinstance(v, float) else v for k, v in metrics.items()},
+    }
+    _records.append(record)
+    return record
+
+
+def take_records() -> List[Dict[str, Any]]:
+    records = list(_records)
+    _records.clear()
+    return records
+
+
+def load_budgets(budgets_file: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+    budgets = {page: {p: dict(b) for p, b in platforms.items()} for page, platforms in DEFAULT_BUDGETS.items()}
+    if budgets_file:
+        with open(budgets_file, "r") as file:
+            overrides = yaml.safe_load(file) or {}
+        for page, platforms in overrides.items():
+            for platform_name, limits in (platforms or {}).items():
+                budgets.setdefault(page, {}).setdefault(platform_name, {}).update(limits or {})
+    return budgets
+
+
+def budget_for(budgets, page_name: str, platform_name: str) -> Dict[str, float]:
+    limits = dict(budgets.get("default", {}).get(platform_name, {}))
+    limits.update(budgets.get(page_name, {}).get(platform_name, {}))
+    return limits
+
+
+def check_budgets(record: Dict[str, Any], budgets) -> List[str]:
+    """One message per metric over budget. Metrics the engine does not report are skipped."""
+    violations = []
+    for metric, limit in budget_for(budgets, record["page"], record["platform"]).items():
+        actual = record["metrics"].get(metric)
+        if actual is not None and actual > limit:
+            violations.append(f"{record['page']} [{record['platform']}] {metric}: {actual} > {limit}")
+    return violations
+
+
+def report_test(item) -> List[str]:
+    """Attach the test's vitals to Allure, keep them for the run summary and
+    return the budget violations."""
+    records = take_records()
+    if not records:
+        return []
+
+    budgets = load_budgets(item.config.getoption("web_vitals_budgets"))
+    violations = []
+    for record in records:
+        record["test"] = item.nodeid
+        record["violations"] = check_budgets(record, budgets)
+        violations.extend(record["violations"])
+
+    allure.attach(json.dumps(records, indent=2), "Web Vitals", allure.attachment_type.JSON)
+    item.config._web_vitals_records.extend(records)
+    return violations
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """p50/p75/p95 per metric, grouped by page, platform and throttling profile."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        key = f"{record['page']}/{record['platform']}"
+        if record.get("throttle"):
+            key += f"/{record['throttle']}"
+        groups.setdefault(key, []).append(record)
+
+    summary = {}
+    for key, group in sorted(groups.items()):
+        metrics = {}
+        for metric in METRICS:
+            values = [r["metrics"][metric] for r in group if r["metrics"].get(metric) is not None]
+            if values:
+                metrics[metric] = {
+                    "p50": round(statistics.median(values), 4),
+                    "p75": round(_percentile(values, 75), 4),
+                    "p95": round(_percentile(values, 95), 4),
+                }
+        summary[key] = {
+            "samples": len(group),
+            "over_budget": sum(bool(r["violations"]) for r in group),
+            "metrics": metrics,
+        }
+    return summary
+
+
+def write_run_summary(config) -> Optional[str]:
+    """Write all records of the run and their per-page summary to RESULTS_DIR."""
+    records = config._web_vitals_records
+    if not records:
+        return None
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, "summary.json")
+    with open(path, "w") as file:
+        json.dump({"summary": summarize(records), "records": records}, file, indent=2)
+    return path